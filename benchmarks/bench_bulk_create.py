@@ -0,0 +1,73 @@
+"""Load benchmark: onboarding hotels one POST at a time vs one bulk call.
+
+Creates the same number of hotels through `POST /v1/hotels/` (one request per
+hotel) and through a single `POST /v1/hotels/bulk`, each against a fresh SQLite
+file database, and reports the wall time and rows per second.
+
+Usage:
+    python -m benchmarks.bench_bulk_create [--rows N] [--concurrency C]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+
+from travelothai import models
+from travelothai.core.config import Settings
+from travelothai.main import app
+from travelothai.models import province_model
+
+
+async def seed_province():
+    async with models.async_session_maker() as session:
+        session.add(province_model.ProvinceCategory(id=1, name="Primary"))
+        session.add(province_model.Province(id=1, name="Bangkok", category_id=1))
+        await session.commit()
+
+
+async def single_posts(client: AsyncClient, hotels: list[dict], concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def create(hotel: dict):
+        async with semaphore:
+            response = await client.post("/v1/hotels/", json=hotel)
+            response.raise_for_status()
+
+    await asyncio.gather(*(create(hotel) for hotel in hotels))
+
+
+async def bulk_post(client: AsyncClient, hotels: list[dict], concurrency: int):
+    response = await client.post("/v1/hotels/bulk", json=hotels)
+    response.raise_for_status()
+    assert response.json()["created"] == len(hotels)
+
+
+async def main(rows: int, concurrency: int):
+    hotels = [{"name": f"Hotel {i}", "province_id": 1, "price": 500 + i % 5000} for i in range(rows)]
+    for name, create in (("single POSTs", single_posts), ("bulk", bulk_post)):
+        with tempfile.TemporaryDirectory() as tmp:
+            # Single-writer profile so concurrent single POSTs queue instead of failing on locks
+            await models.init_db(Settings(
+                SQLDB_URL=f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}",
+                SQLITE_PRODUCTION_MODE=True,
+            ))
+            try:
+                await seed_province()
+                async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test", timeout=None) as client:
+                    start = time.perf_counter()
+                    await create(client, hotels, concurrency)
+                    elapsed = time.perf_counter() - start
+            finally:
+                await models.close_db()
+        print(f"{name:<14} {rows} hotels in {elapsed:7.2f} s  {rows / elapsed:9.1f} rows/s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    asyncio.run(main(args.rows, args.concurrency))
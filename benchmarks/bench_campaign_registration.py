@@ -0,0 +1,129 @@
+"""Load benchmark: ticket campaign registration throughput.
+
+Runs the same number of registrations through the previous read/increment/commit
+implementation and the current atomic reservation + bulk ticket insert, each
+registration in its own session, against a fresh SQLite file database.
+
+Usage:
+    python -m benchmarks.bench_campaign_registration [--registrations N] [--concurrency C] [--sqlite-production]
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from fastapi import HTTPException
+from sqlalchemy.future import select
+
+from travelothai import models
+from travelothai.core.config import Settings
+from travelothai.models import ticket_model
+from travelothai.schemas import ticket_schema
+from travelothai.services.ticket_services.DBTicketService import DBTicketService
+
+TICKET_TYPES = 3
+
+
+class LegacyTicketService(DBTicketService):
+    """Registration flow before the atomic reservation, kept for comparison."""
+
+    async def register_ticket_campaign(self, campaign_id: int) -> bool:
+        ticket_campaign = await self.get_ticket_campaign(campaign_id)
+        if not ticket_campaign:
+            raise HTTPException(status_code=404, detail="Campaign not found")
+        if ticket_campaign.registered >= ticket_campaign.limit:
+            raise HTTPException(status_code=400, detail="Campaign registration limit exceeded")
+
+        ticket_campaign.registered = ticket_campaign.registered + 1
+        self.session.add(ticket_campaign)
+        await self.session.commit()
+        await self.session.refresh(ticket_campaign)
+
+        result = await self.session.exec(
+            select(ticket_model.TicketCampaignTicketType).where(ticket_model.TicketCampaignTicketType.campaign_id == campaign_id)
+        )
+        for ticket_detail in result.scalars().all():
+            await self.create_ticket(ticket_schema.TicketCreate(
+                campaign_id=ticket_campaign.id,
+                ticket_type_id=ticket_detail.ticket_type_id,
+                user_id=1,
+                amount=ticket_detail.amount,
+                used=0,
+                expires_at=ticket_detail.expiration_date,
+            ))
+        return True
+
+
+async def seed_campaign(limit: int):
+    async with models.async_session_maker() as session:
+        session.add(ticket_model.TicketCampaign(id=1, name="Flash Campaign", limit=limit))
+        for type_id in range(1, TICKET_TYPES + 1):
+            session.add(ticket_model.TicketType(id=type_id, name=f"Ticket Type {type_id}"))
+            session.add(ticket_model.TicketCampaignTicketType(
+                campaign_id=1, ticket_type_id=type_id, amount=5,
+                expiration_date=datetime.now() + timedelta(days=30),
+            ))
+        await session.commit()
+
+
+async def run(service_class, registrations: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    failures = 0
+
+    async def register():
+        nonlocal failures
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                async with models.async_session_maker() as session:
+                    await service_class(session=session).register_ticket_campaign(1)
+            except Exception:
+                failures += 1
+            latencies.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(register() for _ in range(registrations)))
+    elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    return {
+        "throughput": registrations / elapsed,
+        "p50_ms": quantiles[49] * 1000,
+        "p95_ms": quantiles[94] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "failures": failures,
+    }
+
+
+async def main(registrations: int, concurrency: int, sqlite_production: bool):
+    for name, service_class in (("legacy", LegacyTicketService), ("atomic + bulk insert", DBTicketService)):
+        with tempfile.TemporaryDirectory() as tmp:
+            await models.init_db(Settings(
+                SQLDB_URL=f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}",
+                SQLITE_PRODUCTION_MODE=sqlite_production,
+                SQLDB_POOL_SIZE=concurrency,
+                SQLDB_MAX_OVERFLOW=0,
+            ))
+            try:
+                await seed_campaign(limit=registrations)
+                stats = await run(service_class, registrations, concurrency)
+            finally:
+                await models.close_db()
+        print(
+            f"{name:<22} {stats['throughput']:8.1f} reg/s  "
+            f"p50 {stats['p50_ms']:7.1f} ms  p95 {stats['p95_ms']:7.1f} ms  p99 {stats['p99_ms']:7.1f} ms  "
+            f"failures {stats['failures']}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--registrations", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--sqlite-production", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.registrations, args.concurrency, args.sqlite_production))
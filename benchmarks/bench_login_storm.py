@@ -0,0 +1,106 @@
+"""Load benchmark: latency of unrelated endpoints during a login storm.
+
+Fires concurrent logins at `/v1/token` while a probe client keeps requesting
+`GET /v1/provinces/`, and reports the probe latency percentiles. Runs once with
+bcrypt called inline on the event loop (the previous behaviour) and once with
+the bounded thread pool from `travelothai.core.security`.
+
+Usage:
+    python -m benchmarks.bench_login_storm [--logins N] [--concurrency C] [--rounds R] [--workers W]
+"""
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from httpx import ASGITransport, AsyncClient
+
+from travelothai import models
+from travelothai.core import security
+from travelothai.core.config import Settings
+from travelothai.main import app
+
+USERNAME = "storm"
+PASSWORD = "password"
+
+
+class InlinePasswordHasher(security.PasswordHasher):
+    """Calls bcrypt directly on the event loop, kept for comparison."""
+
+    async def _run(self, fn, *args):
+        return fn(*args)
+
+
+async def run(client: AsyncClient, logins: int, concurrency: int) -> dict:
+    semaphore = asyncio.Semaphore(concurrency)
+    probe_latencies = []
+    failures = 0
+    storm_done = asyncio.Event()
+
+    async def login():
+        nonlocal failures
+        async with semaphore:
+            response = await client.post("/v1/token", data={"username": USERNAME, "password": PASSWORD})
+            if response.status_code != 200:
+                failures += 1
+
+    async def probe():
+        while not storm_done.is_set():
+            start = time.perf_counter()
+            await client.get("/v1/provinces/")
+            probe_latencies.append(time.perf_counter() - start)
+            await asyncio.sleep(0.005)
+
+    probe_task = asyncio.create_task(probe())
+    start = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    elapsed = time.perf_counter() - start
+    storm_done.set()
+    await probe_task
+
+    quantiles = statistics.quantiles(probe_latencies, n=100, method="inclusive")
+    return {
+        "logins_per_s": logins / elapsed,
+        "probes": len(probe_latencies),
+        "p50_ms": quantiles[49] * 1000,
+        "p99_ms": quantiles[98] * 1000,
+        "max_ms": max(probe_latencies) * 1000,
+        "failures": failures,
+    }
+
+
+async def main(logins: int, concurrency: int, rounds: int, workers: int):
+    for name, hasher_class in (("inline", InlinePasswordHasher), ("thread pool", security.PasswordHasher)):
+        security.password_hasher = hasher_class(rounds=rounds, max_workers=workers)
+        with tempfile.TemporaryDirectory() as tmp:
+            # Single-writer profile: concurrent last_login_date updates queue instead of failing on locks
+            await models.init_db(Settings(
+                SQLDB_URL=f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}",
+                SQLITE_PRODUCTION_MODE=True,
+            ))
+            try:
+                async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                    await client.post("/v1/users/create", json={
+                        "email": "storm@email.local", "username": USERNAME, "password": PASSWORD,
+                        "first_name": "Storm", "last_name": "User",
+                    })
+                    stats = await run(client, logins, concurrency)
+            finally:
+                await models.close_db()
+        print(
+            f"{name:<12} {stats['logins_per_s']:7.1f} logins/s  probes {stats['probes']:5d}  "
+            f"p50 {stats['p50_ms']:7.1f} ms  p99 {stats['p99_ms']:7.1f} ms  max {stats['max_ms']:7.1f} ms  "
+            f"failures {stats['failures']}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--logins", type=int, default=64)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=12)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+    asyncio.run(main(args.logins, args.concurrency, args.rounds, args.workers))
@@ -0,0 +1,72 @@
+"""Microbenchmark: per-request cost of building a database session.
+
+Compares the old dependency, which built a new ``sessionmaker`` on every request,
+with the shared factory created once in ``models.init_db()``.
+
+Usage:
+    python -m benchmarks.bench_session_factory [--iterations N]
+"""
+import argparse
+import asyncio
+import time
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from travelothai import models
+from travelothai.core.config import Settings
+
+
+async def session_per_request_factory(with_query: bool):
+    # Behaviour before the shared factory: sessionmaker() on every dependency resolution
+    async_session = sessionmaker(models.engine, class_=AsyncSession, expire_on_commit=False)
+    async with async_session() as session:
+        if with_query:
+            await session.exec(text("SELECT 1"))
+
+
+async def shared_factory(with_query: bool):
+    async for session in models.get_session():
+        if with_query:
+            await session.exec(text("SELECT 1"))
+
+
+async def shared_read_factory(with_query: bool):
+    async for session in models.get_read_session():
+        if with_query:
+            await session.exec(text("SELECT 1"))
+
+
+async def measure(fn, iterations: int, with_query: bool) -> float:
+    # Warm up the pool and any lazy imports before timing
+    for _ in range(100):
+        await fn(with_query)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await fn(with_query)
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+async def main(iterations: int):
+    await models.init_db(Settings(SQLDB_URL="sqlite+aiosqlite:///:memory:"))
+    try:
+        for with_query in (False, True):
+            label = "session + SELECT 1" if with_query else "session only"
+            print(f"[{label}] {iterations} iterations")
+            for name, fn in (
+                ("sessionmaker per request", session_per_request_factory),
+                ("shared factory", shared_factory),
+                ("shared read-only factory", shared_read_factory),
+            ):
+                per_op = await measure(fn, iterations, with_query)
+                print(f"  {name:<26} {per_op:8.1f} us/request")
+    finally:
+        await models.close_db()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(main(args.iterations))
@@ -0,0 +1,292 @@
+"""Benchmark harness for the v1 API.
+
+Seeds a fresh SQLite file database with `travelothai.seed`, then drives `travelothai.main.app` through
+`httpx.ASGITransport` with one workload per router (authentication and users included) plus a mixed read/write
+workload, and reports throughput and p50/p95/p99 latency for each.
+
+Results can be saved as a JSON baseline and later runs compared against it; the
+run exits with status 1 when a workload's p95 or throughput regresses by more
+than the tolerance.
+
+Usage:
+    python -m benchmarks.harness [--scale small|medium|large] [--requests N] [--concurrency C]
+                                 [--workload NAME ...] [--save-baseline PATH] [--compare PATH]
+                                 [--tolerance 0.25] [--sqlite-production]
+"""
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Tuple
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert, update
+
+from travelothai import models
+from travelothai import seed as seed_data
+from travelothai.core import cache, security
+from travelothai.core.config import Settings
+from travelothai.main import app
+from travelothai.models import ticket_model, user_model
+
+SCALES = {
+    "small": {"hotels": 2_000, "tickets": 5_000, "bookings": 5_000, "reschedule_logs": 500},
+    "medium": {"hotels": 20_000, "tickets": 50_000, "bookings": 50_000, "reschedule_logs": 5_000},
+    "large": {"hotels": 200_000, "tickets": 500_000, "bookings": 500_000, "reschedule_logs": 50_000},
+}
+
+# Users created for the auth and users workloads, all with the same password
+BENCH_USERS = 100
+BENCH_PASSWORD = "password"
+
+# A request: (method, url, keyword arguments for httpx)
+Request = Tuple[str, str, dict]
+
+
+async def seed_database(counts: Dict[str, int], seed: int):
+    await seed_data.seed(models.engine, counts, seed=seed)
+    # Plenty of uses left so booking workloads never exhaust a ticket
+    async with models.engine.begin() as conn:
+        await conn.execute(update(ticket_model.Ticket.__table__).values(amount=1_000_000))
+
+    # One bcrypt hash at the configured work factor, shared by every user
+    password = await security.password_hasher.hash(BENCH_PASSWORD)
+    now = datetime.now()
+    async with models.engine.begin() as conn:
+        await conn.execute(insert(user_model.DBUser.__table__), [
+            {
+                "id": user_id, "email": f"bench{user_id}@email.local", "username": f"bench{user_id}",
+                "first_name": "Bench", "last_name": f"User {user_id}", "password": password,
+                "register_date": now, "updated_date": now, "token_generation": 0,
+            }
+            for user_id in range(1, BENCH_USERS + 1)
+        ])
+
+
+def workloads(counts: Dict[str, int]) -> Dict[str, Callable[[random.Random], Request]]:
+    """Request generators; each call draws the next request of the workload."""
+    counts = {"provinces": len(seed_data.PROVINCES), **counts}
+    travel_date = (datetime.now() + timedelta(days=30)).isoformat()
+
+    def provinces(rng):
+        return rng.choice((
+            ("GET", "/v1/provinces/", {}),
+            ("GET", "/v1/provinces/categories", {}),
+            ("GET", f"/v1/provinces/{rng.randint(1, counts['provinces'])}", {}),
+        ))
+
+    def hotels(rng):
+        return rng.choice((
+            ("GET", "/v1/hotels/", {"params": {"after": rng.randint(0, counts["hotels"] - 100), "limit": 50}}),
+            ("GET", "/v1/hotels/", {"params": {"province_id": rng.randint(1, counts["provinces"]), "limit": 50}}),
+            ("GET", f"/v1/hotels/{rng.randint(1, counts['hotels'])}", {}),
+        ))
+
+    def tickets(rng):
+        return rng.choice((
+            ("GET", "/v1/tickets/types", {}),
+            ("GET", "/v1/tickets/usage-rules", {}),
+            ("GET", f"/v1/tickets/{rng.randint(1, counts['tickets'])}", {}),
+        ))
+
+    def search(rng):
+        return ("GET", "/v1/search/hotels", {"params": {
+            "ticket_id": rng.randint(1, counts["tickets"]), "max_price": rng.randrange(1_000, 10_000, 500),
+            "after": rng.randint(0, counts["hotels"] - 100), "limit": 50,
+        }})
+
+    def bookings(rng):
+        return ("GET", f"/v1/bookings/{rng.randint(1, counts['bookings'])}", {})
+
+    def bookings_write(rng):
+        return ("POST", "/v1/bookings/", {"json": {
+            "hotel_id": rng.randint(1, counts["hotels"]), "user_id": 1,
+            "ticket_id": rng.randint(1, counts["tickets"]), "travel_date": travel_date,
+            "price": 1000, "discount_amount": 0, "final_price": 1000, "status": "booking",
+        }})
+
+    def quote(rng):
+        # One results page of hotel/ticket pairs
+        ticket_id = rng.randint(1, counts["tickets"])
+        return ("POST", "/v1/bookings/quote", {"json": [
+            {"hotel_id": rng.randint(1, counts["hotels"]), "ticket_id": ticket_id} for _ in range(50)
+        ]})
+
+    def auth(rng):
+        # Mostly refreshes; one login in four pays for a bcrypt verification
+        user_id = rng.randint(1, BENCH_USERS)
+        if rng.random() < 0.25:
+            return ("POST", "/v1/token", {"data": {"username": f"bench{user_id}", "password": BENCH_PASSWORD}})
+        # Every refresh token works once, so each request gets a new one
+        refresh_token = security.create_refresh_token(data={"sub": user_id, "gen": 0})
+        return ("POST", "/v1/token/refresh", {"json": {"refresh_token": refresh_token}})
+
+    def users(rng):
+        user_id = rng.randint(1, BENCH_USERS)
+        headers = {"Authorization": f"Bearer {security.create_access_token(data={'sub': user_id, 'gen': 0})}"}
+        return rng.choice((
+            ("GET", "/v1/users/me", {"headers": headers}),
+            ("GET", f"/v1/users/{rng.randint(1, BENCH_USERS)}", {"headers": headers}),
+        ))
+
+    def hotels_write(rng):
+        return ("POST", "/v1/hotels/", {"json": {
+            "name": f"Benchmark Hotel {rng.getrandbits(32)}",
+            "province_id": rng.randint(1, counts["provinces"]), "price": rng.randrange(500, 10_000, 50),
+        }})
+
+    def mixed(rng):
+        # 70 % catalogue and booking reads, 20 % bookings, 10 % new hotels
+        roll = rng.random()
+        if roll < 0.7:
+            return rng.choice((provinces, hotels, tickets, search, bookings))(rng)
+        if roll < 0.9:
+            return bookings_write(rng)
+        return hotels_write(rng)
+
+    return {
+        "provinces": provinces,
+        "hotels": hotels,
+        "tickets": tickets,
+        "search": search,
+        "bookings": bookings,
+        "quote": quote,
+        "auth": auth,
+        "users": users,
+        "bookings-write": bookings_write,
+        "mixed": mixed,
+    }
+
+
+async def run_workload(client: AsyncClient, next_request, requests: int, concurrency: int, rng: random.Random) -> dict:
+    plan = [next_request(rng) for _ in range(requests)]
+    queue = iter(plan)
+    latencies = []
+    errors = 0
+
+    async def worker():
+        nonlocal errors
+        for method, url, kwargs in queue:
+            start = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append(time.perf_counter() - start)
+            if response.status_code >= 400:
+                errors += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    if len(latencies) > 1:
+        quantiles = statistics.quantiles(latencies, n=100, method="inclusive")
+    else:
+        # statistics.quantiles needs at least two samples
+        quantiles = (latencies or [0.0]) * 99
+    return {
+        "requests": requests,
+        "errors": errors,
+        "throughput": round(requests / elapsed, 1),
+        "p50_ms": round(quantiles[49] * 1000, 2),
+        "p95_ms": round(quantiles[94] * 1000, 2),
+        "p99_ms": round(quantiles[98] * 1000, 2),
+    }
+
+
+def compare(results: Dict[str, dict], baseline: Dict[str, dict], tolerance: float) -> List[str]:
+    """Regressions of `results` against `baseline`: p95 slower or throughput lower by more than `tolerance`."""
+    regressions = []
+    for name, stats in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if stats["p95_ms"] > base["p95_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p95 {stats['p95_ms']} ms vs baseline {base['p95_ms']} ms")
+        if stats["throughput"] < base["throughput"] * (1 - tolerance):
+            regressions.append(f"{name}: {stats['throughput']} req/s vs baseline {base['throughput']} req/s")
+    return regressions
+
+
+async def main(args) -> int:
+    # Lock waits under concurrent writes would flood the output with slow-query lines
+    logging.getLogger("travelothai.sql").setLevel(logging.ERROR)
+    counts = SCALES[args.scale]
+    generators = workloads(counts)
+    selected = args.workload or list(generators)
+    results = {}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        await models.init_db(Settings(
+            SQLDB_URL=f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}",
+            SQLITE_PRODUCTION_MODE=args.sqlite_production,
+            SQLDB_POOL_SIZE=args.concurrency,
+            SQLDB_MAX_OVERFLOW=0,
+        ))
+        try:
+            start = time.perf_counter()
+            await seed_database(counts, args.seed)
+            print(f"seeded {args.scale} ({', '.join(f'{n} {k}' for k, n in counts.items())}) "
+                  f"in {time.perf_counter() - start:.1f} s")
+
+            cache.clear_caches()
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+                for name in selected:
+                    rng = random.Random(f"{args.seed}:{name}")
+                    await run_workload(client, generators[name], max(args.requests // 10, 1), args.concurrency, rng)
+                    results[name] = await run_workload(client, generators[name], args.requests, args.concurrency, rng)
+        finally:
+            await models.close_db()
+
+    print(f"{'workload':<16}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    for name, stats in results.items():
+        print(f"{name:<16}{stats['throughput']:>10}{stats['p50_ms']:>10}{stats['p95_ms']:>10}"
+              f"{stats['p99_ms']:>10}{stats['errors']:>8}")
+
+    status = 0
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        if baseline["meta"]["scale"] != args.scale or baseline["meta"]["concurrency"] != args.concurrency:
+            print(f"warning: baseline was recorded with scale={baseline['meta']['scale']} "
+                  f"concurrency={baseline['meta']['concurrency']}")
+        regressions = compare(results, baseline["results"], args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        status = 1 if regressions else 0
+
+    if args.save_baseline:
+        path = Path(args.save_baseline)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps({
+            "meta": {
+                "scale": args.scale,
+                "requests": args.requests,
+                "concurrency": args.concurrency,
+                "seed": args.seed,
+                "python": platform.python_version(),
+                "recorded_at": datetime.now().isoformat(timespec="seconds"),
+            },
+            "results": results,
+        }, indent=2) + "\n")
+        print(f"baseline saved to {path}")
+    return status
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", choices=SCALES, default="small")
+    parser.add_argument("--requests", type=int, default=2000, help="measured requests per workload")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--workload", action="append", choices=list(workloads(SCALES["small"])))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--save-baseline", metavar="PATH")
+    parser.add_argument("--compare", metavar="PATH")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="allowed relative regression")
+    parser.add_argument("--sqlite-production", action="store_true")
+    sys.exit(asyncio.run(main(parser.parse_args())))
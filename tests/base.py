@@ -3,8 +3,10 @@ import httpx
 from httpx import AsyncClient
 from travelothai.main import app
 from sqlmodel import SQLModel
+from sqlalchemy import event
 
-from travelothai.models import get_session
+from travelothai.models import get_session, get_read_session
+from travelothai.core import cache
 
 from sqlmodel.ext.asyncio.session import AsyncSession
 from sqlalchemy.ext.asyncio import create_async_engine
@@ -34,6 +36,19 @@ async def engine():
     await engine.dispose()
 
 
+@pytest.fixture
+def query_counter(engine):
+    """Collect every SQL statement sent through the test engine."""
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+
 @pytest.fixture
 async def session(engine):
     """Create test database session."""
@@ -50,6 +65,9 @@ async def client(session):
         yield session
 
     app.dependency_overrides[get_session] = get_session_override
+    app.dependency_overrides[get_read_session] = get_session_override
+    # Process-wide caches (reference data, verified tokens) must not leak between test databases
+    cache.clear_caches()
 
     transport = httpx.ASGITransport(app=app)
     async with AsyncClient(
@@ -0,0 +1,228 @@
+import asyncio
+import csv
+import datetime
+import io
+import json
+
+import httpx
+import pytest
+from sqlalchemy import func, select
+
+from travelothai import models
+from travelothai.core.config import Settings
+from travelothai.main import app
+from travelothai.models import booking_model, hotel_model, province_model, ticket_model
+from travelothai.services.pricing_services.DiscountMatrix import DiscountMatrix
+
+from base import session, engine, client, query_counter
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+async def booking_data(session):
+    session.add(province_model.ProvinceCategory(id=1, name="Test Category"))
+    session.add(province_model.Province(id=1, name="Test Province", category_id=1))
+    session.add(hotel_model.Hotel(id=1, name="Test Hotel", province_id=1, price=1000))
+    session.add(ticket_model.TicketType(id=1, name="Test Ticket Type"))
+    session.add(ticket_model.Ticket(
+        id=1, user_id=1, ticket_type_id=1, amount=10,
+        expires_at=datetime.datetime.now() + datetime.timedelta(days=30),
+    ))
+    await session.commit()
+
+    return {
+        "hotel_id": 1,
+        "user_id": 1,
+        "ticket_id": 1,
+        "travel_date": (datetime.datetime.now() + datetime.timedelta(days=7)).isoformat(),
+        "price": 1000,
+        "discount_amount": 0,
+        "final_price": 1000,
+        "status": "booking",
+    }
+
+
+@pytest.fixture
+async def exported_bookings(session, booking_data):
+    now = datetime.datetime.now()
+    for i in range(3):
+        session.add(booking_model.Booking(
+            hotel_id=1, user_id=1, ticket_id=1, price=1000, final_price=1000,
+            status=booking_model.BookingStatus.CANCELLED if i == 2 else booking_model.BookingStatus.BOOKING,
+            created_at=now - datetime.timedelta(days=i),
+        ))
+    await session.commit()
+    return now
+
+
+@pytest.fixture
+async def usage_rules(session, booking_data):
+    session.add(province_model.ProvinceCategory(id=2, name="Other Category"))
+    session.add(ticket_model.TicketUsageRule(ticket_type_id=1, category_id=2, allowance=True, tax_reduction=0.5))
+    session.add(ticket_model.TicketUsageRule(ticket_type_id=1, category_id=1, allowance=True, tax_reduction=0.2))
+    await session.commit()
+
+
+@pytest.fixture(params=[False, True], ids=["pooled", "sqlite-production"])
+async def concurrent_client(request, tmp_path):
+    """Client backed by a real file database so every request gets its own session and connection."""
+    await models.init_db(Settings(
+        SQLDB_URL=f"sqlite+aiosqlite:///{tmp_path / 'travelothai.db'}",
+        SQLITE_PRODUCTION_MODE=request.param,
+        SQLDB_POOL_SIZE=10,
+        SQLDB_MAX_OVERFLOW=0,
+    ))
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app), base_url="http://localhost:8000"
+    ) as client:
+        yield client
+    await models.close_db()
+
+
+# ------------------------ Tests ------------------------
+@pytest.mark.asyncio
+async def test_create_booking_applies_category_discount(client, session, booking_data, usage_rules):
+    response = await client.post("/v1/bookings/", json=booking_data)
+    assert response.status_code == 200
+    data = response.json()
+    assert data["price"] == 1000
+    assert data["discount_amount"] == 200
+    assert data["final_price"] == 800
+
+    ticket = await session.get(ticket_model.Ticket, 1)
+    await session.refresh(ticket)
+    assert ticket.used == 1
+
+@pytest.mark.asyncio
+async def test_create_booking_statement_count(client, session, booking_data, usage_rules, query_counter):
+    # The discount matrix is loaded once per process (at startup when served)
+    await DiscountMatrix.get(session)
+    query_counter.clear()
+    response = await client.post("/v1/bookings/", json=booking_data)
+    assert response.status_code == 200
+    # Pricing context, ticket reservation and the booking INSERT; no SELECT after the commit
+    assert [statement.split()[0] for statement in query_counter] == ["SELECT", "UPDATE", "INSERT"]
+
+@pytest.mark.asyncio
+async def test_create_booking_ignores_disallowed_rule(client, session, booking_data):
+    session.add(ticket_model.TicketUsageRule(ticket_type_id=1, category_id=1, allowance=False, tax_reduction=0.9))
+    session.add(ticket_model.TicketUsageRule(ticket_type_id=1, category_id=1, allowance=True, tax_reduction=0.1))
+    session.add(ticket_model.TicketUsageRule(ticket_type_id=1, category_id=1, allowance=True, tax_reduction=0.3))
+    await session.commit()
+
+    response = await client.post("/v1/bookings/", json=booking_data)
+    assert response.status_code == 200
+    assert response.json()["discount_amount"] == 300
+
+@pytest.mark.asyncio
+async def test_create_booking_sees_usage_rule_changes(client, booking_data, usage_rules):
+    assert (await client.post("/v1/bookings/", json=booking_data)).json()["discount_amount"] == 200
+
+    response = await client.put("/v1/tickets/usage-rules/2", json={"tax_reduction": 0.4})
+    assert response.status_code == 200
+    assert (await client.post("/v1/bookings/", json=booking_data)).json()["discount_amount"] == 400
+
+    response = await client.delete("/v1/tickets/usage-rules/2")
+    assert response.status_code == 204
+    assert (await client.post("/v1/bookings/", json=booking_data)).json()["discount_amount"] == 0
+
+@pytest.mark.asyncio
+async def test_quote_bookings(client, session, booking_data, usage_rules, query_counter):
+    session.add(province_model.Province(id=2, name="Other Province", category_id=2))
+    session.add(hotel_model.Hotel(id=2, name="Other Hotel", province_id=2, price=3000))
+    await session.commit()
+
+    query_counter.clear()
+    response = await client.post("/v1/bookings/quote", json=[
+        {"hotel_id": 1, "ticket_id": 1},
+        {"hotel_id": 2, "ticket_id": 1},
+        {"hotel_id": 2},
+        {"hotel_id": 99, "ticket_id": 1},
+        {"hotel_id": 1, "ticket_id": 99},
+    ])
+    assert response.status_code == 200
+    assert [(quote["final_price"], quote["error"]) for quote in response.json()] == [
+        (800, None), (1500, None), (3000, None), (None, "Hotel not found"), (None, "Ticket not found"),
+    ]
+    # Hotels, tickets and the discount matrix; nothing is written
+    assert [statement.split()[0] for statement in query_counter] == ["SELECT", "SELECT", "SELECT"]
+
+    ticket = await session.get(ticket_model.Ticket, 1)
+    await session.refresh(ticket)
+    assert ticket.used == 0
+
+@pytest.mark.asyncio
+async def test_quote_bookings_limit(client, monkeypatch):
+    monkeypatch.setenv("QUOTE_MAX_HOTELS", "1")
+    response = await client.post("/v1/bookings/quote", json=[{"hotel_id": 1}, {"hotel_id": 2}])
+    assert response.status_code == 413
+
+@pytest.mark.asyncio
+async def test_create_booking_without_rule_has_no_discount(client, booking_data):
+    response = await client.post("/v1/bookings/", json=booking_data)
+    assert response.status_code == 200
+    assert response.json()["final_price"] == 1000
+
+@pytest.mark.asyncio
+async def test_create_booking_unknown_hotel_or_ticket(client, booking_data):
+    response = await client.post("/v1/bookings/", json={**booking_data, "hotel_id": 99})
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Hotel with ID 99 does not exist."}
+
+    response = await client.post("/v1/bookings/", json={**booking_data, "ticket_id": 99})
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Ticket with ID 99 does not exist."}
+
+@pytest.mark.asyncio
+async def test_export_bookings_ndjson(client, exported_bookings):
+    response = await client.get("/v1/bookings/export")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in response.text.splitlines()]
+    assert [row["id"] for row in rows] == [1, 2, 3]
+
+@pytest.mark.asyncio
+async def test_export_bookings_csv_with_filters(client, exported_bookings):
+    response = await client.get("/v1/bookings/export", params={
+        "format": "csv",
+        "status": "booking",
+        "start_date": (exported_bookings - datetime.timedelta(hours=1)).isoformat(),
+    })
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [int(row["id"]) for row in rows] == [1]
+    assert rows[0]["status"] == "booking"
+
+@pytest.mark.asyncio
+async def test_concurrent_bookings_never_oversell_ticket(concurrent_client):
+    ticket_amount = 25
+    attempts = 200
+    async with models.async_session_maker() as session:
+        session.add(province_model.ProvinceCategory(id=1, name="Test Category"))
+        session.add(province_model.Province(id=1, name="Test Province", category_id=1))
+        session.add(hotel_model.Hotel(id=1, name="Test Hotel", province_id=1, price=1000))
+        session.add(ticket_model.TicketType(id=1, name="Test Ticket Type"))
+        session.add(ticket_model.Ticket(
+            id=1, user_id=1, ticket_type_id=1, amount=ticket_amount,
+            expires_at=datetime.datetime.now() + datetime.timedelta(days=30),
+        ))
+        await session.commit()
+
+    booking = {
+        "hotel_id": 1, "user_id": 1, "ticket_id": 1,
+        "travel_date": datetime.datetime.now().isoformat(),
+        "price": 1000, "discount_amount": 0, "final_price": 1000, "status": "booking",
+    }
+    responses = await asyncio.gather(*(
+        concurrent_client.post("/v1/bookings/", json=booking) for _ in range(attempts)
+    ))
+
+    status_codes = [response.status_code for response in responses]
+    assert status_codes.count(200) == ticket_amount
+    assert status_codes.count(400) == attempts - ticket_amount
+
+    async with models.async_session_maker() as session:
+        ticket = await session.get(ticket_model.Ticket, 1)
+        assert ticket.used == ticket_amount
+        booking_count = (await session.exec(select(func.count()).select_from(booking_model.Booking))).scalar()
+        assert booking_count == ticket_amount
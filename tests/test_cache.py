@@ -0,0 +1,76 @@
+import pytest
+
+from travelothai.core import cache
+from travelothai.core.cache import TTLCache
+
+from base import session, engine, client
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+def cached_client(client, monkeypatch):
+    monkeypatch.setenv("CACHE_ENABLED", "true")
+    cache.clear_caches()
+    yield client
+    cache.clear_caches()
+
+
+# ------------------------ Tests ------------------------
+def test_ttl_cache_evicts_least_recently_used():
+    lru = TTLCache(max_entries=2)
+    lru.set("a", 1)
+    lru.set("b", 2)
+    assert lru.get("a") == 1
+    lru.set("c", 3)
+
+    assert lru.get("b") is None
+    assert lru.get("a") == 1
+    assert lru.get("c") == 3
+    assert lru.stats() == {"hits": 3, "misses": 1, "size": 2, "hit_ratio": 0.75}
+
+def test_ttl_cache_expires_entries(monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+    ttl = TTLCache(ttl_seconds=10)
+    ttl.set("a", 1)
+    ttl.set("b", 2, ttl=60)
+
+    now += 30
+    assert ttl.get("a") is None
+    assert ttl.get("b") == 2
+    assert len(ttl) == 1
+
+def test_ttl_cache_skips_set_after_clear():
+    lru = TTLCache()
+    generation = lru.generation
+    # A write clears the cache while the read is still loading
+    lru.clear()
+    lru.set("a", "stale", generation=generation)
+    assert lru.get("a") is None
+
+    lru.set("a", "fresh", generation=lru.generation)
+    assert lru.get("a") == "fresh"
+
+@pytest.mark.asyncio
+async def test_province_categories_are_cached_until_written(cached_client):
+    await cached_client.post("/v1/provinces/categories", json={"name": "Primary"})
+
+    for _ in range(3):
+        response = await cached_client.get("/v1/provinces/categories")
+        assert [category["name"] for category in response.json()] == ["Primary"]
+    # The collection version (used for the ETag) and the list are both served from the cache
+    assert cache.cache_stats()["provinces"]["hits"] == 4
+
+    await cached_client.post("/v1/provinces/categories", json={"name": "Secondary"})
+    response = await cached_client.get("/v1/provinces/categories")
+    assert [category["name"] for category in response.json()] == ["Primary", "Secondary"]
+
+@pytest.mark.asyncio
+async def test_ticket_types_are_cached_until_written(cached_client):
+    created = (await cached_client.post("/v1/tickets/types", json={"name": "Hotel Ticket"})).json()
+
+    assert (await cached_client.get(f"/v1/tickets/types/{created['id']}")).json()["name"] == "Hotel Ticket"
+    assert (await cached_client.get(f"/v1/tickets/types/{created['id']}")).json()["name"] == "Hotel Ticket"
+    assert cache.cache_stats()["ticket_reference"]["hits"] == 1
+
+    await cached_client.put(f"/v1/tickets/types/{created['id']}", json={"name": "Stay Ticket"})
+    assert (await cached_client.get(f"/v1/tickets/types/{created['id']}")).json()["name"] == "Stay Ticket"
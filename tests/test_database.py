@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy import text
+
+from travelothai import models
+from travelothai.core.config import Settings
+from travelothai.models import province_model
+
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+async def sqlite_production_db(tmp_path):
+    settings = Settings(
+        SQLDB_URL=f"sqlite+aiosqlite:///{tmp_path / 'travelothai.db'}",
+        SQLITE_PRODUCTION_MODE=True,
+        SQLITE_READER_POOL_SIZE=2,
+    )
+    await models.init_db(settings)
+    yield settings
+    await models.close_db()
+
+
+# ------------------------ Tests ------------------------
+@pytest.mark.asyncio
+async def test_sqlite_production_mode_pragmas(sqlite_production_db):
+    assert models.read_engine is not models.engine
+    assert models.engine.pool.size() == 1
+
+    async with models.engine.connect() as conn:
+        assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+        assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1  # NORMAL
+        assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 0
+
+    async with models.read_engine.connect() as conn:
+        assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+
+
+@pytest.mark.asyncio
+async def test_read_session_rejects_writes(sqlite_production_db):
+    async for session in models.get_session():
+        session.add(province_model.ProvinceCategory(name="Primary"))
+        await session.commit()
+
+    async for session in models.get_read_session():
+        result = await session.exec(text("SELECT name FROM provincecategory"))
+        assert result.scalars().all() == ["Primary"]
+
+        session.add(province_model.ProvinceCategory(name="Secondary"))
+        with pytest.raises(RuntimeError):
+            await session.flush()
+
+
+@pytest.mark.asyncio
+async def test_memory_database_shares_engine():
+    await models.init_db(Settings(SQLDB_URL="sqlite+aiosqlite:///:memory:", SQLITE_PRODUCTION_MODE=True))
+    try:
+        assert models.read_engine is models.engine
+    finally:
+        await models.close_db()
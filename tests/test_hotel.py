@@ -4,7 +4,7 @@ from fastapi import status
 from travelothai.main import app
 from travelothai.models import get_session, province_model
 
-from base import session, engine, client
+from base import session, engine, client, query_counter
 
 # ------------------------ Fixtures ------------------------
 @pytest.fixture
@@ -67,3 +67,84 @@ async def test_delete_hotel(client, hotel_data):
     get_response = await client.get(f"/v1/hotels/{hotel_id}")
     assert get_response.status_code == 404
     assert get_response.json() == {"detail": "Hotel not found"}    
+
+@pytest.mark.asyncio
+async def test_list_hotels_keyset_pagination(client, hotel_data):
+    for i in range(5):
+        await client.post("/v1/hotels/", json={**hotel_data, "name": f"Hotel {i}"})
+
+    first_page = await client.get("/v1/hotels/", params={"limit": 2})
+    assert first_page.status_code == 200
+    assert [hotel["name"] for hotel in first_page.json()] == ["Hotel 0", "Hotel 1"]
+    cursor = first_page.headers["X-Next-Cursor"]
+
+    second_page = await client.get("/v1/hotels/", params={"limit": 2, "after": cursor})
+    assert [hotel["name"] for hotel in second_page.json()] == ["Hotel 2", "Hotel 3"]
+
+    last_page = await client.get("/v1/hotels/", params={"limit": 2, "after": second_page.headers["X-Next-Cursor"]})
+    assert [hotel["name"] for hotel in last_page.json()] == ["Hotel 4"]
+    assert "X-Next-Cursor" not in last_page.headers
+
+@pytest.mark.asyncio
+async def test_list_hotels_filters(client, hotel_data):
+    await client.post("/v1/hotels/", json={**hotel_data, "name": "Sea View", "price": 800})
+    await client.post("/v1/hotels/", json={**hotel_data, "name": "Sea Breeze", "price": 2500})
+    await client.post("/v1/hotels/", json={**hotel_data, "name": "Mountain Lodge", "price": 1200})
+
+    response = await client.get("/v1/hotels/", params={"name_prefix": "Sea", "max_price": 1000})
+    assert [hotel["name"] for hotel in response.json()] == ["Sea View"]
+
+    response = await client.get("/v1/hotels/", params={"province_id": 1, "min_price": 1000})
+    assert [hotel["name"] for hotel in response.json()] == ["Sea Breeze", "Mountain Lodge"]
+
+    response = await client.get("/v1/hotels/", params={"province_id": 2})
+    assert response.status_code == 404
+
+@pytest.mark.asyncio
+async def test_create_hotels_bulk(client, hotel_data):
+    hotels = [
+        {"name": "Bulk Hotel 1", "province_id": 1, "price": 900},
+        {"name": "Orphan Hotel", "province_id": 99, "price": 900},
+        {"name": "Bulk Hotel 2", "province_id": 1, "price": 1100},
+    ]
+    response = await client.post("/v1/hotels/bulk", json=hotels)
+    assert response.status_code == 200
+    data = response.json()
+    assert (data["created"], data["failed"]) == (2, 1)
+    assert data["results"][1] == {"index": 1, "id": None, "error": "Province ID 99 does not exist."}
+
+    created = await client.get(f"/v1/hotels/{data['results'][2]['id']}")
+    assert created.json()["name"] == "Bulk Hotel 2"
+    assert created.json()["created_at"] is not None
+
+@pytest.mark.asyncio
+async def test_create_provinces_bulk_rejects_duplicates(client, hotel_data):
+    provinces = [
+        {"name": "Test Province", "category_id": 1},
+        {"name": "New Province", "category_id": 1},
+        {"name": "New Province", "category_id": 1},
+        {"name": "Other Province", "category_id": 42},
+    ]
+    response = await client.post("/v1/provinces/bulk", json=provinces)
+    data = response.json()
+    assert [row["error"] for row in data["results"]] == [
+        "Province name must be unique", None, "Province name must be unique",
+        "Province category ID 42 does not exist.",
+    ]
+    assert data["created"] == 1
+
+@pytest.mark.asyncio
+async def test_hotel_writes_skip_refresh(client, hotel_data, query_counter):
+    query_counter.clear()
+    response = await client.post("/v1/hotels/", json=hotel_data)
+    # Province check + INSERT, the response is built from the values already known
+    assert len(query_counter) == 2
+    assert query_counter[-1].startswith("INSERT")
+    created = response.json()
+
+    query_counter.clear()
+    response = await client.put(f"/v1/hotels/{created['id']}", json={"name": "Renamed", "province_id": 1, "price": 1200})
+    # Hotel + province lookups and the UPDATE
+    assert len(query_counter) == 3
+    assert query_counter[-1].startswith("UPDATE")
+    assert response.json()["updated_at"] > created["updated_at"]
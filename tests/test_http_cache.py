@@ -0,0 +1,92 @@
+import pytest
+from fastapi import status
+
+from travelothai.models import province_model
+
+from base import session, engine, client, query_counter
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+async def categories(client):
+    await client.post("/v1/provinces/categories", json={"name": "Primary"})
+    await client.post("/v1/provinces/categories", json={"name": "Secondary"})
+
+
+# ------------------------ Tests ------------------------
+@pytest.mark.asyncio
+async def test_list_returns_validators(client, categories):
+    response = await client.get("/v1/provinces/categories")
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"].startswith('W/"')
+    assert response.headers["Cache-Control"] == "public, max-age=60"
+    # Deletes do not advance a newest `updated_at`, so only the ETag is offered
+    assert "Last-Modified" not in response.headers
+
+@pytest.mark.asyncio
+async def test_if_none_match_returns_304_until_collection_changes(client, categories):
+    etag = (await client.get("/v1/provinces/categories")).headers["ETag"]
+
+    response = await client.get("/v1/provinces/categories", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    assert response.content == b""
+    assert response.headers["ETag"] == etag
+
+    await client.put("/v1/provinces/categories/1", json={"name": "Renamed"})
+    response = await client.get("/v1/provinces/categories", headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
+    assert response.headers["ETag"] != etag
+
+    new_etag = response.headers["ETag"]
+    await client.delete("/v1/provinces/categories/2")
+    response = await client.get("/v1/provinces/categories", headers={"If-None-Match": new_etag})
+    assert response.status_code == status.HTTP_200_OK
+
+@pytest.mark.asyncio
+async def test_if_modified_since_is_ignored_after_delete(client, session):
+    session.add(province_model.ProvinceCategory(id=1, name="Test Category"))
+    session.add(province_model.Province(id=1, name="Test Province", category_id=1))
+    await session.commit()
+    for name in ("First Hotel", "Second Hotel"):
+        await client.post("/v1/hotels/", json={"name": name, "province_id": 1, "price": 1000})
+
+    await client.delete("/v1/hotels/2")
+    response = await client.get("/v1/hotels/", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"})
+    assert response.status_code == status.HTTP_200_OK
+    assert [hotel["id"] for hotel in response.json()] == [1]
+
+@pytest.mark.asyncio
+async def test_hotel_etag_depends_on_query(client, session):
+    session.add(province_model.ProvinceCategory(id=1, name="Test Category"))
+    session.add(province_model.Province(id=1, name="Test Province", category_id=1))
+    await session.commit()
+    await client.post("/v1/hotels/", json={"name": "Test Hotel", "province_id": 1, "price": 1000})
+
+    first = await client.get("/v1/hotels/", params={"limit": 1})
+    second = await client.get("/v1/hotels/", params={"limit": 2})
+    assert first.headers["ETag"] != second.headers["ETag"]
+    assert first.headers["Cache-Control"] == "no-cache"
+
+    response = await client.get("/v1/hotels/", params={"limit": 1}, headers={"If-None-Match": first.headers["ETag"]})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+@pytest.mark.asyncio
+async def test_hotel_validators_come_from_the_page(client, session, query_counter):
+    session.add(province_model.ProvinceCategory(id=1, name="Test Category"))
+    session.add(province_model.Province(id=1, name="Test Province", category_id=1))
+    await session.commit()
+    for name in ("First Hotel", "Second Hotel"):
+        await client.post("/v1/hotels/", json={"name": name, "province_id": 1, "price": 1000})
+
+    query_counter.clear()
+    etag = (await client.get("/v1/hotels/", params={"limit": 1})).headers["ETag"]
+    # Only the page itself is read; the collection is never counted
+    assert len(query_counter) == 1
+
+    # A change outside the page keeps it valid, a change on the page does not
+    await client.put("/v1/hotels/2", json={"province_id": 1, "price": 1200})
+    response = await client.get("/v1/hotels/", params={"limit": 1}, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+    await client.put("/v1/hotels/1", json={"province_id": 1, "price": 1200})
+    response = await client.get("/v1/hotels/", params={"limit": 1}, headers={"If-None-Match": etag})
+    assert response.status_code == status.HTTP_200_OK
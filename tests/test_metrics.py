@@ -0,0 +1,56 @@
+import pytest
+
+from travelothai import models
+from travelothai.core import metrics
+from travelothai.core.config import Settings
+
+from base import session, engine, client
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+async def pooled_engine(tmp_path):
+    await models.init_db(Settings(SQLDB_URL=f"sqlite+aiosqlite:///{tmp_path / 'metrics.db'}"))
+    yield models.engine
+    await models.close_db()
+
+
+def samples(text: str) -> dict:
+    return dict(line.rsplit(" ", 1) for line in text.splitlines() if not line.startswith("#"))
+
+
+# ------------------------ Tests ------------------------
+@pytest.mark.asyncio
+async def test_metrics_exposes_route_latency(client):
+    for _ in range(3):
+        await client.get("/v1/hotels/9999")
+    await client.get("/does-not-exist")
+
+    response = await client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+
+    values = samples(response.text)
+    series = 'method="GET",route="/v1/hotels/{hotel_id}",status="404"'
+    assert int(values[f"travelothai_http_request_duration_seconds_count{{{series}}}"]) >= 3
+    assert values[f'travelothai_http_request_duration_seconds_bucket{{{series},le="+Inf"}}'] == \
+        values[f"travelothai_http_request_duration_seconds_count{{{series}}}"]
+    assert 'route="<unmatched>"' in response.text
+    # The /metrics request itself is in flight while rendering
+    assert values["travelothai_http_requests_in_flight"] == "1"
+    assert values["travelothai_bcrypt_queue_depth"] == "0"
+
+@pytest.mark.asyncio
+async def test_pool_metrics(pooled_engine):
+    async with pooled_engine.connect():
+        text = "\n".join(metrics.pool_metrics({"writer": pooled_engine}))
+    values = samples(text)
+    assert values['travelothai_db_pool_checked_out{engine="writer"}'] == "1"
+    assert values['travelothai_db_pool_size{engine="writer"}'] == "5"
+
+def test_histogram_buckets_are_cumulative():
+    histogram = metrics.Histogram("latency", "Test latency.", buckets=(0.1, 1.0))
+    for value in (0.05, 0.5, 0.5, 3.0):
+        histogram.observe(value, route="/")
+    values = samples("\n".join(histogram.render()))
+    assert [values[f'latency_bucket{{route="/",le="{le}"}}'] for le in ("0.1", "1.0", "+Inf")] == ["1", "3", "4"]
+    assert values['latency_sum{route="/"}'] == "4.05"
@@ -0,0 +1,96 @@
+import asyncio
+
+import pytest
+from sqlalchemy import inspect, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from travelothai import migrations
+from travelothai.models import user_model  # noqa: F401 (registers the users table)
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+async def file_engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'travelothai.db'}")
+    yield engine
+    await engine.dispose()
+
+
+async def index_names(engine) -> set:
+    async with engine.connect() as conn:
+        return await conn.run_sync(lambda conn: {
+            index["name"] for table in inspect(conn).get_table_names() for index in inspect(conn).get_indexes(table)
+        })
+
+
+# ------------------------ Tests ------------------------
+@pytest.mark.asyncio
+async def test_upgrade_new_database(file_engine):
+    applied = await migrations.upgrade(file_engine)
+    assert [migration.version for migration in applied] == [migration.version for migration in migrations.load_migrations()]
+
+    rows = await migrations.applied_migrations(file_engine)
+    assert set(rows) == {migration.version for migration in applied}
+    assert all(row["duration_ms"] >= 0 and row["description"] for row in rows.values())
+
+    # Already up to date
+    assert await migrations.upgrade(file_engine) == []
+
+@pytest.mark.asyncio
+async def test_concurrent_upgrades(file_engine, tmp_path):
+    # A second worker starting at the same time, with its own engine on the same file
+    other_engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'travelothai.db'}")
+    try:
+        results = await asyncio.gather(migrations.upgrade(file_engine), migrations.upgrade(other_engine))
+    finally:
+        await other_engine.dispose()
+
+    applied = sorted(migration.version for result in results for migration in result)
+    assert applied == sorted(migration.version for migration in migrations.load_migrations())
+    assert set(await migrations.applied_migrations(file_engine)) == set(applied)
+
+@pytest.mark.asyncio
+async def test_upgrade_adds_model_indexes_to_existing_tables(file_engine):
+    # Tables as the first release created them: only the name columns were indexed
+    async with file_engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+        for table in SQLModel.metadata.sorted_tables:
+            for index in table.indexes:
+                if not index.name.endswith("_name"):
+                    await conn.execute(text(f"DROP INDEX {index.name}"))
+
+    await migrations.upgrade(file_engine)
+
+    declared = {index.name for table in SQLModel.metadata.sorted_tables for index in table.indexes}
+    assert declared <= await index_names(file_engine)
+
+@pytest.mark.asyncio
+async def test_upgrade_rejects_unsupported_dialect(file_engine, monkeypatch):
+    monkeypatch.setattr(file_engine.dialect, "name", "mysql")
+    with pytest.raises(RuntimeError, match="mysql"):
+        await migrations.upgrade(file_engine)
+
+@pytest.mark.asyncio
+async def test_upgrade_to_target(file_engine):
+    applied = await migrations.upgrade(file_engine, target="0001")
+    assert [migration.version for migration in applied] == ["0001"]
+    assert "0002" not in await migrations.applied_migrations(file_engine)
+
+@pytest.mark.asyncio
+async def test_add_column_is_idempotent(file_engine):
+    await migrations.upgrade(file_engine, target="0001")
+    for _ in range(2):
+        async with file_engine.begin() as conn:
+            await migrations.Operations(conn).add_column("hotel", "rating", "FLOAT")
+
+    async with file_engine.connect() as conn:
+        columns = await conn.run_sync(lambda conn: [column["name"] for column in inspect(conn).get_columns("hotel")])
+    assert columns.count("rating") == 1
+
+@pytest.mark.asyncio
+async def test_apply_of_recorded_version_counts_as_applied(file_engine):
+    await migrations.upgrade(file_engine, target="0002")
+    migration = migrations.load_migrations()[1]
+    async with file_engine.begin() as conn:
+        assert await migration.apply(conn) is False
+    assert len(await migrations.applied_migrations(file_engine)) == 2
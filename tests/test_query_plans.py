@@ -0,0 +1,56 @@
+import pytest
+from sqlalchemy.future import select
+
+from travelothai.models import booking_model, hotel_model, ticket_model
+
+from base import session, engine
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+async def query_plan(engine):
+    """SQLite's EXPLAIN QUERY PLAN detail lines for a statement."""
+    if engine.dialect.name != "sqlite":
+        pytest.skip("query plans are checked on SQLite")
+
+    async def explain(statement) -> str:
+        compiled = statement.compile(engine.sync_engine, compile_kwargs={"literal_binds": True})
+        async with engine.connect() as conn:
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}")
+            return "\n".join(row[-1] for row in result.all())
+
+    return explain
+
+
+# ------------------------ Tests ------------------------
+@pytest.mark.asyncio
+@pytest.mark.parametrize("statement, index", [
+    # DBBookingService.get_reschedule_log
+    (
+        select(booking_model.BookingRescheduleLog).where(booking_model.BookingRescheduleLog.booking_id == 1),
+        "ix_bookingreschedulelog_booking_id",
+    ),
+    # DBTicketService.register_ticket_campaign
+    (
+        select(ticket_model.TicketCampaignTicketType.ticket_type_id, ticket_model.TicketCampaignTicketType.amount)
+        .where(ticket_model.TicketCampaignTicketType.campaign_id == 1),
+        "ix_ticketcampaigntickettype_campaign_id",
+    ),
+    # Rule lookup for one (ticket type, province category) pair
+    (
+        select(ticket_model.TicketUsageRule.tax_reduction).where(
+            ticket_model.TicketUsageRule.ticket_type_id == 1, ticket_model.TicketUsageRule.category_id == 2
+        ),
+        "ix_ticketusagerule_ticket_type_id_category_id",
+    ),
+    (select(hotel_model.Hotel.id).where(hotel_model.Hotel.province_id == 1).order_by(hotel_model.Hotel.id), "ix_hotel_province_id_id"),
+    (select(booking_model.Booking).where(booking_model.Booking.hotel_id == 1), "ix_booking_hotel_id"),
+    (select(booking_model.Booking).where(booking_model.Booking.ticket_id == 1), "ix_booking_ticket_id"),
+    (select(booking_model.Booking).where(booking_model.Booking.user_id == 1), "ix_booking_user_id"),
+    (select(ticket_model.Ticket).where(ticket_model.Ticket.user_id == 1), "ix_ticket_user_id"),
+    (select(ticket_model.Ticket).where(ticket_model.Ticket.campaign_id == 1), "ix_ticket_campaign_id"),
+], ids=lambda value: value if isinstance(value, str) else None)
+async def test_hot_queries_use_index(query_plan, statement, index):
+    plan = await query_plan(statement)
+    assert f"INDEX {index}" in plan, plan
+    # No full table scan and no sort outside the index
+    assert not any(line.startswith("SCAN") or "TEMP B-TREE" in line for line in plan.splitlines()), plan
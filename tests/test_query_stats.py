@@ -0,0 +1,44 @@
+import json
+import logging
+
+import pytest
+
+from travelothai.core import query_stats
+
+from base import session, engine, client
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+async def instrumented_client(client, engine):
+    query_stats.instrument_engine(engine, slow_query_ms=0)
+    yield client
+
+
+# ------------------------ Tests ------------------------
+@pytest.mark.asyncio
+async def test_server_timing_reports_queries(instrumented_client):
+    await instrumented_client.post("/v1/provinces/categories", json={"name": "Primary"})
+
+    response = await instrumented_client.get("/v1/provinces/categories")
+    timing = response.headers["server-timing"]
+    # Collection version + list
+    assert timing.startswith('db;desc="2 queries";dur=')
+    assert "db-slowest;dur=" in timing
+
+@pytest.mark.asyncio
+async def test_request_and_slow_query_log_lines(instrumented_client, caplog):
+    caplog.set_level(logging.INFO, logger="travelothai")
+    await instrumented_client.get("/v1/hotels/9999")
+
+    request_line = json.loads(next(r.message for r in caplog.records if r.name == "travelothai.requests"))
+    assert request_line["path"] == "/v1/hotels/9999"
+    assert request_line["status"] == 404
+    assert request_line["queries"] == 1
+    assert request_line["slowest_statement"].startswith("SELECT")
+
+    # Threshold 0 ms: every statement is reported as slow
+    slow_lines = [json.loads(r.message) for r in caplog.records if r.name == "travelothai.sql"]
+    assert [line["event"] for line in slow_lines] == ["slow_query"]
+
+def test_no_stats_outside_requests():
+    assert query_stats.current() is None
@@ -0,0 +1,64 @@
+import datetime
+
+import pytest
+
+from travelothai.models import hotel_model, province_model, ticket_model
+
+from base import session, engine, client, query_counter
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+async def search_data(session):
+    session.add(province_model.ProvinceCategory(id=1, name="Primary"))
+    session.add(province_model.ProvinceCategory(id=2, name="Secondary"))
+    session.add(province_model.Province(id=1, name="Bangkok", category_id=1))
+    session.add(province_model.Province(id=2, name="Nan", category_id=2))
+    session.add(hotel_model.Hotel(id=1, name="City Hotel", province_id=1, price=2000))
+    session.add(hotel_model.Hotel(id=2, name="River Hotel", province_id=2, price=1000))
+    session.add(hotel_model.Hotel(id=3, name="Hill Hotel", province_id=2, price=3000))
+    session.add(ticket_model.TicketType(id=1, name="Hotel Ticket"))
+    session.add(ticket_model.TicketUsageRule(ticket_type_id=1, category_id=1, allowance=False, tax_reduction=0.5))
+    session.add(ticket_model.TicketUsageRule(ticket_type_id=1, category_id=2, allowance=True, tax_reduction=0.4))
+    session.add(ticket_model.Ticket(
+        id=1, user_id=1, ticket_type_id=1, amount=5,
+        expires_at=datetime.datetime.now() + datetime.timedelta(days=30),
+    ))
+    await session.commit()
+
+
+# ------------------------ Tests ------------------------
+@pytest.mark.asyncio
+async def test_search_hotels_prices_ticket_in_one_query(client, search_data, query_counter):
+    query_counter.clear()
+    response = await client.get("/v1/search/hotels", params={"ticket_id": 1})
+    assert response.status_code == 200
+    assert len(query_counter) == 1
+
+    prices = {hotel["id"]: (hotel["category_name"], hotel["final_price"]) for hotel in response.json()}
+    # The primary-category rule doesn't allow the ticket, so no discount there
+    assert prices == {1: ("Primary", 2000), 2: ("Secondary", 600), 3: ("Secondary", 1800)}
+
+@pytest.mark.asyncio
+async def test_search_hotels_filters_on_final_price(client, search_data):
+    response = await client.get("/v1/search/hotels", params={"ticket_id": 1, "category_id": 2, "max_price": 1800})
+    assert [hotel["id"] for hotel in response.json()] == [2, 3]
+
+    response = await client.get("/v1/search/hotels", params={"category_id": 2, "max_price": 1800})
+    assert [hotel["id"] for hotel in response.json()] == [2]
+
+@pytest.mark.asyncio
+async def test_search_hotels_pagination(client, search_data):
+    first = await client.get("/v1/search/hotels", params={"limit": 2})
+    assert [hotel["id"] for hotel in first.json()] == [1, 2]
+
+    second = await client.get("/v1/search/hotels", params={"limit": 2, "after": first.headers["X-Next-Cursor"]})
+    assert [hotel["id"] for hotel in second.json()] == [3]
+    assert "X-Next-Cursor" not in second.headers
+
+@pytest.mark.asyncio
+async def test_search_hotels_unknown_ticket(client, search_data):
+    response = await client.get("/v1/search/hotels", params={"ticket_id": 99})
+    assert response.status_code == 404
+
+    response = await client.get("/v1/search/hotels", params={"ticket_id": 99, "after": 10})
+    assert response.status_code == 404
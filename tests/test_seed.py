@@ -0,0 +1,67 @@
+import pytest
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlmodel import SQLModel
+
+from travelothai import seed
+from travelothai.models import booking_model, province_model
+
+COUNTS = {"hotels": 50, "tickets": 80, "bookings": 100, "reschedule_logs": 10, "campaigns": 3}
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+def make_engine():
+    engines = []
+
+    async def make():
+        engine = create_async_engine("sqlite+aiosqlite://")
+        async with engine.begin() as conn:
+            await conn.run_sync(SQLModel.metadata.create_all)
+        engines.append(engine)
+        return engine
+
+    yield make
+    for engine in engines:
+        engine.sync_engine.dispose()
+
+
+async def dump_bookings(engine):
+    async with engine.connect() as conn:
+        result = await conn.execute(select(booking_model.Booking.__table__).order_by(booking_model.Booking.id))
+        return result.all()
+
+
+# ------------------------ Tests ------------------------
+@pytest.mark.asyncio
+async def test_seed_counts_and_all_provinces(make_engine):
+    engine = await make_engine()
+    inserted = await seed.seed(engine, COUNTS, batch_size=7)
+
+    assert inserted["province"] == 77
+    assert inserted["hotel"] == 50
+    assert inserted["bookingreschedulelog"] == 10
+    async with engine.connect() as conn:
+        provinces = (await conn.execute(select(func.count()).select_from(province_model.Province.__table__))).scalar()
+    assert provinces == 77
+
+@pytest.mark.asyncio
+async def test_seed_is_deterministic(make_engine):
+    first, second, other = await make_engine(), await make_engine(), await make_engine()
+    await seed.seed(first, COUNTS, seed=7)
+    await seed.seed(second, COUNTS, seed=7, batch_size=13)
+    await seed.seed(other, COUNTS, seed=8)
+
+    assert await dump_bookings(first) == await dump_bookings(second)
+    assert await dump_bookings(first) != await dump_bookings(other)
+
+@pytest.mark.asyncio
+async def test_seed_restores_synchronous(make_engine):
+    engine = await make_engine()
+    async with engine.connect() as conn:
+        before = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+
+    await seed.seed(engine, COUNTS)
+
+    # The pooled connection used for the bulk load must not keep synchronous=OFF
+    async with engine.connect() as conn:
+        assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == before
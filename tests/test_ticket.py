@@ -0,0 +1,77 @@
+import datetime
+
+import pytest
+from sqlalchemy import select
+
+from travelothai.models import ticket_model
+
+from base import session, engine, client
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+async def campaign_data(session):
+    expiration_date = datetime.datetime.now() + datetime.timedelta(days=30)
+    session.add(ticket_model.TicketType(id=1, name="Hotel Ticket"))
+    session.add(ticket_model.TicketType(id=2, name="Food Ticket"))
+    session.add(ticket_model.TicketCampaign(id=1, name="Summer Campaign", limit=2))
+    session.add(ticket_model.TicketCampaignTicketType(campaign_id=1, ticket_type_id=1, amount=5, expiration_date=expiration_date))
+    session.add(ticket_model.TicketCampaignTicketType(campaign_id=1, ticket_type_id=2, amount=3, expiration_date=expiration_date))
+    await session.commit()
+    return {"campaign_id": 1, "expiration_date": expiration_date}
+
+
+# ------------------------ Tests ------------------------
+@pytest.mark.asyncio
+async def test_register_ticket_campaign_issues_tickets(client, session, campaign_data):
+    response = await client.post("/v1/tickets/campaigns/register/1")
+    assert response.status_code == 200
+    assert response.json() is True
+
+    result = await session.exec(select(ticket_model.Ticket).order_by(ticket_model.Ticket.ticket_type_id))
+    tickets = result.scalars().all()
+    assert [(ticket.ticket_type_id, ticket.amount, ticket.used) for ticket in tickets] == [(1, 5, 0), (2, 3, 0)]
+    assert all(ticket.campaign_id == 1 for ticket in tickets)
+
+    campaign = await session.get(ticket_model.TicketCampaign, 1)
+    await session.refresh(campaign)
+    assert campaign.registered == 1
+
+@pytest.mark.asyncio
+async def test_register_ticket_campaign_limit(client, campaign_data):
+    for _ in range(2):
+        assert (await client.post("/v1/tickets/campaigns/register/1")).status_code == 200
+
+    response = await client.post("/v1/tickets/campaigns/register/1")
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Campaign registration limit exceeded"}
+
+@pytest.mark.asyncio
+async def test_register_unknown_ticket_campaign(client, campaign_data):
+    response = await client.post("/v1/tickets/campaigns/register/99")
+    assert response.status_code == 404
+    assert response.json() == {"detail": "Campaign not found"}
+
+@pytest.mark.asyncio
+async def test_create_tickets_bulk(client, campaign_data):
+    expires_at = campaign_data["expiration_date"].isoformat()
+    tickets = [
+        {"user_id": 1, "ticket_type_id": 1, "campaign_id": 1, "amount": 2, "expires_at": expires_at},
+        {"user_id": 1, "ticket_type_id": 9, "amount": 2, "expires_at": expires_at},
+        {"user_id": 1, "ticket_type_id": 2, "campaign_id": 7, "amount": 2, "expires_at": expires_at},
+        {"ticket_type_id": 2, "amount": 1, "expires_at": expires_at},
+        {"user_id": 2, "ticket_type_id": 2, "amount": 1, "expires_at": expires_at},
+    ]
+    response = await client.post("/v1/tickets/bulk", json=tickets)
+    data = response.json()
+    assert [row["error"] for row in data["results"]] == [
+        None, "Ticket type not found", "Campaign not found", "User ID must be provided", None,
+    ]
+    assert (data["created"], data["failed"]) == (2, 3)
+
+@pytest.mark.asyncio
+async def test_create_tickets_bulk_limit(client, monkeypatch):
+    monkeypatch.setenv("BULK_MAX_ROWS", "1")
+    tickets = [{"ticket_type_id": 1, "amount": 1, "expires_at": "2030-01-01T00:00:00"}] * 2
+    response = await client.post("/v1/tickets/bulk", json=tickets)
+    assert response.status_code == 413
+
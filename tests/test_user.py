@@ -0,0 +1,218 @@
+import asyncio
+import datetime
+import logging
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from travelothai.core import cache, security
+from travelothai.main import app
+from travelothai.models import get_session, user_model
+from travelothai.routers.v1 import user_router
+
+from base import session, engine, client
+
+# ------------------------ Fixtures ------------------------
+@pytest.fixture
+async def auth_client(client, monkeypatch):
+    # Cheap hashes keep the login round trips fast
+    monkeypatch.setattr(security.password_hasher, "rounds", 4)
+    await client.post("/v1/users/create", json={
+        "email": "admin@email.local", "username": "admin", "password": "password",
+        "first_name": "Firstname", "last_name": "Lastname",
+    })
+    token = (await client.post("/v1/token", data={"username": "admin", "password": "password"})).json()
+    client.headers["Authorization"] = f"Bearer {token['access_token']}"
+    yield client
+
+
+# ------------------------ Tests ------------------------
+@pytest.mark.asyncio
+async def test_verified_token_is_cached(auth_client, session, monkeypatch):
+    assert (await auth_client.get("/v1/users/me")).json()["username"] == "admin"
+
+    async def fail_get(*args, **kwargs):
+        raise AssertionError("user should come from the token cache")
+    monkeypatch.setattr(session, "get", fail_get)
+
+    for _ in range(3):
+        assert (await auth_client.get("/v1/users/me")).json()["username"] == "admin"
+    assert cache.cache_stats()["tokens"]["hits"] == 3
+
+@pytest.mark.asyncio
+async def test_cached_token_is_reloaded_after_cache_ttl(auth_client, session, monkeypatch):
+    now = 1000.0
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now)
+    assert (await auth_client.get("/v1/users/me")).status_code == 200
+    assert cache.get_cache("tokens").max_entries == 10000
+
+    # Well before the access token expires, the user snapshot is reloaded from the database
+    now += 6
+    loads = []
+    get = session.get
+    async def counting_get(*args, **kwargs):
+        loads.append(args)
+        return await get(*args, **kwargs)
+    monkeypatch.setattr(session, "get", counting_get)
+
+    assert (await auth_client.get("/v1/users/me")).status_code == 200
+    assert len(loads) == 1
+
+@pytest.mark.asyncio
+async def test_user_update_invalidates_cached_token(auth_client):
+    me = (await auth_client.get("/v1/users/me")).json()
+
+    response = await auth_client.put(f"/v1/users/{me['id']}/update", json={
+        "user_update": {
+            "email": "admin@email.local", "username": "admin", "first_name": "Renamed",
+            "last_name": "Lastname", "roles": [],
+        },
+        "password_update": {"current_password": "password", "new_password": "password"},
+    })
+    assert response.status_code == 200
+
+    assert (await auth_client.get("/v1/users/me")).json()["first_name"] == "Renamed"
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_rejected(client, caplog, capsys):
+    caplog.set_level(logging.DEBUG, logger="travelothai.core.deps")
+    response = await client.get("/v1/users/me", headers={"Authorization": "Bearer not-a-token"})
+    assert response.status_code == 401
+    # The reason goes to the debug log, not stdout
+    assert any(record.message.startswith("Rejected bearer token") for record in caplog.records)
+    assert capsys.readouterr().out == ""
+
+@pytest.mark.asyncio
+async def test_login_by_email(auth_client):
+    response = await auth_client.post("/v1/token", data={"username": "admin@email.local", "password": "password"})
+    assert response.status_code == 200
+
+    response = await auth_client.post("/v1/token", data={"username": "admin@email.local", "password": "wrong"})
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_duplicate_email_is_rejected(auth_client):
+    response = await auth_client.post("/v1/users/create", json={
+        "email": "admin@email.local", "username": "other", "password": "password",
+        "first_name": "Other", "last_name": "User",
+    })
+    assert response.status_code == 409
+
+@pytest.mark.asyncio
+async def test_update_to_taken_email_is_rejected(auth_client):
+    await auth_client.post("/v1/users/create", json={
+        "email": "other@email.local", "username": "other", "password": "password",
+        "first_name": "Other", "last_name": "User",
+    })
+    me = (await auth_client.get("/v1/users/me")).json()
+
+    response = await auth_client.put(f"/v1/users/{me['id']}/update", json={
+        "user_update": {
+            "email": "other@email.local", "username": "admin", "first_name": "Firstname",
+            "last_name": "Lastname", "roles": [],
+        },
+        "password_update": {"current_password": "password", "new_password": "password"},
+    })
+    assert response.status_code == 409
+
+@pytest.mark.asyncio
+async def test_duplicate_lost_race_is_rejected(auth_client, monkeypatch):
+    await auth_client.post("/v1/users/create", json={
+        "email": "other@email.local", "username": "other", "password": "password",
+        "first_name": "Other", "last_name": "User",
+    })
+    me = (await auth_client.get("/v1/users/me")).json()
+
+    # As if a concurrent request took the name after the pre-check passed
+    async def not_taken(*args, **kwargs):
+        return False
+    monkeypatch.setattr(user_router, "_username_or_email_taken", not_taken)
+
+    response = await auth_client.post("/v1/users/create", json={
+        "email": "other@email.local", "username": "third", "password": "password",
+        "first_name": "Third", "last_name": "User",
+    })
+    assert response.status_code == 409
+
+    response = await auth_client.put(f"/v1/users/{me['id']}/update", json={
+        "user_update": {
+            "email": "admin@email.local", "username": "other", "first_name": "Firstname",
+            "last_name": "Lastname", "roles": [],
+        },
+        "password_update": {"current_password": "password", "new_password": "password"},
+    })
+    assert response.status_code == 409
+
+@pytest.mark.asyncio
+async def test_refresh_token_rotation(auth_client):
+    login = (await auth_client.post("/v1/token", data={"username": "admin", "password": "password"})).json()
+
+    response = await auth_client.post("/v1/token/refresh", json={"refresh_token": login["refresh_token"]})
+    assert response.status_code == 200
+    refreshed = response.json()
+    assert refreshed["refresh_token"] != login["refresh_token"]
+
+    me = await auth_client.get("/v1/users/me", headers={"Authorization": f"Bearer {refreshed['access_token']}"})
+    assert me.json()["username"] == "admin"
+
+    # A rotated refresh token is rejected, the new one still works
+    response = await auth_client.post("/v1/token/refresh", json={"refresh_token": login["refresh_token"]})
+    assert response.status_code == 401
+    response = await auth_client.post("/v1/token/refresh", json={"refresh_token": refreshed["refresh_token"]})
+    assert response.status_code == 200
+
+@pytest.mark.asyncio
+async def test_concurrent_refresh_with_same_token(auth_client, engine):
+    login = (await auth_client.post("/v1/token", data={"username": "admin", "password": "password"})).json()
+
+    # Each request gets its own session and connection, as it would on separate workers
+    session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async def separate_session():
+        async with session_maker() as session:
+            yield session
+    app.dependency_overrides[get_session] = separate_session
+
+    responses = await asyncio.gather(*(
+        auth_client.post("/v1/token/refresh", json={"refresh_token": login["refresh_token"]}) for _ in range(2)
+    ))
+    assert sorted(response.status_code for response in responses) == [200, 401]
+
+@pytest.mark.asyncio
+async def test_password_change_revokes_tokens(auth_client):
+    login = (await auth_client.post("/v1/token", data={"username": "admin", "password": "password"})).json()
+    me = (await auth_client.get("/v1/users/me")).json()
+
+    response = await auth_client.put(f"/v1/users/{me['id']}/change_password", json={
+        "current_password": "password", "new_password": "new-password",
+    })
+    assert response.status_code == 200
+
+    response = await auth_client.post("/v1/token/refresh", json={"refresh_token": login["refresh_token"]})
+    assert response.status_code == 401
+    assert (await auth_client.get("/v1/users/me")).status_code == 401
+
+    # Tokens issued after the change work
+    login = (await auth_client.post("/v1/token", data={"username": "admin", "password": "new-password"})).json()
+    response = await auth_client.post("/v1/token/refresh", json={"refresh_token": login["refresh_token"]})
+    assert response.status_code == 200
+
+@pytest.mark.asyncio
+async def test_refresh_token_is_not_an_access_token(auth_client):
+    login = (await auth_client.post("/v1/token", data={"username": "admin", "password": "password"})).json()
+
+    me = await auth_client.get("/v1/users/me", headers={"Authorization": f"Bearer {login['refresh_token']}"})
+    assert me.status_code == 401
+    response = await auth_client.post("/v1/token/refresh", json={"refresh_token": login["access_token"]})
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_revoked_tokens_are_purged_once_expired(session):
+    now = datetime.datetime.now()
+    assert await user_model.RevokedToken.claim(session, "old", now - datetime.timedelta(seconds=1))
+    assert await user_model.RevokedToken.claim(session, "new", now + datetime.timedelta(hours=1))
+    assert not await user_model.RevokedToken.claim(session, "new", now + datetime.timedelta(hours=1))
+
+    result = await session.exec(select(user_model.RevokedToken.jti))
+    assert result.all() == ["new"]
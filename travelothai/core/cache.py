@@ -0,0 +1,95 @@
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+from . import config
+
+
+class TTLCache:
+    """In-process LRU cache whose entries expire after a time-to-live."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 300.0):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        # Bumped by clear() so a read that raced with a write can tell its value is stale
+        self.generation = 0
+        self._entries: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+        self.misses += 1
+        return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, generation: Optional[int] = None) -> None:
+        """Store `value`, evicting the least recently used entry when the cache is full.
+
+        Pass the `generation` read before loading `value`; nothing is stored if the cache was cleared since.
+        """
+        ttl = self.ttl_seconds if ttl is None else ttl
+        if ttl <= 0 or (generation is not None and generation != self.generation):
+            return
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+
+    def delete_where(self, predicate: Callable[[Any], bool]) -> None:
+        """Drop every entry whose value matches `predicate`."""
+        for key in [key for key, (_, value) in self._entries.items() if predicate(value)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self.generation += 1
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+
+
+_caches: Dict[str, TTLCache] = {}
+
+
+def get_cache(name: str, max_entries: Optional[int] = None, ttl_seconds: Optional[float] = None) -> TTLCache:
+    """Return the process-wide cache registered under `name`, creating it on first use.
+
+    Size and lifetime default to the reference-data settings (`CACHE_MAX_ENTRIES`, `CACHE_TTL_SECONDS`).
+    """
+    cache = _caches.get(name)
+    if cache is None:
+        settings = config.get_settings()
+        cache = _caches[name] = TTLCache(
+            max_entries=settings.CACHE_MAX_ENTRIES if max_entries is None else max_entries,
+            ttl_seconds=settings.CACHE_TTL_SECONDS if ttl_seconds is None else ttl_seconds,
+        )
+    return cache
+
+
+def cache_stats() -> Dict[str, Dict[str, float]]:
+    """Hit/miss counters of every registered cache, keyed by cache name."""
+    return {name: cache.stats() for name, cache in _caches.items()}
+
+
+def clear_caches() -> None:
+    for cache in _caches.values():
+        cache.clear()
@@ -5,7 +5,58 @@ class Settings(BaseSettings):
 
     SQLDB_URL: str
     SECRET_KEY: str
-    
+
+    # Database engine & connection pool
+    SQLDB_ECHO: bool = False
+    SQLDB_POOL_SIZE: int = 5
+    SQLDB_MAX_OVERFLOW: int = 10
+    SQLDB_POOL_TIMEOUT: float = 30.0
+    SQLDB_POOL_RECYCLE: int = 1800
+    SQLDB_POOL_PRE_PING: bool = True
+    SQLDB_APPLICATION_NAME: str = "travelothai"
+
+    # SQLite production profile (file databases only)
+    SQLITE_PRODUCTION_MODE: bool = False
+    SQLITE_SYNCHRONOUS: str = "NORMAL"
+    SQLITE_MMAP_SIZE: int = 268435456
+    SQLITE_CACHE_SIZE: int = -64000
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_READER_POOL_SIZE: int = 4
+
+    # In-memory cache for reference data (provinces, categories, ticket types, usage rules)
+    CACHE_ENABLED: bool = False
+    CACHE_TTL_SECONDS: float = 300.0
+    CACHE_MAX_ENTRIES: int = 1024
+
+    # Verified bearer tokens (claims + user snapshot). Each worker keeps its own copy, so an entry lives at
+    # most TOKEN_CACHE_TTL_SECONDS: changes to a user made through another worker show up within that time
+    TOKEN_CACHE_ENABLED: bool = True
+    TOKEN_CACHE_TTL_SECONDS: float = 5.0
+    TOKEN_CACHE_MAX_ENTRIES: int = 10000
+
+    # Cache-Control sent with the catalogue list endpoints (validated with the ETag)
+    HOTELS_CACHE_CONTROL: str = "no-cache"
+    PROVINCES_CACHE_CONTROL: str = "public, max-age=60"
+    TICKETS_CACHE_CONTROL: str = "public, max-age=60"
+
+    # Apply pending schema migrations when the app starts; turn off to run `scripts/run-migrate` as a deploy step
+    AUTO_MIGRATE: bool = True
+
+    # Statements slower than this are logged as slow queries
+    SLOW_QUERY_THRESHOLD_MS: float = 200.0
+
+    # Largest batch accepted by the bulk create endpoints
+    BULK_MAX_ROWS: int = 10000
+
+    # Discount matrix: rebuilt after this many seconds so rule changes made by other workers are picked up
+    DISCOUNT_MATRIX_TTL_SECONDS: float = 60.0
+    # Most (hotel, ticket) pairs priced by one quote request
+    QUOTE_MAX_HOTELS: int = 500
+
+    # Password hashing: bcrypt work factor and the size of the thread pool running it
+    BCRYPT_ROUNDS: int = 12
+    BCRYPT_MAX_WORKERS: int = 4
+
     ACCESS_TOKEN_EXPIRE_MINUTES: int
     REFRESH_TOKEN_EXPIRE_MINUTES: int
 
@@ -1,26 +1,54 @@
-from fastapi import Depends, HTTPException, logger, status, Path, Query
+from fastapi import Depends, HTTPException, status, Path, Query
 from sqlmodel.ext.asyncio.session import AsyncSession
 from fastapi.security import OAuth2PasswordBearer
 
+import hashlib
+import logging
+import time
 import typing
 from jose import jwt
 
 from pydantic import ValidationError
 
 from travelothai.models import user_model, get_session
+from . import cache
 from . import security
 from . import config
 
 
+logger = logging.getLogger(__name__)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/v1/token")
 
 settings = config.get_settings()
 
 
+def _token_cache() -> cache.TTLCache:
+    return cache.get_cache(
+        "tokens", max_entries=settings.TOKEN_CACHE_MAX_ENTRIES, ttl_seconds=settings.TOKEN_CACHE_TTL_SECONDS
+    )
+
+
+def _token_key(token: str) -> str:
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def invalidate_user_tokens(user_id: int) -> None:
+    """Forget every cached token of `user_id` so the next request reloads the user."""
+    _token_cache().delete_where(lambda entry: entry[1].id == user_id)
+
+
 async def get_current_user(
     token: typing.Annotated[str, Depends(oauth2_scheme)],
     session: typing.Annotated[AsyncSession, Depends(get_session)],
 ) -> user_model.User:
+    token_cache = _token_cache() if settings.TOKEN_CACHE_ENABLED else None
+    if token_cache is not None:
+        # Hit: the signature was already verified and the user loaded for this exact token
+        cached = token_cache.get(_token_key(token))
+        if cached is not None:
+            return cached[1]
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -32,17 +60,24 @@ async def get_current_user(
         )
         user_id: int = payload.get("sub")
 
-        if user_id is None:
+        # Refresh tokens are only accepted by /v1/token/refresh
+        if user_id is None or payload.get("type") == "refresh":
             raise credentials_exception
 
     except Exception as e:
-        print(e)
+        logger.debug("Rejected bearer token: %s", e)
         raise credentials_exception
 
     user = await session.get(user_model.DBUser, user_id)
-    if user is None:
+    # A password change since the token was issued revokes it
+    if user is None or payload.get("gen", 0) != user.token_generation:
         raise credentials_exception
 
+    user = user_model.User.model_validate(user)
+    if token_cache is not None and "exp" in payload:
+        # Never past the token's own expiry
+        ttl = min(payload["exp"] - time.time(), token_cache.ttl_seconds)
+        token_cache.set(_token_key(token), (payload, user), ttl=ttl)
     return user
 
 
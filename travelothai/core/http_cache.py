@@ -0,0 +1,51 @@
+import datetime
+import hashlib
+from typing import Dict, Optional, Sequence
+
+from fastapi import Request, Response
+
+
+def make_etag(request: Request, *version) -> str:
+    """Weak ETag for a collection response, derived from the request query and the `version` parts."""
+    raw = "|".join([f"{request.url.path}?{request.url.query}", *(str(part) for part in version)])
+    return f'W/"{hashlib.blake2b(raw.encode(), digest_size=12).hexdigest()}"'
+
+
+def validator_headers(etag: str, cache_control: str) -> Dict[str, str]:
+    # No Last-Modified: a newest `updated_at` does not move when a row is deleted, the ETag does
+    return {"ETag": etag, "Cache-Control": cache_control}
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Evaluate If-None-Match against the current ETag; If-Modified-Since is not honoured on collections."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is None:
+        return False
+    candidates = [tag.strip().removeprefix("W/") for tag in if_none_match.split(",")]
+    return "*" in candidates or etag.removeprefix("W/") in candidates
+
+
+def _respond(request: Request, response: Response, etag: str, cache_control: str) -> Optional[Response]:
+    headers = validator_headers(etag, cache_control)
+    if is_not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
+
+
+def conditional_response(
+    request: Request,
+    response: Response,
+    count: int,
+    last_modified: Optional[datetime.datetime],
+    cache_control: str,
+) -> Optional[Response]:
+    """Set the validator headers on `response`, or return a 304 response when the client copy is current."""
+    etag = make_etag(request, count, last_modified)
+    return _respond(request, response, etag, cache_control)
+
+
+def conditional_page_response(request: Request, response: Response, rows: Sequence, cache_control: str) -> Optional[Response]:
+    """`conditional_response` for a page that is already loaded: the ETag comes from its rows' ids and `updated_at`."""
+    etag = make_etag(request, *(f"{row.id}:{row.updated_at.isoformat()}" for row in rows))
+    return _respond(request, response, etag, cache_control)
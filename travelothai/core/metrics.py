@@ -0,0 +1,171 @@
+import time
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from . import cache, security
+
+# Prometheus default latency buckets, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+Labels = Tuple[Tuple[str, str], ...]
+
+
+def _format_labels(labels: Labels, extra: Optional[Tuple[str, str]] = None) -> str:
+    pairs = list(labels) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+    return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+class Histogram:
+    """Cumulative-bucket histogram; each labelled series keeps per-bucket counts, a sum and a count."""
+
+    def __init__(self, name: str, documentation: str, buckets: Iterable[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Labels, List[float]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(sorted(labels.items()))
+        series = self._series.get(key)
+        if series is None:
+            # One counter per bucket plus +Inf, then sum
+            series = self._series[key] = [0] * (len(self.buckets) + 1) + [0.0]
+        series[bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else repr(bound)
+                lines.append(f"{self.name}_bucket{_format_labels(labels, ('le', le))} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(labels)} {series[-1]!r}")
+            lines.append(f"{self.name}_count{_format_labels(labels)} {cumulative}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, documentation: str):
+        self.name = name
+        self.documentation = documentation
+        self.value = 0.0
+
+    def inc(self, amount: float = 1) -> None:
+        self.value += amount
+
+    def dec(self, amount: float = 1) -> None:
+        self.value -= amount
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} gauge",
+            f"{self.name} {_format_value(self.value)}",
+        ]
+
+
+def _family(name: str, kind: str, documentation: str, samples: Iterable[Tuple[Labels, float]]) -> List[str]:
+    lines = [f"# HELP {name} {documentation}", f"# TYPE {name} {kind}"]
+    lines.extend(f"{name}{_format_labels(labels)} {_format_value(value)}" for labels, value in samples)
+    return lines
+
+
+request_latency = Histogram(
+    "travelothai_http_request_duration_seconds", "HTTP request latency by method, route and status."
+)
+requests_in_flight = Gauge("travelothai_http_requests_in_flight", "HTTP requests being served.")
+
+
+def pool_metrics(engines: Dict[str, AsyncEngine]) -> List[str]:
+    """Checked-out / overflow / idle connections of each engine's pool (StaticPool reports nothing)."""
+    stats = {"checked_out": [], "overflow": [], "checked_in": [], "size": []}
+    for name, engine in engines.items():
+        pool = engine.sync_engine.pool
+        labels = (("engine", name),)
+        for stat, method in (("checked_out", "checkedout"), ("overflow", "overflow"), ("checked_in", "checkedin"), ("size", "size")):
+            if hasattr(pool, method):
+                stats[stat].append((labels, getattr(pool, method)()))
+    return (
+        _family("travelothai_db_pool_checked_out", "gauge", "Connections in use.", stats["checked_out"])
+        + _family("travelothai_db_pool_overflow", "gauge", "Connections opened above the pool size (negative while the pool is filling).", stats["overflow"])
+        + _family("travelothai_db_pool_checked_in", "gauge", "Idle connections kept in the pool.", stats["checked_in"])
+        + _family("travelothai_db_pool_size", "gauge", "Configured pool size.", stats["size"])
+    )
+
+
+def cache_metrics() -> List[str]:
+    stats = cache.cache_stats()
+    samples = lambda field: [((("cache", name),), values[field]) for name, values in sorted(stats.items())]
+    return (
+        _family("travelothai_cache_hits_total", "counter", "Cache lookups served from memory.", samples("hits"))
+        + _family("travelothai_cache_misses_total", "counter", "Cache lookups that went to the database.", samples("misses"))
+        + _family("travelothai_cache_entries", "gauge", "Entries held by the cache.", samples("size"))
+        + _family("travelothai_cache_hit_ratio", "gauge", "Hits over lookups since start.", samples("hit_ratio"))
+    )
+
+
+def password_hasher_metrics() -> List[str]:
+    hasher = security.password_hasher
+    return (
+        _family("travelothai_bcrypt_in_flight", "gauge", "Password hash/verify calls running or queued.", [((), hasher.in_flight)])
+        + _family("travelothai_bcrypt_queue_depth", "gauge", "Password hash/verify calls waiting for a worker.", [((), hasher.queue_depth)])
+        + _family("travelothai_bcrypt_workers", "gauge", "Size of the password hashing thread pool.", [((), hasher.max_workers)])
+    )
+
+
+def render(engines: Dict[str, AsyncEngine]) -> str:
+    """Everything above in the Prometheus text exposition format (version 0.0.4)."""
+    lines = (
+        request_latency.render()
+        + requests_in_flight.render()
+        + pool_metrics(engines)
+        + cache_metrics()
+        + password_hasher_metrics()
+    )
+    return "\n".join(lines) + "\n"
+
+
+class MetricsMiddleware:
+    """Pure ASGI middleware feeding the request latency histogram and in-flight gauge."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        requests_in_flight.inc()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            requests_in_flight.dec()
+            # The router stores the matched route on the scope; the template keeps label cardinality bounded
+            route = scope.get("route")
+            request_latency.observe(
+                time.perf_counter() - start,
+                method=scope["method"],
+                route=route.path if route is not None else "<unmatched>",
+                status=str(status_code),
+            )
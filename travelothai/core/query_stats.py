@@ -0,0 +1,113 @@
+import json
+import logging
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from . import config
+
+logger = logging.getLogger("travelothai.sql")
+request_logger = logging.getLogger("travelothai.requests")
+
+
+class QueryStats:
+    """SQL statements issued while serving one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_ms = 0.0
+        self.slowest_ms = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed_ms: float) -> None:
+        self.count += 1
+        self.total_ms += elapsed_ms
+        if elapsed_ms > self.slowest_ms:
+            self.slowest_ms = elapsed_ms
+            self.slowest_statement = statement
+
+    def server_timing(self) -> str:
+        return f'db;desc="{self.count} queries";dur={self.total_ms:.2f}, db-slowest;dur={self.slowest_ms:.2f}'
+
+
+# Stats of the request being served; None outside of a request (startup, CLI, background work)
+_current: ContextVar[Optional[QueryStats]] = ContextVar("query_stats", default=None)
+
+
+def current() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def instrument_engine(async_engine: AsyncEngine, slow_query_ms: Optional[float] = None) -> None:
+    """Time every statement of `async_engine` and log the ones slower than the threshold."""
+    if slow_query_ms is None:
+        slow_query_ms = config.get_settings().SLOW_QUERY_THRESHOLD_MS
+
+    @event.listens_for(async_engine.sync_engine, "before_cursor_execute")
+    def start_timer(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(async_engine.sync_engine, "after_cursor_execute")
+    def stop_timer(conn, cursor, statement, parameters, context, executemany):
+        elapsed_ms = (time.perf_counter() - conn.info["query_start"].pop()) * 1000
+        stats = _current.get()
+        if stats is not None:
+            stats.record(statement, elapsed_ms)
+        if elapsed_ms >= slow_query_ms:
+            logger.warning(json.dumps({"event": "slow_query", "duration_ms": round(elapsed_ms, 2), "statement": statement}))
+
+    @event.listens_for(async_engine.sync_engine, "handle_error")
+    def drop_timer(exception_context):
+        # A failed statement never reaches after_cursor_execute
+        conn = exception_context.connection
+        if conn is not None and conn.info.get("query_start"):
+            conn.info["query_start"].pop()
+
+
+class QueryStatsMiddleware:
+    """Pure ASGI middleware reporting the SQL work of each HTTP request.
+
+    The totals go out in a `Server-Timing` header and in one JSON log line per request.
+    Statements run after the response headers are sent (streamed bodies) only reach the log line.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = _current.set(stats)
+        start = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", stats.server_timing().encode("latin-1")))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            request_logger.info(json.dumps({
+                "event": "request",
+                "method": scope["method"],
+                "path": scope["path"],
+                "status": status_code,
+                "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+                "queries": stats.count,
+                "db_ms": round(stats.total_ms, 2),
+                "slowest_ms": round(stats.slowest_ms, 2),
+                "slowest_statement": stats.slowest_statement,
+            }))
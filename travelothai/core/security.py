@@ -1,6 +1,10 @@
+import asyncio
 import datetime
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Union
 
+import bcrypt
 from jose import jwt
 
 from . import config
@@ -11,6 +15,43 @@ ALGORITHM = "HS256"
 settings = config.get_settings()
 
 
+class PasswordHasher:
+    """Runs bcrypt on a bounded thread pool so hashing never blocks the event loop."""
+
+    def __init__(self, rounds: int, max_workers: int):
+        self.rounds = rounds
+        self.max_workers = max_workers
+        # Calls submitted and not finished yet, running or waiting for a worker
+        self.in_flight = 0
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+
+    @property
+    def queue_depth(self) -> int:
+        """Calls waiting for a free worker."""
+        return max(self.in_flight - self.max_workers, 0)
+
+    async def _run(self, fn, *args):
+        self.in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+        finally:
+            self.in_flight -= 1
+
+    async def hash(self, plain_password: str) -> str:
+        hashed = await self._run(
+            bcrypt.hashpw, plain_password.encode("utf-8"), bcrypt.gensalt(rounds=self.rounds)
+        )
+        return hashed.decode("utf-8")
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(
+            bcrypt.checkpw, plain_password.encode("utf-8"), hashed_password.encode("utf-8")
+        )
+
+
+password_hasher = PasswordHasher(rounds=settings.BCRYPT_ROUNDS, max_workers=settings.BCRYPT_MAX_WORKERS)
+
+
 def create_access_token(data: dict, expires_delta: datetime.timedelta | None = None):
     to_encode = data.copy()
     if expires_delta:
@@ -19,7 +60,7 @@ def create_access_token(data: dict, expires_delta: datetime.timedelta | None = N
         expire = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
-    to_encode.update({"exp": expire, "sub": str(data.get("sub", 0))})
+    to_encode.update({"exp": expire, "sub": str(data.get("sub", 0)), "type": "access"})
 
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
@@ -35,6 +76,22 @@ def create_refresh_token(
         expire = datetime.datetime.now(tz=datetime.timezone.utc) + datetime.timedelta(
             minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES
         )
-    to_encode.update({"exp": expire})
+    to_encode.update(
+        {"exp": expire, "sub": str(data.get("sub", 0)), "type": "refresh", "jti": uuid.uuid4().hex}
+    )
     encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
\ No newline at end of file
+    return encoded_jwt
+
+
+def decode_refresh_token(token: str) -> dict[str, Any] | None:
+    """Return the claims of a validly signed, unexpired refresh token, otherwise None.
+
+    Rotation and revocation are checked against the database by the refresh endpoint.
+    """
+    try:
+        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
+    except Exception:
+        return None
+    if payload.get("type") != "refresh" or not payload.get("jti"):
+        return None
+    return payload
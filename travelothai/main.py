@@ -3,6 +3,9 @@ from contextlib import asynccontextmanager
 
 from . import routers
 from . import models
+from .core.metrics import MetricsMiddleware
+from .core.query_stats import QueryStatsMiddleware
+from .services.pricing_services.DiscountMatrix import DiscountMatrix
 
 
 app = FastAPI(title="TraveloThai API", version="1.0.0")
@@ -12,10 +15,15 @@ app = FastAPI(title="TraveloThai API", version="1.0.0")
 async def lifespan(app: FastAPI):
     # Initialize the database
     await models.init_db()
+    # Load the discount matrix before the first booking needs it
+    async with models.read_session_maker() as session:
+        await DiscountMatrix.get(session)
     yield
     # Close the database connection
     await models.close_db()
 
 
 app = FastAPI(title="TraveloThai API", version="1.0.0", lifespan=lifespan)
+app.add_middleware(QueryStatsMiddleware)
+app.add_middleware(MetricsMiddleware)
 app.include_router(routers.router)
@@ -0,0 +1,211 @@
+"""Versioned schema migrations.
+
+Each module in `travelothai/migrations/versions/` named `<version>_<name>.py` defines
+`async def upgrade(op)` and may set `TRANSACTIONAL = False` to run outside a transaction
+(required for `CREATE INDEX CONCURRENTLY` on PostgreSQL). Applied versions are recorded in
+`schema_migrations` together with how long they took.
+
+The first migration creates the tables from the current models, so a new database already has
+everything the later ones add; their operations are idempotent and only change databases
+created by an earlier release.
+"""
+import asyncio
+import contextlib
+import importlib
+import json
+import logging
+import pkgutil
+import time
+from datetime import datetime
+from typing import AsyncIterator, Dict, List, Optional, Sequence
+
+from sqlalchemy import Column, DateTime, Float, MetaData, String, Table, inspect, select, text
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+from sqlmodel import SQLModel
+
+from . import versions
+
+logger = logging.getLogger("travelothai.migrations")
+
+schema_migrations = Table(
+    "schema_migrations",
+    MetaData(),
+    Column("version", String(32), primary_key=True),
+    Column("description", String(255), nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+    Column("duration_ms", Float, nullable=False),
+)
+
+# Serializes migration runs across workers starting at the same time (PostgreSQL)
+ADVISORY_LOCK_KEY = 0x7472_6176_656C  # "travel"
+# Wait between attempts to take the SQLite write lock while another worker migrates
+SQLITE_LOCK_RETRY_SECONDS = 0.1
+
+
+class Operations:
+    """Schema changes available to a migration, rendered for the connection's dialect."""
+
+    def __init__(self, conn: AsyncConnection):
+        self.conn = conn
+        self.dialect = conn.dialect.name
+
+    def _quote(self, name: str) -> str:
+        return self.conn.dialect.identifier_preparer.quote(name)
+
+    async def execute(self, statement: str, **params) -> None:
+        start = time.perf_counter()
+        await self.conn.execute(text(statement), params)
+        logger.info(json.dumps({
+            "event": "migration_statement",
+            "duration_ms": round((time.perf_counter() - start) * 1000, 2),
+            "statement": statement,
+        }))
+
+    async def create_all(self) -> None:
+        """Create the tables (and their indexes) of every model that has no table yet."""
+        await self.conn.run_sync(SQLModel.metadata.create_all)
+
+    async def create_index(self, name: str, table: str, columns: Sequence[str], unique: bool = False) -> None:
+        """Create an index unless it exists, without blocking writes on PostgreSQL."""
+        ddl = (
+            f"{'UNIQUE ' if unique else ''}INDEX {{}}IF NOT EXISTS {self._quote(name)} "
+            f"ON {self._quote(table)} ({', '.join(self._quote(column) for column in columns)})"
+        )
+        if self.dialect == "postgresql":
+            # A failed concurrent build leaves an invalid index that IF NOT EXISTS would keep
+            result = await self.conn.execute(
+                text("SELECT i.indisvalid FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid WHERE c.relname = :name"),
+                {"name": name},
+            )
+            if result.scalar() is False:
+                await self.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {self._quote(name)}")
+            await self.execute("CREATE " + ddl.format("CONCURRENTLY "))
+        else:
+            await self.execute("CREATE " + ddl.format(""))
+
+    async def add_column(self, table: str, column: str, definition: str) -> None:
+        """Add a column unless it exists; `definition` is the SQL type plus any NULL/DEFAULT clause.
+
+        Nullable columns and constant defaults are metadata-only changes on PostgreSQL 11+ and SQLite.
+        """
+        existing = await self.conn.run_sync(lambda conn: {c["name"] for c in inspect(conn).get_columns(table)})
+        if column not in existing:
+            await self.execute(f"ALTER TABLE {self._quote(table)} ADD COLUMN {self._quote(column)} {definition}")
+
+
+class Migration:
+    def __init__(self, module_name: str):
+        self.version, _, self.name = module_name.partition("_")
+        self.module = importlib.import_module(f"{versions.__name__}.{module_name}")
+        self.description = (self.module.__doc__ or self.name).strip().splitlines()[0]
+        self.transactional = getattr(self.module, "TRANSACTIONAL", True)
+
+    async def apply(self, conn: AsyncConnection) -> bool:
+        """Run the migration on `conn` and record it, inside the caller's transaction.
+
+        Returns False when the version turned out to be recorded already (by a runner that
+        did not hold the migration lock); the operations themselves are idempotent.
+        """
+        start = time.perf_counter()
+        await self.module.upgrade(Operations(conn))
+        duration_ms = (time.perf_counter() - start) * 1000
+        result = await conn.execute(_insert(conn).values(
+            version=self.version, description=self.description,
+            applied_at=datetime.now(), duration_ms=duration_ms,
+        ).on_conflict_do_nothing(index_elements=["version"]))
+        logger.info(json.dumps({
+            "event": "migration_applied" if result.rowcount else "migration_already_applied",
+            "version": self.version, "description": self.description, "duration_ms": round(duration_ms, 2),
+        }))
+        return bool(result.rowcount)
+
+
+def _insert(conn: AsyncConnection):
+    # Both dialects accept INSERT ... ON CONFLICT DO NOTHING for the duplicate-version case
+    if conn.dialect.name == "postgresql":
+        return postgresql.insert(schema_migrations)
+    return sqlite.insert(schema_migrations)
+
+
+def load_migrations() -> List[Migration]:
+    return [Migration(module.name) for module in sorted(pkgutil.iter_modules(versions.__path__), key=lambda module: module.name)]
+
+
+async def _applied(conn: AsyncConnection) -> Dict[str, dict]:
+    await conn.run_sync(schema_migrations.create, checkfirst=True)
+    result = await conn.execute(select(schema_migrations))
+    return {row.version: dict(row._mapping) for row in result}
+
+
+async def applied_migrations(engine: AsyncEngine) -> Dict[str, dict]:
+    """Rows of `schema_migrations` keyed by version."""
+    async with engine.begin() as conn:
+        return await _applied(conn)
+
+
+@contextlib.asynccontextmanager
+async def _sqlite_write_lock(conn: AsyncConnection) -> AsyncIterator[None]:
+    """BEGIN IMMEDIATE ... COMMIT on an autocommit connection: one writer at a time across processes."""
+    while True:
+        try:
+            await conn.exec_driver_sql("BEGIN IMMEDIATE")
+            break
+        except OperationalError as error:
+            # Another worker is migrating; its transaction can outlast the busy timeout
+            if "locked" not in str(error):
+                raise
+            await asyncio.sleep(SQLITE_LOCK_RETRY_SECONDS)
+    try:
+        yield
+    except BaseException:
+        await conn.exec_driver_sql("ROLLBACK")
+        raise
+    await conn.exec_driver_sql("COMMIT")
+
+
+async def _upgrade_sqlite(engine: AsyncEngine, migrations: List[Migration]) -> List[Migration]:
+    applied = []
+    async with engine.connect() as conn:
+        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+        for migration in migrations:
+            # Each migration runs under the write lock, after re-reading what is already applied
+            async with _sqlite_write_lock(conn):
+                if migration.version not in await _applied(conn) and await migration.apply(conn):
+                    applied.append(migration)
+    return applied
+
+
+async def _upgrade_postgresql(engine: AsyncEngine, migrations: List[Migration]) -> List[Migration]:
+    applied = []
+    async with engine.connect() as lock_conn:
+        lock_conn = await lock_conn.execution_options(isolation_level="AUTOCOMMIT")
+        await lock_conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": ADVISORY_LOCK_KEY})
+        try:
+            done = await applied_migrations(engine)
+            for migration in migrations:
+                if migration.version in done:
+                    continue
+                async with engine.connect() as conn:
+                    if not migration.transactional:
+                        conn = await conn.execution_options(isolation_level="AUTOCOMMIT")
+                    async with conn.begin():
+                        if await migration.apply(conn):
+                            applied.append(migration)
+        finally:
+            await lock_conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": ADVISORY_LOCK_KEY})
+    return applied
+
+
+async def upgrade(engine: AsyncEngine, target: Optional[str] = None) -> List[Migration]:
+    """Apply every pending migration up to and including `target`; returns the ones applied.
+
+    Runs are serialized across workers: an advisory lock on PostgreSQL, BEGIN IMMEDIATE on SQLite.
+    """
+    migrations = [migration for migration in load_migrations() if target is None or migration.version <= target]
+    if engine.dialect.name == "postgresql":
+        return await _upgrade_postgresql(engine, migrations)
+    if engine.dialect.name == "sqlite":
+        return await _upgrade_sqlite(engine, migrations)
+    raise RuntimeError(f"Migrations support PostgreSQL and SQLite, not {engine.dialect.name}")
@@ -0,0 +1,40 @@
+"""Apply or list schema migrations for the database in `SQLDB_URL`.
+
+Usage:
+    python -m travelothai.migrations status
+    python -m travelothai.migrations upgrade [--target VERSION]
+"""
+import argparse
+import asyncio
+import logging
+import sys
+
+from travelothai import migrations, models
+from travelothai.core.config import Settings
+
+
+async def _main(args) -> int:
+    # Migration statements on large tables are expected to be slow
+    logging.getLogger("travelothai.sql").setLevel(logging.ERROR)
+    await models.init_db(Settings(AUTO_MIGRATE=False))
+    try:
+        if args.command == "upgrade":
+            applied = await migrations.upgrade(models.engine, target=args.target)
+            if not applied:
+                print("Nothing to apply.")
+        applied = await migrations.applied_migrations(models.engine)
+        for migration in migrations.load_migrations():
+            row = applied.get(migration.version)
+            state = f"applied {row['applied_at']:%Y-%m-%d %H:%M:%S} in {row['duration_ms']:9.1f} ms" if row else "pending"
+            print(f"{migration.version}  {state:<46}  {migration.description}")
+    finally:
+        await models.close_db()
+    return 0
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("command", choices=("status", "upgrade"))
+    parser.add_argument("--target", help="stop after this version")
+    sys.exit(asyncio.run(_main(parser.parse_args())))
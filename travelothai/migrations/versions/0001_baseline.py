@@ -0,0 +1,8 @@
+"""Create the tables of every model."""
+# Registers every table on SQLModel.metadata, including users (not imported by travelothai.models)
+from travelothai import models  # noqa: F401
+from travelothai.models import user_model  # noqa: F401
+
+
+async def upgrade(op):
+    await op.create_all()
@@ -0,0 +1,7 @@
+"""Index hotel price and (province_id, id) for the filtered, keyset-paginated listing."""
+TRANSACTIONAL = False
+
+
+async def upgrade(op):
+    await op.create_index("ix_hotel_price", "hotel", ["price"])
+    await op.create_index("ix_hotel_province_id_id", "hotel", ["province_id", "id"])
@@ -0,0 +1,10 @@
+"""Unique indexes on users.username and users.email for the login lookup.
+
+Fails if existing rows already share a username or email; resolve those first.
+"""
+TRANSACTIONAL = False
+
+
+async def upgrade(op):
+    await op.create_index("ix_users_username", "users", ["username"], unique=True)
+    await op.create_index("ix_users_email", "users", ["email"], unique=True)
@@ -0,0 +1,15 @@
+"""Index the foreign keys used by bookings, tickets, campaigns and the usage-rule lookup."""
+TRANSACTIONAL = False
+
+
+async def upgrade(op):
+    await op.create_index("ix_booking_hotel_id", "booking", ["hotel_id"])
+    await op.create_index("ix_booking_ticket_id", "booking", ["ticket_id"])
+    await op.create_index("ix_booking_user_id", "booking", ["user_id"])
+    await op.create_index("ix_ticket_user_id", "ticket", ["user_id"])
+    await op.create_index("ix_ticket_campaign_id", "ticket", ["campaign_id"])
+    await op.create_index("ix_bookingreschedulelog_booking_id", "bookingreschedulelog", ["booking_id"])
+    await op.create_index("ix_ticketcampaigntickettype_campaign_id", "ticketcampaigntickettype", ["campaign_id"])
+    await op.create_index(
+        "ix_ticketusagerule_ticket_type_id_category_id", "ticketusagerule", ["ticket_type_id", "category_id"]
+    )
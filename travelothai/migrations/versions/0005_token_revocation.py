@@ -0,0 +1,11 @@
+"""Add revoked_tokens and users.token_generation for refresh-token rotation and revocation."""
+TRANSACTIONAL = False
+
+# Registers the revoked_tokens table on SQLModel.metadata
+from travelothai.models import user_model  # noqa: F401
+
+
+async def upgrade(op):
+    await op.create_all()
+    await op.add_column("users", "token_generation", "INTEGER NOT NULL DEFAULT 0")
+    await op.create_index("ix_revoked_tokens_expires_at", "revoked_tokens", ["expires_at"])
@@ -1,9 +1,16 @@
-from typing import AsyncIterator
+from typing import AsyncIterator, Optional
 
-from sqlmodel import SQLModel
+from sqlmodel import Session
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import event
+from sqlalchemy.engine import URL, make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncEngine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from travelothai import migrations
+from travelothai.core import query_stats
+from travelothai.core.config import Settings, get_settings
 
 # Import models after setting up the database components
 from .province_model import *
@@ -11,45 +18,154 @@ from .hotel_model import *
 from .ticket_model import *
 from .booking_model import *
 
-connect_args = {"check_same_thread": False}
-
 engine: AsyncEngine = None
+# Engine used by read-only sessions; the same object as `engine` unless the SQLite production profile is on
+read_engine: AsyncEngine = None
+
+# Session factories are built once in init_db() and shared by every request
+async_session_maker: sessionmaker = None
+read_session_maker: sessionmaker = None
+
+
+class ReadOnlySession(Session):
+    """Session used by read-only requests; refuses to flush pending changes."""
+
+    def flush(self, objects=None):
+        if self.new or self.dirty or self.deleted:
+            raise RuntimeError("Read-only session cannot write to the database.")
+        super().flush(objects)
+
+
+def _is_sqlite_memory(url: URL) -> bool:
+    return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+
+def _engine_options(settings: Settings) -> dict:
+    """Build the create_async_engine() keyword arguments for the configured database."""
+    url = make_url(settings.SQLDB_URL)
+    options = {
+        "echo": settings.SQLDB_ECHO,
+        "pool_pre_ping": settings.SQLDB_POOL_PRE_PING,
+    }
+
+    if url.get_backend_name() == "sqlite":
+        options["connect_args"] = {"check_same_thread": False}
+        if _is_sqlite_memory(url):
+            # An in-memory database only exists on a single connection, pool sizing doesn't apply
+            options["poolclass"] = StaticPool
+            return options
+    elif url.get_backend_name() == "postgresql":
+        # asyncpg profile: tag connections so they can be told apart in pg_stat_activity
+        options["connect_args"] = {
+            "server_settings": {"application_name": settings.SQLDB_APPLICATION_NAME}
+        }
+
+    options.update(
+        pool_size=settings.SQLDB_POOL_SIZE,
+        max_overflow=settings.SQLDB_MAX_OVERFLOW,
+        pool_timeout=settings.SQLDB_POOL_TIMEOUT,
+        pool_recycle=settings.SQLDB_POOL_RECYCLE,
+    )
+    return options
 
 
-async def init_db():
-    """Initialize the database engine and create tables."""
-    global engine
+def _sqlite_pragmas(settings: Settings) -> list[str]:
+    """PRAGMAs applied to every connection of the SQLite production profile."""
+    return [
+        "PRAGMA journal_mode = WAL",
+        f"PRAGMA synchronous = {settings.SQLITE_SYNCHRONOUS}",
+        f"PRAGMA mmap_size = {settings.SQLITE_MMAP_SIZE}",
+        f"PRAGMA cache_size = {settings.SQLITE_CACHE_SIZE}",
+        f"PRAGMA busy_timeout = {settings.SQLITE_BUSY_TIMEOUT_MS}",
+    ]
 
-    engine = create_async_engine(
-        "sqlite+aiosqlite:///database.db",
-        echo=True,
-        future=True,
-        connect_args=connect_args,
+
+def _set_sqlite_pragmas(async_engine: AsyncEngine, pragmas: list[str]):
+    @event.listens_for(async_engine.sync_engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def _create_engines(settings: Settings) -> tuple[AsyncEngine, AsyncEngine]:
+    """Create the (writer, reader) engines for the configured database."""
+    url = make_url(settings.SQLDB_URL)
+    options = _engine_options(settings)
+
+    if not settings.SQLITE_PRODUCTION_MODE or url.get_backend_name() != "sqlite" or _is_sqlite_memory(url):
+        writer = create_async_engine(url, **options)
+        return writer, writer
+
+    # SQLite allows a single writer at a time: serialize writes through one connection
+    # and let WAL readers run concurrently on their own query-only pool.
+    writer = create_async_engine(url, **{**options, "pool_size": 1, "max_overflow": 0})
+    reader = create_async_engine(
+        url, **{**options, "pool_size": settings.SQLITE_READER_POOL_SIZE, "max_overflow": 0}
     )
+    _set_sqlite_pragmas(writer, _sqlite_pragmas(settings))
+    _set_sqlite_pragmas(reader, _sqlite_pragmas(settings) + ["PRAGMA query_only = ON"])
+    return writer, reader
+
 
-    await create_db_and_tables()
+async def init_db(settings: Optional[Settings] = None):
+    """Initialize the database engine and apply pending migrations."""
+    global engine, read_engine, async_session_maker, read_session_maker
 
+    settings = settings or get_settings()
+    engine, read_engine = _create_engines(settings)
+    query_stats.instrument_engine(engine, settings.SLOW_QUERY_THRESHOLD_MS)
+    if read_engine is not engine:
+        query_stats.instrument_engine(read_engine, settings.SLOW_QUERY_THRESHOLD_MS)
 
-async def create_db_and_tables():
-    """Create database tables."""
-    async with engine.begin() as conn:
-        # await conn.run_sync(SQLModel.metadata.drop_all)
-        await conn.run_sync(SQLModel.metadata.create_all)
+    async_session_maker = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    read_session_maker = sessionmaker(
+        read_engine,
+        class_=AsyncSession,
+        sync_session_class=ReadOnlySession,
+        expire_on_commit=False,
+        autoflush=False,
+    )
+
+    if settings.AUTO_MIGRATE:
+        await migrations.upgrade(engine)
 
 
 async def get_session() -> AsyncIterator[AsyncSession]:
-    """Get async database session."""
-    if engine is None:
+    """Get a request-scoped async database session.
+
+    Anything left uncommitted when the request fails is rolled back before the
+    connection goes back to the pool.
+    """
+    if async_session_maker is None:
+        raise Exception("Database engine is not initialized. Call init_db() first.")
+
+    async with async_session_maker() as session:
+        try:
+            yield session
+        except Exception:
+            await session.rollback()
+            raise
+
+
+async def get_read_session() -> AsyncIterator[AsyncSession]:
+    """Get a request-scoped read-only session for GET routes."""
+    if read_session_maker is None:
         raise Exception("Database engine is not initialized. Call init_db() first.")
 
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-    async with async_session() as session:
+    async with read_session_maker() as session:
         yield session
 
 
 async def close_db():
     """Close database connection."""
-    global engine
+    global engine, read_engine, async_session_maker, read_session_maker
+    if read_engine is not None and read_engine is not engine:
+        await read_engine.dispose()
+    read_engine = None
     if engine is not None:
         await engine.dispose()
         engine = None
+    async_session_maker = None
+    read_session_maker = None
@@ -15,10 +15,10 @@ class BookingStatus(str, Enum):
 
 # Booking schema
 class BookingBase(SQLModel):
-    hotel_id: int = Field(foreign_key="hotel.id")
+    hotel_id: int = Field(foreign_key="hotel.id", index=True)
     # user_id: int = Field(foreign_key="user.id")
-    user_id: int = Field(default=None)
-    ticket_id: int = Field(foreign_key="ticket.id")
+    user_id: int = Field(default=None, index=True)
+    ticket_id: int = Field(foreign_key="ticket.id", index=True)
     travel_date: datetime = Field(default_factory=datetime.now)
     price: float = Field(gt=0)
     discount_amount: float = Field(default=0)
@@ -28,7 +28,7 @@ class BookingBase(SQLModel):
 class Booking(BookingBase, table=True):
     id: int = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now})
 
     # Relationships
     hotel: Optional["Hotel"] = Relationship(back_populates="bookings")
@@ -38,7 +38,7 @@ class Booking(BookingBase, table=True):
 
 # BookingRescheduleLog schema
 class BookingRescheduleLogBase(SQLModel):
-    booking_id: int = Field(foreign_key="booking.id")
+    booking_id: int = Field(foreign_key="booking.id", index=True)
     previous_travel_date: datetime = Field(default_factory=datetime.now)
     new_travel_date: datetime = Field(default_factory=datetime.now)
     reason: Optional[str] = Field(default=None)
@@ -46,7 +46,7 @@ class BookingRescheduleLogBase(SQLModel):
 class BookingRescheduleLog(BookingRescheduleLogBase, table=True):
     id: int = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now})
 
     # Relationships
     booking: Optional["Booking"] = Relationship(back_populates="reschedule_logs")
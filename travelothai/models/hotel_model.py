@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Index
 
 if TYPE_CHECKING:
     from .province_model import Province
@@ -10,12 +10,15 @@ if TYPE_CHECKING:
 class HotelBase(SQLModel):
     name: str = Field(index=True)
     province_id: int = Field(foreign_key="province.id")
-    price: float = Field(gt=0)
+    price: float = Field(gt=0, index=True)
 
 class Hotel(HotelBase, table=True):
+    # Keyset pagination filtered by province walks (province_id, id) in order
+    __table_args__ = (Index("ix_hotel_province_id_id", "province_id", "id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now})
 
     # Relationship
     province: Optional["Province"] = Relationship(back_populates="hotels")
@@ -13,7 +13,7 @@ class ProvinceCategoryBase(SQLModel):
 class ProvinceCategory(ProvinceCategoryBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now})
 
     # Relationship
     provinces: List["Province"] = Relationship(back_populates="category")
@@ -28,7 +28,7 @@ class ProvinceBase(SQLModel):
 class Province(ProvinceBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now})
 
     # Relationship
     hotels: List["Hotel"] = Relationship(back_populates="province")
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import List, Optional, TYPE_CHECKING
-from sqlmodel import SQLModel, Field, Relationship
+from sqlmodel import SQLModel, Field, Relationship, Index
 
 if TYPE_CHECKING:
     from .province_model import ProvinceCategory
@@ -13,7 +13,7 @@ class TicketTypeBase(SQLModel):
 class TicketType(TicketTypeBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now})
 
     # Relationships
     tickets: List["Ticket"] = Relationship(back_populates="ticket_type")
@@ -29,9 +29,12 @@ class TicketUsageRuleBase(SQLModel):
     tax_reduction: float = Field(default=0.0)
 
 class TicketUsageRule(TicketUsageRuleBase, table=True):
+    # Pricing looks rules up by (ticket type, province category)
+    __table_args__ = (Index("ix_ticketusagerule_ticket_type_id_category_id", "ticket_type_id", "category_id"),)
+
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now})
 
     # Relationships
     ticket_type: Optional["TicketType"] = Relationship(back_populates="usage_rules")
@@ -41,9 +44,9 @@ class TicketUsageRule(TicketUsageRuleBase, table=True):
 # Ticket schema
 class TicketBase(SQLModel):
     # user_id: Optional[int] = Field(default=None, foreign_key="user.id")
-    user_id: int = Field(default=None)
+    user_id: int = Field(default=None, index=True)
     ticket_type_id: int = Field(foreign_key="tickettype.id")
-    campaign_id: Optional[int] = Field(default=None, foreign_key="ticketcampaign.id")
+    campaign_id: Optional[int] = Field(default=None, foreign_key="ticketcampaign.id", index=True)
     amount: int = Field(gt=0)
     used: int = Field(default=0)
     expires_at: datetime = Field(default=None)
@@ -51,7 +54,7 @@ class TicketBase(SQLModel):
 class Ticket(TicketBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now})
 
     # Relationships
     ticket_type: Optional["TicketType"] = Relationship(back_populates="tickets")
@@ -71,7 +74,7 @@ class TicketCampaignBase(SQLModel):
 class TicketCampaign(TicketCampaignBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now})
 
     # Relationships
     tickets: List["Ticket"] = Relationship(back_populates="campaign")
@@ -80,7 +83,7 @@ class TicketCampaign(TicketCampaignBase, table=True):
 
 # TicketCampaignTicketType schema
 class TicketCampaignTicketTypeBase(SQLModel):
-    campaign_id: int = Field(foreign_key="ticketcampaign.id")
+    campaign_id: int = Field(foreign_key="ticketcampaign.id", index=True)
     ticket_type_id: int = Field(foreign_key="tickettype.id")
     amount: int = Field(gt=0)
     expiration_date: datetime = Field(default_factory=datetime.now)
@@ -88,7 +91,7 @@ class TicketCampaignTicketTypeBase(SQLModel):
 class TicketCampaignTicketType(TicketCampaignTicketTypeBase, table=True):
     id: Optional[int] = Field(default=None, primary_key=True)
     created_at: datetime = Field(default_factory=datetime.now)
-    updated_at: datetime = Field(default_factory=datetime.now)
+    updated_at: datetime = Field(default_factory=datetime.now, sa_column_kwargs={"onupdate": datetime.now})
 
     # Relationships
     campaign: Optional["TicketCampaign"] = Relationship(back_populates="ticket_types")
@@ -2,12 +2,15 @@ import datetime
 
 import pydantic
 from pydantic import BaseModel, EmailStr, ConfigDict
-from sqlmodel import SQLModel, Field
+from sqlalchemy import delete
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import SQLModel, Field, Index
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 # from passlib.context import CryptContext
 
 # pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-import bcrypt
+from travelothai.core import security
 
 
 class BaseUser(BaseModel):
@@ -74,6 +77,10 @@ class Token(BaseModel):
     user_id: int
 
 
+class RefreshToken(BaseModel):
+    refresh_token: str
+
+
 class ChangedPasswordUser(BaseModel):
     current_password: str
     new_password: str
@@ -81,6 +88,11 @@ class ChangedPasswordUser(BaseModel):
 
 class DBUser(BaseUser, SQLModel, table=True):
     __tablename__ = "users"
+    # Login looks a user up by username or email
+    __table_args__ = (
+        Index("ix_users_username", "username", unique=True),
+        Index("ix_users_email", "email", unique=True),
+    )
     id: int | None = Field(default=None, primary_key=True)
 
     password: str
@@ -88,6 +100,8 @@ class DBUser(BaseUser, SQLModel, table=True):
     register_date: datetime.datetime = Field(default_factory=datetime.datetime.now)
     updated_date: datetime.datetime = Field(default_factory=datetime.datetime.now)
     last_login_date: datetime.datetime | None = Field(default=None)
+    # Carried by every token as `gen`; bumping it revokes all tokens issued before
+    token_generation: int = Field(default=0)
 
     async def has_roles(self, roles):
         for role in roles:
@@ -96,14 +110,31 @@ class DBUser(BaseUser, SQLModel, table=True):
         return False
 
     async def get_encrypted_password(self, plain_password):
-        return bcrypt.hashpw(
-            plain_password.encode("utf-8"), salt=bcrypt.gensalt()
-        ).decode("utf-8")
+        return await security.password_hasher.hash(plain_password)
 
     async def set_password(self, plain_password):
         self.password = await self.get_encrypted_password(plain_password)
 
     async def verify_password(self, plain_password):
-        return bcrypt.checkpw(
-            plain_password.encode("utf-8"), self.password.encode("utf-8")
-        )
\ No newline at end of file
+        return await security.password_hasher.verify(plain_password, self.password)
+
+class RevokedToken(SQLModel, table=True):
+    """jti of a refresh token that has been rotated, kept until the token would have expired anyway."""
+    __tablename__ = "revoked_tokens"
+    jti: str = Field(primary_key=True, max_length=32)
+    expires_at: datetime.datetime = Field(index=True)
+
+    @classmethod
+    async def claim(cls, session: AsyncSession, jti: str, expires_at: datetime.datetime) -> bool:
+        """Record `jti` and return True, or return False when it was already recorded.
+
+        The primary key makes the claim atomic across requests and workers. Expired rows are
+        purged on the way, through the `expires_at` index.
+        """
+        await session.exec(delete(cls).where(cls.expires_at <= datetime.datetime.now()))
+        dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+        result = await session.exec(
+            dialect.insert(cls).values(jti=jti, expires_at=expires_at).on_conflict_do_nothing(index_elements=["jti"])
+        )
+        await session.commit()
+        return result.rowcount == 1
@@ -1,5 +1,6 @@
 from fastapi import APIRouter
-from . import v1
+from . import v1, metrics_router
 
 router = APIRouter()
 router.include_router(v1.router)
+router.include_router(metrics_router.router)
@@ -0,0 +1,21 @@
+from fastapi import APIRouter, Response
+
+from travelothai import models
+from travelothai.core import metrics
+
+router = APIRouter(tags=["metrics"])
+
+
+@router.get(
+        "/metrics",
+        summary="Prometheus metrics",
+        description="Request latency, in-flight requests, connection pools, caches and the password hashing pool in the Prometheus text format.",
+        response_class=Response,
+    )
+async def read_metrics() -> Response:
+    engines = {}
+    if models.engine is not None:
+        engines["writer"] = models.engine
+        if models.read_engine is not None and models.read_engine is not models.engine:
+            engines["reader"] = models.read_engine
+    return Response(content=metrics.render(engines), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -6,6 +6,7 @@ from . import (
     booking_router,
     user_router,
     authentication_router,
+    search_router,
 )
 
 router = APIRouter(prefix="/v1")
@@ -15,3 +16,4 @@ router.include_router(ticket_router.router)
 router.include_router(booking_router.router)
 router.include_router(user_router.router)
 router.include_router(authentication_router.router)
+router.include_router(search_router.router)
@@ -7,6 +7,7 @@ from fastapi.security import (
 )
 
 
+from sqlalchemy import case, or_
 from sqlmodel import select
 from sqlmodel.ext.asyncio.session import AsyncSession
 from typing import Annotated
@@ -28,22 +29,19 @@ async def authentication(
     form_data: Annotated[OAuth2PasswordRequestForm, Depends()],
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> user_model.Token:
-    print("form_data", form_data)
-
+    # The username match wins if the login matches one user's username and another's email
     result = await session.exec(
-        select(user_model.DBUser).where(user_model.DBUser.username == form_data.username)
-    )
-
-    print("result", result)
-
-    user = result.one_or_none()
-
-    if not user:
-        result = await session.exec(
-            select(user_model.DBUser).where(user_model.DBUser.email == form_data.username)
+        select(user_model.DBUser)
+        .where(
+            or_(
+                user_model.DBUser.username == form_data.username,
+                user_model.DBUser.email == form_data.username,
+            )
         )
-        user = result.one_or_none()
-    print("user", user)
+        .order_by(case((user_model.DBUser.username == form_data.username, 0), else_=1))
+        .limit(1)
+    )
+    user = result.first()
 
     if not user:
         raise HTTPException(
@@ -61,24 +59,54 @@ async def authentication(
 
     session.add(user)
     await session.commit()
-    await session.refresh(user)
 
+    return issue_tokens(user, issued_at=user.last_login_date)
+
+
+@router.post(
+    "/token/refresh",
+)
+async def refresh(
+    refresh_token: user_model.RefreshToken,
+    session: Annotated[AsyncSession, Depends(get_session)],
+) -> user_model.Token:
+    payload = security.decode_refresh_token(refresh_token.refresh_token)
+    user = await session.get(user_model.DBUser, int(payload["sub"])) if payload else None
+
+    # Tokens from before the last password change are revoked, and each token can be
+    # rotated once: its jti is claimed in the database, so this holds across workers
+    if (
+        not user
+        or payload.get("gen", 0) != user.token_generation
+        or not await user_model.RevokedToken.claim(
+            session, payload["jti"], datetime.datetime.fromtimestamp(payload["exp"])
+        )
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid refresh token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    return issue_tokens(user, issued_at=datetime.datetime.now())
+
+
+def issue_tokens(user: user_model.DBUser, issued_at: datetime.datetime) -> user_model.Token:
     access_token_expires = datetime.timedelta(
         minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
     return user_model.Token(
         access_token=security.create_access_token(
-            data={"sub": user.id},
+            data={"sub": user.id, "gen": user.token_generation},
             expires_delta=access_token_expires,
         ),
         refresh_token=security.create_refresh_token(
-            data={"sub": user.id},
-            expires_delta=access_token_expires,
+            data={"sub": user.id, "gen": user.token_generation},
         ),
         token_type="Bearer",
         scope="",
         expires_in=settings.ACCESS_TOKEN_EXPIRE_MINUTES,
-        expires_at=datetime.datetime.now() + access_token_expires,
-        issued_at=user.last_login_date,
+        expires_at=issued_at + access_token_expires,
+        issued_at=issued_at,
         user_id=user.id,
-    )
\ No newline at end of file
+    )
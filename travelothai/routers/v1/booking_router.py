@@ -1,6 +1,9 @@
+import csv
+import io
 from datetime import datetime
-from fastapi import APIRouter, Depends, HTTPException, Response
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from typing import AsyncIterator, List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from travelothai.core.config import get_settings
@@ -9,10 +12,13 @@ from travelothai.services.booking_services.MockBookingService import MockBooking
 from travelothai.services.booking_services.DBBookingService import DBBookingService
 
 from travelothai.schemas import booking_schema
-from travelothai.models import get_session
+from travelothai.models import get_session, get_read_session
 
 router = APIRouter(prefix="/bookings", tags=["bookings"])
 
+# Rows serialized into each chunk of a streamed export
+EXPORT_CHUNK_ROWS = 500
+
 
 def get_booking_service(session: AsyncSession = Depends(get_session)) -> BookingServiceInterface:
     settings = get_settings()
@@ -20,6 +26,12 @@ def get_booking_service(session: AsyncSession = Depends(get_session)) -> Booking
         return MockBookingService()
     return DBBookingService(session=session)
 
+def get_booking_read_service(session: AsyncSession = Depends(get_read_session)) -> BookingServiceInterface:
+    settings = get_settings()
+    if settings.USE_MOCK:
+        return MockBookingService()
+    return DBBookingService(session=session)
+
 # Booking endpoints
 @router.get(
         "/",
@@ -27,19 +39,74 @@ def get_booking_service(session: AsyncSession = Depends(get_session)) -> Booking
         description="Retrieve a list of all bookings available in the system.",
         response_model=list[booking_schema.Booking]
     )
-async def read_bookings(booking_service: BookingServiceInterface = Depends(get_booking_service)) -> List[booking_schema.Booking]:
+async def read_bookings(booking_service: BookingServiceInterface = Depends(get_booking_read_service)) -> List[booking_schema.Booking]:
     bookings = await booking_service.list_bookings()
     if not bookings:
         raise HTTPException(status_code=404, detail="No bookings found")
     return bookings
 
+async def _ndjson_chunks(bookings: AsyncIterator[booking_schema.Booking]) -> AsyncIterator[str]:
+    lines = []
+    async for booking in bookings:
+        lines.append(booking_schema.Booking.model_validate(booking).model_dump_json())
+        if len(lines) >= EXPORT_CHUNK_ROWS:
+            yield "\n".join(lines) + "\n"
+            lines.clear()
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+async def _csv_chunks(bookings: AsyncIterator[booking_schema.Booking]) -> AsyncIterator[str]:
+    fields = list(booking_schema.Booking.model_fields)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    rows = 0
+    async for booking in bookings:
+        data = booking_schema.Booking.model_validate(booking).model_dump(mode="json")
+        writer.writerow([data[field] for field in fields])
+        rows += 1
+        if rows % EXPORT_CHUNK_ROWS == 0:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+@router.get(
+        "/export",
+        summary="Export bookings",
+        description=(
+            "Stream bookings created within `[start_date, end_date)` as NDJSON or CSV. "
+            "Rows are read with a server-side cursor, so memory use stays flat regardless of volume."
+        ),
+        response_class=StreamingResponse
+    )
+async def export_bookings(
+        format: booking_schema.BookingExportFormat = booking_schema.BookingExportFormat.NDJSON,
+        start_date: Optional[datetime] = Query(None, description="Only bookings created at or after this time"),
+        end_date: Optional[datetime] = Query(None, description="Only bookings created before this time"),
+        status: Optional[booking_schema.BookingStatus] = None,
+        booking_service: BookingServiceInterface = Depends(get_booking_read_service)
+    ) -> StreamingResponse:
+    bookings = booking_service.export_bookings(start_date=start_date, end_date=end_date, status=status)
+    if format == booking_schema.BookingExportFormat.CSV:
+        return StreamingResponse(
+            _csv_chunks(bookings),
+            media_type="text/csv",
+            headers={"Content-Disposition": 'attachment; filename="bookings.csv"'},
+        )
+    return StreamingResponse(
+        _ndjson_chunks(bookings),
+        media_type="application/x-ndjson",
+        headers={"Content-Disposition": 'attachment; filename="bookings.ndjson"'},
+    )
+
 @router.get(
         "/{booking_id}",
         summary="Get a specific booking",
         description="Retrieve details of a specific booking by its ID.",
         response_model=booking_schema.Booking
     )
-async def read_booking(booking_id: int, booking_service: BookingServiceInterface = Depends(get_booking_service)) -> Optional[booking_schema.Booking]:
+async def read_booking(booking_id: int, booking_service: BookingServiceInterface = Depends(get_booking_read_service)) -> Optional[booking_schema.Booking]:
     booking = await booking_service.get_booking(booking_id)
     if booking is None:
         raise HTTPException(status_code=404, detail="Booking not found")
@@ -54,6 +121,20 @@ async def read_booking(booking_id: int, booking_service: BookingServiceInterface
 async def create_booking(booking: booking_schema.BookingCreate, booking_service: BookingServiceInterface = Depends(get_booking_service)) -> booking_schema.Booking:
     return await booking_service.create_booking(booking)
 
+@router.post(
+        "/quote",
+        summary="Quote booking prices",
+        description=(
+            "Price up to `QUOTE_MAX_HOTELS` (hotel_id, ticket_id) pairs the way a booking would be priced, "
+            "without creating anything. Pairs with an unknown hotel or ticket come back with an `error`."
+        ),
+        response_model=list[booking_schema.BookingQuote]
+    )
+async def quote_bookings(items: List[booking_schema.BookingQuoteRequest], booking_service: BookingServiceInterface = Depends(get_booking_read_service)) -> List[booking_schema.BookingQuote]:
+    if len(items) > get_settings().QUOTE_MAX_HOTELS:
+        raise HTTPException(status_code=413, detail=f"At most {get_settings().QUOTE_MAX_HOTELS} pairs per quote.")
+    return await booking_service.quote_bookings(items)
+
 @router.put(
         "/{booking_id}/cancel",
         summary="Cancel a booking",
@@ -74,7 +155,7 @@ async def cancel_booking(booking_id: int, booking_service: BookingServiceInterfa
         description="Retrieve all reschedule logs.",
         response_model=List[booking_schema.BookingRescheduleLog]
     )
-async def list_reschedule_logs(booking_service: BookingServiceInterface = Depends(get_booking_service)) -> List[booking_schema.BookingRescheduleLog]:
+async def list_reschedule_logs(booking_service: BookingServiceInterface = Depends(get_booking_read_service)) -> List[booking_schema.BookingRescheduleLog]:
     return await booking_service.list_reschedule_logs()
 
 @router.get(
@@ -83,7 +164,7 @@ async def list_reschedule_logs(booking_service: BookingServiceInterface = Depend
         description="Retrieve a specific reschedule log by booking ID.",
         response_model=List[booking_schema.BookingRescheduleLog]
     )
-async def get_reschedule_log(booking_id: int, booking_service: BookingServiceInterface = Depends(get_booking_service)) -> List[booking_schema.BookingRescheduleLog]:
+async def get_reschedule_log(booking_id: int, booking_service: BookingServiceInterface = Depends(get_booking_read_service)) -> List[booking_schema.BookingRescheduleLog]:
     log = await booking_service.get_reschedule_log(booking_id)
     if not log:
         raise HTTPException(status_code=404, detail="No reschedule log found for this booking")
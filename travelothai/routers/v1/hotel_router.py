@@ -1,14 +1,15 @@
-from fastapi import APIRouter, Depends, HTTPException, Response
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from travelothai.core import http_cache
 from travelothai.core.config import get_settings
 from travelothai.services.hotel_services.HotelServiceInterface import HotelServiceInterface
 from travelothai.services.hotel_services.MockHotelService import MockHotelService
 from travelothai.services.hotel_services.DBHotelService import DBHotelService
 
-from travelothai.schemas import hotel_schema
-from travelothai.models import get_session
+from travelothai.schemas import bulk_schema, hotel_schema
+from travelothai.models import get_session, get_read_session
 
 router = APIRouter(prefix="/hotels", tags=["hotels"])
 
@@ -19,14 +20,47 @@ def get_hotel_service(session: AsyncSession = Depends(get_session)) -> HotelServ
         return MockHotelService()
     return DBHotelService(session=session)
 
+def get_hotel_read_service(session: AsyncSession = Depends(get_read_session)) -> HotelServiceInterface:
+    settings = get_settings()
+    if settings.USE_MOCK:
+        return MockHotelService()
+    return DBHotelService(session=session)
+
 @router.get(
         "/",
         summary="List all hotels",
-        description="Retrieve a list of all hotels available in the system.",
+        description=(
+            "Retrieve a page of hotels ordered by ID. Pass the `X-Next-Cursor` header "
+            "of the previous page as `after` to fetch the next one."
+        ),
         response_model=list[hotel_schema.Hotel]
     )
-async def read_hotels(hotel_service: HotelServiceInterface = Depends(get_hotel_service)) -> List[hotel_schema.Hotel]:
-    return await hotel_service.list_hotels()
+async def read_hotels(
+        request: Request,
+        response: Response,
+        after: Optional[int] = Query(None, description="Return hotels with an ID greater than this cursor"),
+        limit: int = Query(50, ge=1, le=500),
+        province_id: Optional[int] = None,
+        min_price: Optional[float] = Query(None, ge=0),
+        max_price: Optional[float] = Query(None, ge=0),
+        name_prefix: Optional[str] = Query(None, min_length=1),
+        hotel_service: HotelServiceInterface = Depends(get_hotel_read_service)
+    ) -> List[hotel_schema.Hotel]:
+    hotels = await hotel_service.list_hotels(
+        after_id=after,
+        limit=limit,
+        province_id=province_id,
+        min_price=min_price,
+        max_price=max_price,
+        name_prefix=name_prefix,
+    )
+    not_modified = http_cache.conditional_page_response(request, response, hotels, get_settings().HOTELS_CACHE_CONTROL)
+    if not_modified:
+        return not_modified
+
+    if len(hotels) == limit:
+        response.headers["X-Next-Cursor"] = str(hotels[-1].id)
+    return hotels
 
 @router.get(
         "/{hotel_id}",
@@ -34,7 +68,7 @@ async def read_hotels(hotel_service: HotelServiceInterface = Depends(get_hotel_s
         description="Retrieve details of a specific hotel by its ID.",
         response_model=hotel_schema.Hotel
     )
-async def read_hotel(hotel_id: int, hotel_service: HotelServiceInterface = Depends(get_hotel_service)) -> Optional[hotel_schema.Hotel]:
+async def read_hotel(hotel_id: int, hotel_service: HotelServiceInterface = Depends(get_hotel_read_service)) -> Optional[hotel_schema.Hotel]:
     return await hotel_service.get_hotel(hotel_id)
 
 @router.post(
@@ -46,6 +80,20 @@ async def read_hotel(hotel_id: int, hotel_service: HotelServiceInterface = Depen
 async def create_hotel(hotel: hotel_schema.HotelCreate, hotel_service: HotelServiceInterface = Depends(get_hotel_service)) -> hotel_schema.Hotel:
     return await hotel_service.create_hotel(hotel)
 
+@router.post(
+        "/bulk",
+        summary="Create hotels in bulk",
+        description=(
+            "Create up to `BULK_MAX_ROWS` hotels in one transaction. Rows with an unknown "
+            "reference are skipped and reported with the reason, the others with their new ID."
+        ),
+        response_model=bulk_schema.BulkCreateResult
+    )
+async def create_hotels_bulk(hotels: List[hotel_schema.HotelCreate], hotel_service: HotelServiceInterface = Depends(get_hotel_service)) -> bulk_schema.BulkCreateResult:
+    if len(hotels) > get_settings().BULK_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"At most {get_settings().BULK_MAX_ROWS} hotels per request.")
+    return await hotel_service.create_hotels_bulk(hotels)
+
 @router.put(
         "/{hotel_id}",
         summary="Update a hotel",
@@ -1,14 +1,16 @@
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from travelothai.core import http_cache
 from travelothai.core.config import get_settings
 from travelothai.services.province_services.ProvinceServiceInterface import ProvinceServiceInterface
 from travelothai.services.province_services.MockProvinceService import MockProvinceService
 from travelothai.services.province_services.DBProvinceService import DBProvinceService
+from travelothai.services.province_services.CachedProvinceService import CachedProvinceService
 
-from travelothai.schemas import province_schema
-from travelothai.models import get_session
+from travelothai.schemas import bulk_schema, province_schema
+from travelothai.models import get_session, get_read_session
 
 router = APIRouter(prefix="/provinces", tags=["provinces"])
 
@@ -17,6 +19,16 @@ def get_province_service(session: AsyncSession = Depends(get_session)) -> Provin
     settings = get_settings()
     if settings.USE_MOCK:
         return MockProvinceService()
+    if settings.CACHE_ENABLED:
+        return CachedProvinceService(session=session)
+    return DBProvinceService(session=session)
+
+def get_province_read_service(session: AsyncSession = Depends(get_read_session)) -> ProvinceServiceInterface:
+    settings = get_settings()
+    if settings.USE_MOCK:
+        return MockProvinceService()
+    if settings.CACHE_ENABLED:
+        return CachedProvinceService(session=session)
     return DBProvinceService(session=session)
 
 # ProvinceCategory Endpoints
@@ -26,7 +38,13 @@ def get_province_service(session: AsyncSession = Depends(get_session)) -> Provin
         description="Retrieve a list of all province categories available in the system.",
         response_model=list[province_schema.ProvinceCategory]
     )
-async def read_province_categories(province_service: ProvinceServiceInterface = Depends(get_province_service)) -> List[province_schema.ProvinceCategory]:
+async def read_province_categories(request: Request, response: Response, province_service: ProvinceServiceInterface = Depends(get_province_read_service)) -> List[province_schema.ProvinceCategory]:
+    count, last_modified = await province_service.get_province_categories_version()
+    not_modified = http_cache.conditional_response(
+        request, response, count, last_modified, get_settings().PROVINCES_CACHE_CONTROL
+    )
+    if not_modified:
+        return not_modified
     categories = await province_service.list_province_categories()
     return categories
 
@@ -36,7 +54,7 @@ async def read_province_categories(province_service: ProvinceServiceInterface =
         description="Retrieve details of a specific province category by its ID.",
         response_model=province_schema.ProvinceCategory
     )
-async def read_province_category(category_id: int, province_service: ProvinceServiceInterface = Depends(get_province_service)) -> Optional[province_schema.ProvinceCategory]:
+async def read_province_category(category_id: int, province_service: ProvinceServiceInterface = Depends(get_province_read_service)) -> Optional[province_schema.ProvinceCategory]:
     category = await province_service.get_province_category(category_id)
     return category
 
@@ -77,7 +95,13 @@ async def delete_province_category(category_id: int, province_service: ProvinceS
         description="Retrieve a list of all provinces available in the system.",
         response_model=list[province_schema.Province]
     )
-async def read_provinces(province_service: ProvinceServiceInterface = Depends(get_province_service)) -> List[province_schema.Province]:
+async def read_provinces(request: Request, response: Response, province_service: ProvinceServiceInterface = Depends(get_province_read_service)) -> List[province_schema.Province]:
+    count, last_modified = await province_service.get_provinces_version()
+    not_modified = http_cache.conditional_response(
+        request, response, count, last_modified, get_settings().PROVINCES_CACHE_CONTROL
+    )
+    if not_modified:
+        return not_modified
     provinces = await province_service.list_provinces()
     return provinces
 
@@ -87,7 +111,7 @@ async def read_provinces(province_service: ProvinceServiceInterface = Depends(ge
         description="Retrieve details of a specific province by its ID.",
         response_model=province_schema.Province
     )
-async def read_province(province_id: int, province_service: ProvinceServiceInterface = Depends(get_province_service)) -> Optional[province_schema.Province]:
+async def read_province(province_id: int, province_service: ProvinceServiceInterface = Depends(get_province_read_service)) -> Optional[province_schema.Province]:
     province = await province_service.get_province(province_id)
     return province
 
@@ -100,6 +124,20 @@ async def read_province(province_id: int, province_service: ProvinceServiceInter
 async def create_province(province: province_schema.ProvinceCreate, province_service: ProvinceServiceInterface = Depends(get_province_service)) -> province_schema.Province:
     return await province_service.create_province(province)
 
+@router.post(
+        "/bulk",
+        summary="Create provinces in bulk",
+        description=(
+            "Create up to `BULK_MAX_ROWS` provinces in one transaction. Rows with an unknown "
+            "reference are skipped and reported with the reason, the others with their new ID."
+        ),
+        response_model=bulk_schema.BulkCreateResult
+    )
+async def create_provinces_bulk(provinces: List[province_schema.ProvinceCreate], province_service: ProvinceServiceInterface = Depends(get_province_service)) -> bulk_schema.BulkCreateResult:
+    if len(provinces) > get_settings().BULK_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"At most {get_settings().BULK_MAX_ROWS} provinces per request.")
+    return await province_service.create_provinces_bulk(provinces)
+
 @router.put(
         "/{province_id}",
         summary="Update a province",
@@ -0,0 +1,51 @@
+from fastapi import APIRouter, Depends, Query, Response
+from typing import List, Optional
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from travelothai.core.config import get_settings
+from travelothai.services.search_services.SearchServiceInterface import SearchServiceInterface
+from travelothai.services.search_services.MockSearchService import MockSearchService
+from travelothai.services.search_services.DBSearchService import DBSearchService
+
+from travelothai.schemas import search_schema
+from travelothai.models import get_read_session
+
+router = APIRouter(prefix="/search", tags=["search"])
+
+
+def get_search_service(session: AsyncSession = Depends(get_read_session)) -> SearchServiceInterface:
+    settings = get_settings()
+    if settings.USE_MOCK:
+        return MockSearchService()
+    return DBSearchService(session=session)
+
+@router.get(
+        "/hotels",
+        summary="Search hotels with ticket pricing",
+        description=(
+            "Hotels with their province and province category, priced for `ticket_id`: the usage rule "
+            "for the ticket's type and the hotel's category (when it allows the ticket) sets the discount. "
+            "`max_price` filters on the final price. Results are ordered by hotel ID; pass the "
+            "`X-Next-Cursor` header of the previous page as `after` to fetch the next one."
+        ),
+        response_model=list[search_schema.HotelSearchResult]
+    )
+async def search_hotels(
+        response: Response,
+        ticket_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        max_price: Optional[float] = Query(None, ge=0),
+        after: Optional[int] = Query(None, description="Return hotels with an ID greater than this cursor"),
+        limit: int = Query(50, ge=1, le=500),
+        search_service: SearchServiceInterface = Depends(get_search_service)
+    ) -> List[search_schema.HotelSearchResult]:
+    hotels = await search_service.search_hotels(
+        ticket_id=ticket_id,
+        category_id=category_id,
+        max_price=max_price,
+        after_id=after,
+        limit=limit,
+    )
+    if len(hotels) == limit:
+        response.headers["X-Next-Cursor"] = str(hotels[-1].id)
+    return hotels
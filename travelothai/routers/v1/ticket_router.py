@@ -1,14 +1,16 @@
-from fastapi import APIRouter, Depends, Response
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from typing import List, Optional
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from travelothai.core import http_cache
 from travelothai.core.config import get_settings
 from travelothai.services.ticket_services.TicketServiceInterface import TicketServiceInterface
 from travelothai.services.ticket_services.MockTicketService import MockTicketService
 from travelothai.services.ticket_services.DBTicketService import DBTicketService
+from travelothai.services.ticket_services.CachedTicketService import CachedTicketService
 
-from travelothai.schemas import ticket_schema
-from travelothai.models import get_session
+from travelothai.schemas import bulk_schema, ticket_schema
+from travelothai.models import get_session, get_read_session
 
 router = APIRouter(prefix="/tickets", tags=["tickets"])
 
@@ -17,6 +19,16 @@ def get_ticket_service(session: AsyncSession = Depends(get_session)) -> TicketSe
     settings = get_settings()
     if settings.USE_MOCK:
         return MockTicketService()
+    if settings.CACHE_ENABLED:
+        return CachedTicketService(session=session)
+    return DBTicketService(session=session)
+
+def get_ticket_read_service(session: AsyncSession = Depends(get_read_session)) -> TicketServiceInterface:
+    settings = get_settings()
+    if settings.USE_MOCK:
+        return MockTicketService()
+    if settings.CACHE_ENABLED:
+        return CachedTicketService(session=session)
     return DBTicketService(session=session)
 
 
@@ -27,7 +39,13 @@ def get_ticket_service(session: AsyncSession = Depends(get_session)) -> TicketSe
         description="Retrieve a list of all ticket types available in the system.",
         response_model=list[ticket_schema.TicketType]
     )
-async def read_ticket_types(ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> List[ticket_schema.TicketType]:
+async def read_ticket_types(request: Request, response: Response, ticket_service: TicketServiceInterface = Depends(get_ticket_read_service)) -> List[ticket_schema.TicketType]:
+    count, last_modified = await ticket_service.get_ticket_types_version()
+    not_modified = http_cache.conditional_response(
+        request, response, count, last_modified, get_settings().TICKETS_CACHE_CONTROL
+    )
+    if not_modified:
+        return not_modified
     return await ticket_service.list_ticket_types()
 
 @router.get(
@@ -36,7 +54,7 @@ async def read_ticket_types(ticket_service: TicketServiceInterface = Depends(get
         description="Retrieve details of a specific ticket type by its ID.",
         response_model=ticket_schema.TicketType
     )
-async def read_ticket_type(type_id: int, ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> Optional[ticket_schema.TicketType]:
+async def read_ticket_type(type_id: int, ticket_service: TicketServiceInterface = Depends(get_ticket_read_service)) -> Optional[ticket_schema.TicketType]:
     return await ticket_service.get_ticket_type(type_id)
 
 @router.post(
@@ -75,7 +93,7 @@ async def delete_ticket_type(type_id: int, ticket_service: TicketServiceInterfac
         description="Retrieve a list of all ticket usage rules available in the system.",
         response_model=list[ticket_schema.TicketUsageRule]
     )
-async def read_ticket_usage_rules(ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> List[ticket_schema.TicketUsageRule]:
+async def read_ticket_usage_rules(ticket_service: TicketServiceInterface = Depends(get_ticket_read_service)) -> List[ticket_schema.TicketUsageRule]:
     return await ticket_service.list_ticket_usage_rules()
 
 @router.get(
@@ -84,7 +102,7 @@ async def read_ticket_usage_rules(ticket_service: TicketServiceInterface = Depen
         description="Retrieve details of a specific ticket usage rule by its ID.",
         response_model=ticket_schema.TicketUsageRule
     )
-async def read_ticket_usage_rule(rule_id: int, ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> Optional[ticket_schema.TicketUsageRule]:
+async def read_ticket_usage_rule(rule_id: int, ticket_service: TicketServiceInterface = Depends(get_ticket_read_service)) -> Optional[ticket_schema.TicketUsageRule]:
     return await ticket_service.get_ticket_usage_rule(rule_id)
 
 @router.post(
@@ -123,7 +141,7 @@ async def delete_ticket_usage_rule(rule_id: int, ticket_service: TicketServiceIn
         description="Retrieve a list of all ticket types associated with a specific ticket campaign.",
         response_model=list[ticket_schema.TicketCampaignTicketType]
     )
-async def read_ticket_campaign_ticket_types(ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> List[ticket_schema.TicketCampaignTicketType]:
+async def read_ticket_campaign_ticket_types(ticket_service: TicketServiceInterface = Depends(get_ticket_read_service)) -> List[ticket_schema.TicketCampaignTicketType]:
     return await ticket_service.list_ticket_campaign_ticket_types()
 
 @router.get(
@@ -132,7 +150,7 @@ async def read_ticket_campaign_ticket_types(ticket_service: TicketServiceInterfa
         description="Retrieve details of a specific ticket type associated with a specific ticket campaign.",
         response_model=ticket_schema.TicketCampaignTicketType
     )
-async def read_ticket_campaign_ticket_type(tctt_id: int, ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> Optional[ticket_schema.TicketCampaignTicketType]:
+async def read_ticket_campaign_ticket_type(tctt_id: int, ticket_service: TicketServiceInterface = Depends(get_ticket_read_service)) -> Optional[ticket_schema.TicketCampaignTicketType]:
     return await ticket_service.get_ticket_campaign_ticket_type(tctt_id)
 
 @router.post(
@@ -171,7 +189,7 @@ async def delete_ticket_campaign_ticket_type(tctt_id: int, ticket_service: Ticke
         description="Retrieve a list of all ticket campaigns available in the system.",
         response_model=list[ticket_schema.TicketCampaign]
     )
-async def read_ticket_campaigns(ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> List[ticket_schema.TicketCampaign]:
+async def read_ticket_campaigns(ticket_service: TicketServiceInterface = Depends(get_ticket_read_service)) -> List[ticket_schema.TicketCampaign]:
     return await ticket_service.list_ticket_campaigns()
 
 @router.get(
@@ -180,7 +198,7 @@ async def read_ticket_campaigns(ticket_service: TicketServiceInterface = Depends
         description="Retrieve details of a specific ticket campaign by its ID.",
         response_model=ticket_schema.TicketCampaign
     )
-async def read_ticket_campaign(campaign_id: int, ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> Optional[ticket_schema.TicketCampaign]:
+async def read_ticket_campaign(campaign_id: int, ticket_service: TicketServiceInterface = Depends(get_ticket_read_service)) -> Optional[ticket_schema.TicketCampaign]:
     return await ticket_service.get_ticket_campaign(campaign_id)
 
 @router.post(
@@ -237,7 +255,7 @@ async def delete_ticket_campaign(campaign_id: int, ticket_service: TicketService
         description="Retrieve a list of all tickets available in the system.",
         response_model=list[ticket_schema.Ticket]
     )
-async def read_tickets(ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> List[ticket_schema.Ticket]:
+async def read_tickets(ticket_service: TicketServiceInterface = Depends(get_ticket_read_service)) -> List[ticket_schema.Ticket]:
     return await ticket_service.list_tickets()
 
 @router.get(
@@ -246,7 +264,7 @@ async def read_tickets(ticket_service: TicketServiceInterface = Depends(get_tick
         description="Retrieve details of a specific ticket by its ID.",
         response_model=ticket_schema.Ticket
     )
-async def read_ticket(ticket_id: int, ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> Optional[ticket_schema.Ticket]:
+async def read_ticket(ticket_id: int, ticket_service: TicketServiceInterface = Depends(get_ticket_read_service)) -> Optional[ticket_schema.Ticket]:
     return await ticket_service.get_ticket(ticket_id)
 
 @router.post(
@@ -258,6 +276,20 @@ async def read_ticket(ticket_id: int, ticket_service: TicketServiceInterface = D
 async def create_ticket(ticket: ticket_schema.TicketCreate, ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> ticket_schema.Ticket:
     return await ticket_service.create_ticket(ticket)
 
+@router.post(
+        "/bulk",
+        summary="Create tickets in bulk",
+        description=(
+            "Create up to `BULK_MAX_ROWS` tickets in one transaction. Rows with an unknown "
+            "reference are skipped and reported with the reason, the others with their new ID."
+        ),
+        response_model=bulk_schema.BulkCreateResult
+    )
+async def create_tickets_bulk(tickets: List[ticket_schema.TicketCreate], ticket_service: TicketServiceInterface = Depends(get_ticket_service)) -> bulk_schema.BulkCreateResult:
+    if len(tickets) > get_settings().BULK_MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"At most {get_settings().BULK_MAX_ROWS} tickets per request.")
+    return await ticket_service.create_tickets_bulk(tickets)
+
 @router.put(
         "/{ticket_id}",
         summary="Update a ticket",
@@ -1,5 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy import or_
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import select
 
 from typing import Annotated
@@ -10,6 +12,33 @@ from travelothai.models import user_model, get_session
 router = APIRouter(prefix="/users", tags=["users"])
 
 
+async def _username_or_email_taken(
+    session: AsyncSession, username: str, email: str, exclude_id: int | None = None
+) -> bool:
+    statement = select(user_model.DBUser.id).where(
+        or_(
+            user_model.DBUser.username == username,
+            user_model.DBUser.email == email,
+        )
+    )
+    if exclude_id is not None:
+        statement = statement.where(user_model.DBUser.id != exclude_id)
+    result = await session.exec(statement)
+    return result.first() is not None
+
+
+async def _commit_unique(session: AsyncSession) -> None:
+    # A concurrent request can take the name between the check and the commit; the unique indexes catch it
+    try:
+        await session.commit()
+    except IntegrityError:
+        await session.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="This username or email is exists.",
+        )
+
+
 @router.get("/me")
 def get_me(current_user: user_model.User = Depends(deps.get_current_user)) -> user_model.User:
     return current_user
@@ -37,22 +66,16 @@ async def create(
     session: Annotated[AsyncSession, Depends(get_session)],
 ) -> user_model.User:
 
-    result = await session.exec(
-        select(user_model.DBUser).where(user_model.DBUser.username == user_info.username)
-    )
-
-    user = result.one_or_none()
-
-    if user:
+    if await _username_or_email_taken(session, user_info.username, user_info.email):
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
-            detail="This username is exists.",
+            detail="This username or email is exists.",
         )
 
     user = user_model.DBUser.model_validate(user_info)
     await user.set_password(user_info.password)
     session.add(user)
-    await session.commit()
+    await _commit_unique(session)
 
     return user
 
@@ -64,25 +87,27 @@ async def change_password(user_id: str,
     current_user: user_model.User = Depends(deps.get_current_user),
 ) -> dict:
 
-    result = await session.get(user_model.DBUser, user_id)
-
-    user = result.one_or_none()
+    user = await session.get(user_model.DBUser, user_id)
 
-    if user:
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found this user",
         )
 
-    if not user.verify_password(password_update.current_password):
+    if not await user.verify_password(password_update.current_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect password",
         )
 
-    user.set_password(password_update.new_password)
+    await user.set_password(password_update.new_password)
+    # Revokes every access and refresh token issued before the change
+    user.token_generation += 1
     session.add(user)
     await session.commit()
+    deps.invalidate_user_tokens(user.id)
+    return {"detail": "Password changed"}
 
 
 @router.put("/{user_id}/update")
@@ -97,21 +122,28 @@ async def update(
 
     db_user = await session.get(user_model.DBUser, user_id)
 
-    if db_user:
+    if not db_user:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Not found this user",
         )
 
-    if not db_user.verify_password(password_update.current_password):
+    if not await db_user.verify_password(password_update.current_password):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect password",
         )
 
-    db_user.sqlmodel_update(user_update)
+    if await _username_or_email_taken(session, user_update.username, user_update.email, exclude_id=db_user.id):
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="This username or email is exists.",
+        )
+
+    # Roles are not stored on DBUser
+    db_user.sqlmodel_update(user_update.model_dump(exclude={"roles"}))
     session.add(db_user)
-    await session.commit()
-    await session.refresh(db_user)
+    await _commit_unique(session)
+    deps.invalidate_user_tokens(db_user.id)
 
     return db_user
\ No newline at end of file
@@ -10,6 +10,11 @@ class BookingStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
+class BookingExportFormat(str, Enum):
+    NDJSON = "ndjson"
+    CSV = "csv"
+
+
 # Booking schema
 class BookingBase(BaseModel):
     hotel_id: int
@@ -41,6 +46,19 @@ class Booking(BookingBase):
     model_config = config.ConfigDict(from_attributes=True)
 
 
+# Booking price quote schema
+class BookingQuoteRequest(BaseModel):
+    hotel_id: int
+    ticket_id: Optional[int] = None
+
+class BookingQuote(BookingQuoteRequest):
+    category_id: Optional[int] = None
+    price: Optional[float] = None
+    discount_amount: Optional[float] = None
+    final_price: Optional[float] = None
+    error: Optional[str] = None
+
+
 # BookingRescheduleLog schema
 class BookingRescheduleLogBase(BaseModel):
     booking_id: int
@@ -0,0 +1,25 @@
+from typing import Dict, List, Optional
+from pydantic import BaseModel
+
+
+# Bulk create schema
+class BulkRowResult(BaseModel):
+    index: int
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+class BulkCreateResult(BaseModel):
+    created: int
+    failed: int
+    results: List[BulkRowResult]
+
+    @classmethod
+    def from_rows(cls, total: int, errors: Dict[int, str], ids: List[int]) -> "BulkCreateResult":
+        """Merge the rejected rows and the IDs of the inserted ones (in submission order)."""
+        inserted = iter(ids)
+        results = [
+            BulkRowResult(index=index, error=errors[index]) if index in errors
+            else BulkRowResult(index=index, id=next(inserted))
+            for index in range(total)
+        ]
+        return cls(created=len(ids), failed=len(errors), results=results)
@@ -0,0 +1,16 @@
+from pydantic import BaseModel, config
+
+
+# Hotel search schema
+class HotelSearchResult(BaseModel):
+    id: int
+    name: str
+    province_id: int
+    province_name: str
+    category_id: int
+    category_name: str
+    price: float
+    discount_amount: float
+    final_price: float
+
+    model_config = config.ConfigDict(from_attributes=True)
@@ -0,0 +1,278 @@
+"""Deterministic synthetic data for load and performance testing.
+
+The same `--seed`, counts and `--base-date` always produce the same rows. Rows are
+generated lazily and written with executemany in batched transactions, so memory
+stays flat however many rows are requested.
+
+Usage:
+    python -m travelothai.seed [--reset] [--hotels N] [--tickets N] [--bookings N] ...
+"""
+import argparse
+import asyncio
+import logging
+import random
+import sys
+import time
+from array import array
+from datetime import datetime, timedelta
+from itertools import islice
+from typing import Callable, Dict, Iterable, Iterator, Optional
+
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlmodel import SQLModel
+
+from travelothai import models
+from travelothai.models import booking_model, hotel_model, province_model, ticket_model
+
+# All 77 provinces of Thailand
+PROVINCES = (
+    "กรุงเทพมหานคร", "กระบี่", "กาญจนบุรี", "กาฬสินธุ์", "กำแพงเพชร", "ขอนแก่น", "จันทบุรี",
+    "ฉะเชิงเทรา", "ชลบุรี", "ชัยนาท", "ชัยภูมิ", "ชุมพร", "เชียงราย", "เชียงใหม่", "ตรัง", "ตราด",
+    "ตาก", "นครนายก", "นครปฐม", "นครพนม", "นครราชสีมา", "นครศรีธรรมราช", "นครสวรรค์", "นนทบุรี",
+    "นราธิวาส", "น่าน", "บึงกาฬ", "บุรีรัมย์", "ปทุมธานี", "ประจวบคีรีขันธ์", "ปราจีนบุรี", "ปัตตานี",
+    "พระนครศรีอยุธยา", "พะเยา", "พังงา", "พัทลุง", "พิจิตร", "พิษณุโลก", "เพชรบุรี", "เพชรบูรณ์",
+    "แพร่", "ภูเก็ต", "มหาสารคาม", "มุกดาหาร", "แม่ฮ่องสอน", "ยโสธร", "ยะลา", "ร้อยเอ็ด", "ระนอง",
+    "ระยอง", "ราชบุรี", "ลพบุรี", "ลำปาง", "ลำพูน", "เลย", "ศรีสะเกษ", "สกลนคร", "สงขลา", "สตูล",
+    "สมุทรปราการ", "สมุทรสงคราม", "สมุทรสาคร", "สระแก้ว", "สระบุรี", "สิงห์บุรี", "สุโขทัย",
+    "สุพรรณบุรี", "สุราษฎร์ธานี", "สุรินทร์", "หนองคาย", "หนองบัวลำภู", "อ่างทอง", "อำนาจเจริญ",
+    "อุดรธานี", "อุตรดิตถ์", "อุทัยธานี", "อุบลราชธานี",
+)
+CATEGORY_NAMES = ("เมืองหลัก", "เมืองรอง")
+
+DEFAULT_COUNTS = {
+    "categories": 2,
+    "hotels": 200_000,
+    "ticket_types": 5,
+    "campaigns": 20,
+    "tickets": 2_000_000,
+    "bookings": 2_000_000,
+    "reschedule_logs": 200_000,
+}
+DEFAULT_BATCH_SIZE = 50_000
+DEFAULT_BASE_DATE = datetime(2025, 1, 1)
+
+
+def _batches(rows: Iterable[dict], size: int) -> Iterator[list]:
+    rows = iter(rows)
+    while batch := list(islice(rows, size)):
+        yield batch
+
+
+class Seeder:
+    """Generates every table from one random.Random, in dependency order.
+
+    Attributes that later tables depend on (hotel prices, ticket types, province
+    categories) are kept in compact arrays so bookings can be priced consistently.
+    """
+
+    def __init__(self, counts: Dict[str, int], seed: int = 42, base_date: datetime = DEFAULT_BASE_DATE):
+        self.counts = {**DEFAULT_COUNTS, **counts}
+        self.rng = random.Random(seed)
+        self.base_date = base_date
+        self.stamps = {"created_at": base_date, "updated_at": base_date}
+        self.province_category = array("H", [0])
+        self.hotel_price = array("d", [0.0])
+        self.hotel_province = array("H", [0])
+        self.ticket_type = array("H", [0])
+        self.tax_reduction: Dict[tuple, float] = {}
+
+    def categories(self) -> Iterator[dict]:
+        for i in range(1, self.counts["categories"] + 1):
+            name = CATEGORY_NAMES[i - 1] if i <= len(CATEGORY_NAMES) else f"หมวด {i}"
+            yield {"id": i, "name": name, **self.stamps}
+
+    def provinces(self) -> Iterator[dict]:
+        for i, name in enumerate(PROVINCES, start=1):
+            category_id = self.rng.randint(1, self.counts["categories"])
+            self.province_category.append(category_id)
+            yield {"id": i, "name": name, "category_id": category_id, **self.stamps}
+
+    def hotels(self) -> Iterator[dict]:
+        rng = self.rng
+        for i in range(1, self.counts["hotels"] + 1):
+            province_id = rng.randint(1, len(PROVINCES))
+            price = float(rng.randrange(500, 15_000, 50))
+            self.hotel_province.append(province_id)
+            self.hotel_price.append(price)
+            yield {"id": i, "name": f"โรงแรม {i}", "province_id": province_id, "price": price, **self.stamps}
+
+    def ticket_types(self) -> Iterator[dict]:
+        for i in range(1, self.counts["ticket_types"] + 1):
+            yield {"id": i, "name": f"Ticket Type {i}", **self.stamps}
+
+    def usage_rules(self) -> Iterator[dict]:
+        for type_id in range(1, self.counts["ticket_types"] + 1):
+            for category_id in range(1, self.counts["categories"] + 1):
+                tax_reduction = self.rng.choice((0.0, 0.1, 0.2, 0.3, 0.4))
+                self.tax_reduction[(type_id, category_id)] = tax_reduction
+                yield {
+                    "ticket_type_id": type_id, "category_id": category_id,
+                    "allowance": tax_reduction > 0, "tax_reduction": tax_reduction, **self.stamps,
+                }
+
+    def campaigns(self) -> Iterator[dict]:
+        for i in range(1, self.counts["campaigns"] + 1):
+            yield {
+                "id": i, "name": f"Campaign {i}", "limit": self.rng.randrange(1_000, 100_000, 1_000),
+                "registered": 0, "is_active": self.rng.random() < 0.8, **self.stamps,
+            }
+
+    def campaign_ticket_types(self) -> Iterator[dict]:
+        for campaign_id in range(1, self.counts["campaigns"] + 1):
+            for type_id in self.rng.sample(range(1, self.counts["ticket_types"] + 1), k=min(2, self.counts["ticket_types"])):
+                yield {
+                    "campaign_id": campaign_id, "ticket_type_id": type_id, "amount": self.rng.randint(1, 10),
+                    "expiration_date": self.base_date + timedelta(days=self.rng.randint(30, 365)), **self.stamps,
+                }
+
+    def tickets(self) -> Iterator[dict]:
+        rng = self.rng
+        for i in range(1, self.counts["tickets"] + 1):
+            type_id = rng.randint(1, self.counts["ticket_types"])
+            amount = rng.randint(1, 10)
+            self.ticket_type.append(type_id)
+            yield {
+                "id": i, "user_id": rng.randint(1, 100_000), "ticket_type_id": type_id,
+                "campaign_id": rng.randint(1, self.counts["campaigns"]) if self.counts["campaigns"] else None,
+                "amount": amount, "used": rng.randint(0, amount),
+                "expires_at": self.base_date + timedelta(days=rng.randint(30, 365)), **self.stamps,
+            }
+
+    def bookings(self) -> Iterator[dict]:
+        rng = self.rng
+        statuses = [status.value for status in booking_model.BookingStatus]
+        for i in range(1, self.counts["bookings"] + 1):
+            hotel_id = rng.randint(1, self.counts["hotels"])
+            ticket_id = rng.randint(1, self.counts["tickets"])
+            price = self.hotel_price[hotel_id]
+            category_id = self.province_category[self.hotel_province[hotel_id]]
+            discount = price * self.tax_reduction.get((self.ticket_type[ticket_id], category_id), 0.0)
+            created_at = self.base_date + timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+            yield {
+                "id": i, "hotel_id": hotel_id, "user_id": rng.randint(1, 100_000), "ticket_id": ticket_id,
+                "travel_date": created_at + timedelta(days=rng.randint(1, 90)),
+                "price": price, "discount_amount": discount, "final_price": price - discount,
+                "status": rng.choices(statuses, weights=(80, 10, 10))[0],
+                "created_at": created_at, "updated_at": created_at,
+            }
+
+    def reschedule_logs(self) -> Iterator[dict]:
+        rng = self.rng
+        for i in range(1, self.counts["reschedule_logs"] + 1):
+            previous = self.base_date + timedelta(days=rng.randint(1, 365))
+            yield {
+                "id": i, "booking_id": rng.randint(1, self.counts["bookings"]),
+                "previous_travel_date": previous, "new_travel_date": previous + timedelta(days=rng.randint(1, 30)),
+                "reason": rng.choice((None, "Change of plans", "Weather", "Flight rescheduled")),
+                **self.stamps,
+            }
+
+    def tables(self):
+        """(table, row generator) pairs in foreign key order."""
+        return (
+            (province_model.ProvinceCategory.__table__, self.categories),
+            (province_model.Province.__table__, self.provinces),
+            (hotel_model.Hotel.__table__, self.hotels),
+            (ticket_model.TicketType.__table__, self.ticket_types),
+            (ticket_model.TicketUsageRule.__table__, self.usage_rules),
+            (ticket_model.TicketCampaign.__table__, self.campaigns),
+            (ticket_model.TicketCampaignTicketType.__table__, self.campaign_ticket_types),
+            (ticket_model.Ticket.__table__, self.tickets),
+            (booking_model.Booking.__table__, self.bookings),
+            (booking_model.BookingRescheduleLog.__table__, self.reschedule_logs),
+        )
+
+
+async def _advance_sequences(conn, tables) -> None:
+    """Move each serial `id` sequence past the explicit keys the seeder wrote, so API inserts don't collide."""
+    for table in tables:
+        if "id" not in table.c:
+            continue
+        # Empty tables keep their sequence as is
+        await conn.execute(
+            select(func.setval(func.pg_get_serial_sequence(table.name, "id"), func.max(table.c.id)))
+            .select_from(table)
+            .having(func.count() > 0)
+        )
+    await conn.commit()
+
+
+async def seed(
+    engine: AsyncEngine,
+    counts: Optional[Dict[str, int]] = None,
+    seed: int = 42,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    base_date: datetime = DEFAULT_BASE_DATE,
+    progress: Optional[Callable[[str, int, float], None]] = None,
+) -> Dict[str, int]:
+    """Insert synthetic rows into an empty database and return the row count per table."""
+    seeder = Seeder(counts or {}, seed=seed, base_date=base_date)
+    inserted = {}
+    async with engine.connect() as conn:
+        synchronous = None
+        if conn.dialect.name == "sqlite":
+            # Bulk load: skip the per-commit fsync, the data can be regenerated
+            synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+            await conn.execute(text("PRAGMA synchronous = OFF"))
+        try:
+            for table, rows in seeder.tables():
+                start = time.perf_counter()
+                inserted[table.name] = 0
+                for batch in _batches(rows(), batch_size):
+                    await conn.execute(table.insert(), batch)
+                    await conn.commit()
+                    inserted[table.name] += len(batch)
+                if progress:
+                    progress(table.name, inserted[table.name], time.perf_counter() - start)
+            if conn.dialect.name == "postgresql":
+                await _advance_sequences(conn, [table for table, _ in seeder.tables()])
+        finally:
+            if synchronous is not None:
+                # The connection goes back to the pool; later writers must keep their fsync
+                await conn.rollback()
+                await conn.execute(text(f"PRAGMA synchronous = {int(synchronous)}"))
+                await conn.commit()
+    return inserted
+
+
+async def _main(args) -> int:
+    # Full batches are expected to cross the slow-query threshold
+    logging.getLogger("travelothai.sql").setLevel(logging.ERROR)
+    await models.init_db()
+    try:
+        if args.reset:
+            async with models.engine.begin() as conn:
+                await conn.run_sync(SQLModel.metadata.drop_all)
+                await conn.run_sync(SQLModel.metadata.create_all)
+        else:
+            async with models.engine.connect() as conn:
+                existing = (await conn.execute(select(func.count()).select_from(province_model.Province.__table__))).scalar()
+            if existing:
+                print("The database already has provinces; pass --reset to drop and recreate the tables.", file=sys.stderr)
+                return 1
+
+        counts = {name: getattr(args, name) for name in DEFAULT_COUNTS}
+        start = time.perf_counter()
+        inserted = await seed(
+            models.engine, counts, seed=args.seed, batch_size=args.batch_size,
+            base_date=datetime.fromisoformat(args.base_date),
+            progress=lambda table, rows, elapsed: print(f"{table:<28}{rows:>12,} rows {elapsed:8.1f} s"),
+        )
+        elapsed = time.perf_counter() - start
+        total = sum(inserted.values())
+        print(f"{'total':<28}{total:>12,} rows {elapsed:8.1f} s ({total / elapsed:,.0f} rows/s)")
+    finally:
+        await models.close_db()
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reset", action="store_true", help="drop and recreate every table first")
+    for name, default in DEFAULT_COUNTS.items():
+        parser.add_argument(f"--{name.replace('_', '-')}", dest=name, type=int, default=default)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--base-date", default=DEFAULT_BASE_DATE.date().isoformat())
+    sys.exit(asyncio.run(_main(parser.parse_args())))
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from travelothai.schemas import booking_schema
 
@@ -17,11 +17,26 @@ class BookingServiceInterface(ABC):
         """Get a specific booking by ID."""
         pass
 
+    @abstractmethod
+    def export_bookings(
+        self,
+        start_date: Optional[datetime.datetime] = None,
+        end_date: Optional[datetime.datetime] = None,
+        status: Optional[booking_schema.BookingStatus] = None,
+    ) -> AsyncIterator[booking_schema.Booking]:
+        """Stream bookings created within the date range, one row at a time."""
+        pass
+
     @abstractmethod
     async def create_booking(self, booking: booking_schema.BookingCreate) -> booking_schema.Booking:
         """Create a new booking."""
         pass
 
+    @abstractmethod
+    async def quote_bookings(self, items: List[booking_schema.BookingQuoteRequest]) -> List[booking_schema.BookingQuote]:
+        """Price (hotel, ticket) pairs as bookings would be priced, without writing anything."""
+        pass
+
     @abstractmethod
     async def cancel_booking(self, booking_id: int) -> Optional[booking_schema.Booking]:
         """Cancel an existing booking."""
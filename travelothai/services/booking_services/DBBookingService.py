@@ -1,16 +1,21 @@
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from fastapi import HTTPException
 
 from .BookingServiceInterface import BookingServiceInterface
 from travelothai.schemas import booking_schema
-from travelothai.models import booking_model, hotel_model, ticket_model
+from travelothai.models import booking_model, hotel_model, province_model, ticket_model
+from travelothai.services.pricing_services.PricingEngine import PricingEngine
 
+from sqlalchemy import update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
 
 class DBBookingService(BookingServiceInterface):
+    # Rows fetched per round trip while streaming an export
+    EXPORT_BATCH_SIZE = 1000
+
     def __init__(self, session: AsyncSession):
         self.session = session
 
@@ -30,62 +35,93 @@ class DBBookingService(BookingServiceInterface):
         booking = result.scalar()
         return booking
 
+    async def export_bookings(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        status: Optional[booking_schema.BookingStatus] = None,
+    ) -> AsyncIterator[booking_schema.Booking]:
+        statement = select(booking_model.Booking)
+        if start_date is not None:
+            statement = statement.where(booking_model.Booking.created_at >= start_date)
+        if end_date is not None:
+            statement = statement.where(booking_model.Booking.created_at < end_date)
+        if status is not None:
+            statement = statement.where(booking_model.Booking.status == status)
+        statement = statement.order_by(booking_model.Booking.id).execution_options(yield_per=self.EXPORT_BATCH_SIZE)
+
+        try:
+            result = await self.session.stream_scalars(statement)
+            async for booking in result:
+                yield booking
+        finally:
+            # The response body is streamed after the request's session dependency has
+            # exited, so release the connection held by the server-side cursor here.
+            await self.session.close()
+
+    async def _get_pricing_context(self, hotel_id: int, ticket_id: Optional[int]):
+        """Load the hotel price, its province category and the ticket in one query.
+
+        Returns None when the hotel does not exist; the ticket is None when it does not exist.
+        """
+        statement = (
+            select(hotel_model.Hotel.price, province_model.Province.category_id, ticket_model.Ticket)
+            .select_from(hotel_model.Hotel)
+            .join(province_model.Province, province_model.Province.id == hotel_model.Hotel.province_id)
+            .outerjoin(ticket_model.Ticket, ticket_model.Ticket.id == ticket_id)
+            .where(hotel_model.Hotel.id == hotel_id)
+        )
+        result = await self.session.exec(statement)
+        return result.first()
+
     async def create_booking(self, booking: booking_schema.BookingCreate) -> booking_schema.Booking:
         if not booking.hotel_id:
             raise HTTPException(status_code=400, detail="Hotel ID must be provided for booking creation.")
 
-        db_hotel = await self.session.get(hotel_model.Hotel, booking.hotel_id)
-        if not db_hotel:
+        pricing = await self._get_pricing_context(booking.hotel_id, booking.ticket_id)
+        if not pricing:
             raise HTTPException(status_code=404, detail=f"Hotel with ID {booking.hotel_id} does not exist.")
+        hotel_price, category_id, db_ticket = pricing
 
         db_booking = booking_model.Booking(**booking.model_dump(exclude_unset=True))
-        db_booking.price = db_hotel.price
-
-        db_discount_amount = 0
+        db_booking.price = hotel_price
 
         if booking.ticket_id:
-            db_ticket = await self.session.get(ticket_model.Ticket, booking.ticket_id)
             if not db_ticket:
                 raise HTTPException(status_code=404, detail=f"Ticket with ID {booking.ticket_id} does not exist.")
             if db_ticket.used >= db_ticket.amount:
                 raise HTTPException(status_code=400, detail=f"Ticket with ID {booking.ticket_id} has already been fully used.")
-            
-            db_booking.ticket_id = booking.ticket_id
 
-            db_ticket_result = await self.session.exec(
-                select(ticket_model.Ticket).where(ticket_model.Ticket.id == booking.ticket_id)
+            # Conditional increment: concurrent bookings can never push `used` past `amount`
+            result = await self.session.exec(
+                update(ticket_model.Ticket)
+                .where(
+                    ticket_model.Ticket.id == booking.ticket_id,
+                    ticket_model.Ticket.used < ticket_model.Ticket.amount,
+                )
+                .values(used=ticket_model.Ticket.used + 1)
+                .execution_options(synchronize_session=False)
             )
-            db_ticket_obj = db_ticket_result.scalar_one_or_none()
+            if result.rowcount == 0:
+                raise HTTPException(status_code=400, detail=f"Ticket with ID {booking.ticket_id} has already been fully used.")
 
-            if db_ticket_obj:
-                db_ticket_type_result = await self.session.exec(
-                    select(ticket_model.TicketType).where(ticket_model.TicketType.id == db_ticket_obj.ticket_type_id)
-                )
-                db_ticket_type = db_ticket_type_result.scalar_one_or_none()
-                if db_ticket_type:
-                    db_discount_amount_result = await self.session.exec(
-                        select(ticket_model.TicketUsageRule.tax_reduction).where(
-                            ticket_model.TicketUsageRule.ticket_type_id == db_ticket_type.id
-                        )
-                    )
-                    db_discount_amount = db_discount_amount_result.scalar_one_or_none() or 0
-
-                    db_ticket.used += 1
-                    self.session.add(db_ticket)
-                    await self.session.commit()
-                    await self.session.refresh(db_ticket)
-
-        db_booking.discount_amount = db_discount_amount * db_booking.price
-        db_booking.final_price = db_booking.price - db_booking.discount_amount
+            db_booking.ticket_id = booking.ticket_id
+
+        db_booking.discount_amount, db_booking.final_price = await PricingEngine(self.session).price(
+            hotel_price, category_id, db_ticket.ticket_type_id if booking.ticket_id else None
+        )
 
         db_booking.travel_date = booking.travel_date if booking.travel_date else datetime.now() + timedelta(days=7)
         db_booking.status = booking_schema.BookingStatus.BOOKING
 
+        # Ticket usage and the booking are committed together
         self.session.add(db_booking)
         await self.session.commit()
-        await self.session.refresh(db_booking)
         return db_booking
 
+    async def quote_bookings(self, items: List[booking_schema.BookingQuoteRequest]) -> List[booking_schema.BookingQuote]:
+        return await PricingEngine(self.session).quote(items)
+
     
     async def cancel_booking(self, booking_id: int) -> Optional[booking_schema.Booking]:
         booking = await self.get_booking(booking_id)
@@ -96,7 +132,6 @@ class DBBookingService(BookingServiceInterface):
         booking.status = booking_schema.BookingStatus.CANCELLED
         self.session.add(booking)
         await self.session.commit()
-        await self.session.refresh(booking)
         return booking
 
     async def reschedule_booking(self, booking_id: int, new_travel_date: datetime, reason: str) -> Optional[booking_schema.BookingRescheduleLog]:
@@ -118,7 +153,6 @@ class DBBookingService(BookingServiceInterface):
         self.session.add(booking)
         
         await self.session.commit()
-        await self.session.refresh(booking)
         return reschedule_log
     
     async def list_reschedule_logs(self) -> List[booking_schema.BookingRescheduleLog]:
@@ -1,8 +1,11 @@
 import datetime
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 
 from .BookingServiceInterface import BookingServiceInterface
 from travelothai.schemas import booking_schema
+from travelothai.services.hotel_services import MockHotelService
+from travelothai.services.province_services import MockProvinceService
+from travelothai.services.ticket_services import MockTicketService
 
 
 mock_bookings: List[booking_schema.Booking] = [
@@ -44,6 +47,21 @@ class MockBookingService(BookingServiceInterface):
                 return booking
         return None
 
+    async def export_bookings(
+        self,
+        start_date: Optional[datetime.datetime] = None,
+        end_date: Optional[datetime.datetime] = None,
+        status: Optional[booking_schema.BookingStatus] = None,
+    ) -> AsyncIterator[booking_schema.Booking]:
+        for booking in mock_bookings:
+            if start_date is not None and booking.created_at < start_date:
+                continue
+            if end_date is not None and booking.created_at >= end_date:
+                continue
+            if status is not None and booking.status != status:
+                continue
+            yield booking
+
     async def create_booking(self, booking: booking_schema.BookingCreate) -> booking_schema.Booking:
         global mock_id
         new_booking = booking_schema.Booking(
@@ -63,6 +81,33 @@ class MockBookingService(BookingServiceInterface):
         mock_id += 1
         return new_booking
 
+    async def quote_bookings(self, items: List[booking_schema.BookingQuoteRequest]) -> List[booking_schema.BookingQuote]:
+        hotels = {hotel.id: hotel for hotel in MockHotelService.mock_hotels}
+        categories = {province.id: province.category_id for province in MockProvinceService.mock_provinces}
+        ticket_types = {ticket.id: ticket.ticket_type_id for ticket in MockTicketService.mock_tickets}
+        rates = {}
+        for rule in MockTicketService.mock_ticket_usage_rules:
+            if rule.allowance:
+                key = (rule.ticket_type_id, rule.category_id)
+                rates[key] = max(rates.get(key, 0.0), rule.tax_reduction)
+
+        quotes = []
+        for item in items:
+            hotel = hotels.get(item.hotel_id)
+            if hotel is None or hotel.province_id not in categories:
+                quotes.append(booking_schema.BookingQuote(**item.model_dump(), error="Hotel not found"))
+            elif item.ticket_id is not None and item.ticket_id not in ticket_types:
+                quotes.append(booking_schema.BookingQuote(**item.model_dump(), error="Ticket not found"))
+            else:
+                category_id = categories[hotel.province_id]
+                rate = rates.get((ticket_types[item.ticket_id], category_id), 0.0) if item.ticket_id is not None else 0.0
+                discount_amount = hotel.price * rate
+                quotes.append(booking_schema.BookingQuote(
+                    **item.model_dump(), category_id=category_id, price=hotel.price,
+                    discount_amount=discount_amount, final_price=hotel.price - discount_amount,
+                ))
+        return quotes
+
     async def cancel_booking(self, booking_id: int) -> Optional[booking_schema.Booking]:
         for booking in mock_bookings:
             if booking.id == booking_id:
@@ -0,0 +1,30 @@
+from datetime import datetime
+from typing import Dict, List, Type
+
+from pydantic import BaseModel
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import SQLModel
+
+from travelothai.schemas import bulk_schema
+
+
+async def bulk_insert(
+    session: AsyncSession, model: Type[SQLModel], items: List[BaseModel], errors: Dict[int, str]
+) -> bulk_schema.BulkCreateResult:
+    """Insert every item not listed in `errors` with one executemany, and report the outcome of each row."""
+    # Core inserts skip the model default factories, so timestamps are set here
+    now = datetime.now()
+    rows = [
+        {**item.model_dump(), "created_at": now, "updated_at": now}
+        for index, item in enumerate(items) if index not in errors
+    ]
+    ids = []
+    if rows:
+        result = await session.exec(
+            insert(model).returning(model.id, sort_by_parameter_order=True),
+            params=rows,
+        )
+        ids = result.scalars().all()
+        await session.commit()
+    return bulk_schema.BulkCreateResult.from_rows(len(items), errors, ids)
@@ -2,8 +2,9 @@ from typing import List, Optional
 from fastapi import HTTPException
 
 from .HotelServiceInterface import HotelServiceInterface
-from travelothai.schemas import hotel_schema
+from travelothai.schemas import bulk_schema, hotel_schema
 from travelothai.models import hotel_model, province_model
+from travelothai.services.bulk_insert import bulk_insert
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -13,10 +14,45 @@ class DBHotelService(HotelServiceInterface):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def list_hotels(self) -> List[hotel_schema.Hotel]:
-        result = await self.session.exec(select(hotel_model.Hotel))
+    @staticmethod
+    def _filter_hotels(
+        statement,
+        province_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        name_prefix: Optional[str] = None,
+    ):
+        if province_id is not None:
+            statement = statement.where(hotel_model.Hotel.province_id == province_id)
+        if min_price is not None:
+            statement = statement.where(hotel_model.Hotel.price >= min_price)
+        if max_price is not None:
+            statement = statement.where(hotel_model.Hotel.price <= max_price)
+        if name_prefix:
+            # Range comparison instead of LIKE so the name index can be used
+            statement = statement.where(
+                hotel_model.Hotel.name >= name_prefix,
+                hotel_model.Hotel.name < name_prefix + "\U0010ffff",
+            )
+        return statement
+
+    async def list_hotels(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        province_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        name_prefix: Optional[str] = None,
+    ) -> List[hotel_schema.Hotel]:
+        statement = self._filter_hotels(select(hotel_model.Hotel), province_id, min_price, max_price, name_prefix)
+        if after_id is not None:
+            statement = statement.where(hotel_model.Hotel.id > after_id)
+        statement = statement.order_by(hotel_model.Hotel.id).limit(limit)
+
+        result = await self.session.exec(statement)
         hotels = result.scalars().all()
-        if not hotels:
+        if not hotels and after_id is None:
             raise HTTPException(status_code=404, detail="No hotels found")
         return hotels
 
@@ -39,9 +75,23 @@ class DBHotelService(HotelServiceInterface):
         db_hotel = hotel_model.Hotel(**hotel.model_dump())
         self.session.add(db_hotel)
         await self.session.commit()
-        await self.session.refresh(db_hotel)
         return db_hotel
 
+    async def create_hotels_bulk(self, hotels: List[hotel_schema.HotelCreate]) -> bulk_schema.BulkCreateResult:
+        # One IN query validates every province of the batch
+        result = await self.session.exec(
+            select(province_model.Province.id).where(
+                province_model.Province.id.in_({hotel.province_id for hotel in hotels})
+            )
+        )
+        province_ids = set(result.scalars().all())
+        errors = {
+            index: f"Province ID {hotel.province_id} does not exist."
+            for index, hotel in enumerate(hotels) if hotel.province_id not in province_ids
+        }
+
+        return await bulk_insert(self.session, hotel_model.Hotel, hotels, errors)
+
     async def update_hotel(self, hotel_id: int, hotel: hotel_schema.HotelUpdate) -> hotel_schema.Hotel:
         db_hotel = await self.session.get(hotel_model.Hotel, hotel_id)
         if not db_hotel:
@@ -59,7 +109,6 @@ class DBHotelService(HotelServiceInterface):
 
         self.session.add(db_hotel)
         await self.session.commit()
-        await self.session.refresh(db_hotel)
         return db_hotel
 
     async def delete_hotel(self, hotel_id: int) -> None:
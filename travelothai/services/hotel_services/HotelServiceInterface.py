@@ -1,13 +1,21 @@
 from abc import ABC, abstractmethod
 from typing import List, Optional
 
-from travelothai.schemas import hotel_schema
+from travelothai.schemas import bulk_schema, hotel_schema
 
 
 class HotelServiceInterface(ABC):
     @abstractmethod
-    async def list_hotels(self) -> List[hotel_schema.Hotel]:
-        """List all hotels."""
+    async def list_hotels(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        province_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        name_prefix: Optional[str] = None,
+    ) -> List[hotel_schema.Hotel]:
+        """List hotels ordered by ID, starting after the `after_id` cursor."""
         pass
 
     @abstractmethod
@@ -20,6 +28,11 @@ class HotelServiceInterface(ABC):
         """Create a new hotel."""
         pass
 
+    @abstractmethod
+    async def create_hotels_bulk(self, hotels: List[hotel_schema.HotelCreate]) -> bulk_schema.BulkCreateResult:
+        """Create many hotels at once, reporting the outcome of each row."""
+        pass
+
     @abstractmethod
     async def update_hotel(self, hotel_id: int, hotel: hotel_schema.HotelUpdate) -> Optional[hotel_schema.Hotel]:
         """Update an existing hotel."""
@@ -2,7 +2,7 @@ import datetime
 from typing import List, Optional
 
 from .HotelServiceInterface import HotelServiceInterface
-from travelothai.schemas import hotel_schema
+from travelothai.schemas import bulk_schema, hotel_schema
 
 
 mock_hotels: List[hotel_schema.Hotel] = [
@@ -12,8 +12,24 @@ mock_hotels: List[hotel_schema.Hotel] = [
 mock_id = 3
 
 class MockHotelService(HotelServiceInterface):
-    async def list_hotels(self) -> List[hotel_schema.Hotel]:
-        return mock_hotels
+    async def list_hotels(
+        self,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+        province_id: Optional[int] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+        name_prefix: Optional[str] = None,
+    ) -> List[hotel_schema.Hotel]:
+        hotels = [
+            hotel for hotel in sorted(mock_hotels, key=lambda hotel: hotel.id)
+            if (after_id is None or hotel.id > after_id)
+            and (province_id is None or hotel.province_id == province_id)
+            and (min_price is None or hotel.price >= min_price)
+            and (max_price is None or hotel.price <= max_price)
+            and (not name_prefix or hotel.name.startswith(name_prefix))
+        ]
+        return hotels[:limit]
 
     async def get_hotel(self, hotel_id: int) -> Optional[hotel_schema.Hotel]:
         for hotel in mock_hotels:
@@ -35,6 +51,10 @@ class MockHotelService(HotelServiceInterface):
         mock_id += 1
         return new_hotel
 
+    async def create_hotels_bulk(self, hotels: List[hotel_schema.HotelCreate]) -> bulk_schema.BulkCreateResult:
+        ids = [(await self.create_hotel(hotel)).id for hotel in hotels]
+        return bulk_schema.BulkCreateResult.from_rows(len(hotels), {}, ids)
+
     async def update_hotel(self, hotel_id: int, hotel: hotel_schema.HotelUpdate) -> Optional[hotel_schema.Hotel]:
         for idx, existing_hotel in enumerate(mock_hotels):
             if existing_hotel.id == hotel_id:
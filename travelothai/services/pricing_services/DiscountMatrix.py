@@ -0,0 +1,62 @@
+from typing import Dict, Tuple
+
+from travelothai.core.cache import get_cache
+from travelothai.core.config import get_settings
+from travelothai.models import ticket_model
+
+from sqlalchemy import func, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+
+class DiscountMatrix:
+    """Discount rate of every (ticket_type_id, category_id) pair a usage rule allows.
+
+    Built with one query from the `TicketUsageRule` rows with `allowance` set; when several
+    rules cover the same pair the best rate wins, as in hotel search. The matrix is shared
+    process-wide through the `discount_matrix` cache, so pricing a booking or a quote is a
+    dictionary lookup instead of a query.
+    """
+
+    CACHE_KEY = ("matrix",)
+
+    # Bumped by every invalidation so a build that raced with a rule change is not stored
+    _generation = 0
+
+    def __init__(self, rates: Dict[Tuple[int, int], float]):
+        self.rates = rates
+
+    def __len__(self) -> int:
+        return len(self.rates)
+
+    def rate(self, ticket_type_id: int, category_id: int) -> float:
+        """Fraction of the price taken off; 0 when no rule allows the ticket type in the category."""
+        return self.rates.get((ticket_type_id, category_id), 0.0)
+
+    @classmethod
+    async def build(cls, session: AsyncSession) -> "DiscountMatrix":
+        TicketUsageRule = ticket_model.TicketUsageRule
+        result = await session.exec(
+            select(TicketUsageRule.ticket_type_id, TicketUsageRule.category_id, func.max(TicketUsageRule.tax_reduction))
+            .where(TicketUsageRule.allowance == true())
+            .group_by(TicketUsageRule.ticket_type_id, TicketUsageRule.category_id)
+        )
+        return cls({(ticket_type_id, category_id): rate or 0.0 for ticket_type_id, category_id, rate in result.all()})
+
+    @classmethod
+    async def get(cls, session: AsyncSession) -> "DiscountMatrix":
+        """The current matrix, built on first use and again once `DISCOUNT_MATRIX_TTL_SECONDS` have passed."""
+        cache = get_cache("discount_matrix")
+        matrix = cache.get(cls.CACHE_KEY)
+        if matrix is None:
+            generation = cls._generation
+            matrix = await cls.build(session)
+            if generation == cls._generation:
+                cache.set(cls.CACHE_KEY, matrix, ttl=get_settings().DISCOUNT_MATRIX_TTL_SECONDS)
+        return matrix
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """Drop the matrix after a usage rule changed; the next lookup rebuilds it."""
+        cls._generation += 1
+        get_cache("discount_matrix").clear()
@@ -0,0 +1,87 @@
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .DiscountMatrix import DiscountMatrix
+from travelothai.schemas import booking_schema
+from travelothai.models import hotel_model, province_model, ticket_model
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+
+class PricingEngine:
+    """Booking prices: the hotel price less the discount of the ticket in the hotel's province category.
+
+    Read-only; booking creation and the quote endpoint share it so they always agree on a price.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    @staticmethod
+    def apply(prices: List[float], rates: List[float]) -> Tuple[List[float], List[float]]:
+        """Discount amounts and final prices for whole columns of prices and discount rates."""
+        discount_amounts = [price * rate for price, rate in zip(prices, rates)]
+        final_prices = [price - discount for price, discount in zip(prices, discount_amounts)]
+        return discount_amounts, final_prices
+
+    async def price(self, price: float, category_id: int, ticket_type_id: Optional[int]) -> Tuple[float, float]:
+        """Discount amount and final price of one booking; no ticket means no discount."""
+        rate = 0.0
+        if ticket_type_id is not None:
+            rate = (await DiscountMatrix.get(self.session)).rate(ticket_type_id, category_id)
+        (discount_amount,), (final_price,) = self.apply([price], [rate])
+        return discount_amount, final_price
+
+    async def _hotels(self, hotel_ids: Iterable[int]) -> Dict[int, Tuple[float, int]]:
+        """Price and province category of each existing hotel, in one IN query."""
+        result = await self.session.exec(
+            select(hotel_model.Hotel.id, hotel_model.Hotel.price, province_model.Province.category_id)
+            .join(province_model.Province, province_model.Province.id == hotel_model.Hotel.province_id)
+            .where(hotel_model.Hotel.id.in_(set(hotel_ids)))
+        )
+        return {hotel_id: (price, category_id) for hotel_id, price, category_id in result.all()}
+
+    async def _ticket_types(self, ticket_ids: Iterable[int]) -> Dict[int, int]:
+        """Ticket type of each existing ticket, in one IN query."""
+        ticket_ids = set(ticket_ids)
+        if not ticket_ids:
+            return {}
+        result = await self.session.exec(
+            select(ticket_model.Ticket.id, ticket_model.Ticket.ticket_type_id).where(ticket_model.Ticket.id.in_(ticket_ids))
+        )
+        return dict(result.all())
+
+    async def quote(self, items: List[booking_schema.BookingQuoteRequest]) -> List[booking_schema.BookingQuote]:
+        """Price every (hotel, ticket) pair with two IN queries; pairs with an unknown reference carry an error."""
+        hotels = await self._hotels(item.hotel_id for item in items)
+        ticket_types = await self._ticket_types(item.ticket_id for item in items if item.ticket_id is not None)
+        discounts = await DiscountMatrix.get(self.session)
+
+        priced, errors = [], {}
+        for index, item in enumerate(items):
+            if item.hotel_id not in hotels:
+                errors[index] = "Hotel not found"
+            elif item.ticket_id is not None and item.ticket_id not in ticket_types:
+                errors[index] = "Ticket not found"
+            else:
+                priced.append(index)
+
+        prices = [hotels[items[index].hotel_id][0] for index in priced]
+        categories = [hotels[items[index].hotel_id][1] for index in priced]
+        rates = [
+            discounts.rate(ticket_types[items[index].ticket_id], category_id) if items[index].ticket_id is not None else 0.0
+            for index, category_id in zip(priced, categories)
+        ]
+        discount_amounts, final_prices = self.apply(prices, rates)
+
+        quotes = {
+            index: booking_schema.BookingQuote(
+                hotel_id=items[index].hotel_id, ticket_id=items[index].ticket_id, category_id=category_id,
+                price=price, discount_amount=discount_amount, final_price=final_price,
+            )
+            for index, category_id, price, discount_amount, final_price in zip(priced, categories, prices, discount_amounts, final_prices)
+        }
+        return [
+            quotes.get(index) or booking_schema.BookingQuote(hotel_id=item.hotel_id, ticket_id=item.ticket_id, error=errors[index])
+            for index, item in enumerate(items)
+        ]
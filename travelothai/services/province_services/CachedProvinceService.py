@@ -0,0 +1,113 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from .DBProvinceService import DBProvinceService
+from travelothai.core.cache import get_cache
+from travelothai.schemas import bulk_schema, province_schema
+
+
+class CachedProvinceService(DBProvinceService):
+    """DBProvinceService with a read-through cache for categories and provinces.
+
+    Any write through this service clears the cache.
+    """
+
+    def __init__(self, session):
+        super().__init__(session)
+        self.cache = get_cache("provinces")
+
+    # ProvinceCategory Methods
+    async def list_province_categories(self) -> List[province_schema.ProvinceCategory]:
+        categories = self.cache.get(("categories",))
+        if categories is None:
+            generation = self.cache.generation
+            categories = [
+                province_schema.ProvinceCategory.model_validate(category)
+                for category in await super().list_province_categories()
+            ]
+            self.cache.set(("categories",), categories, generation=generation)
+        return categories
+
+    async def get_province_categories_version(self) -> Tuple[int, Optional[datetime]]:
+        version = self.cache.get(("categories_version",))
+        if version is None:
+            generation = self.cache.generation
+            version = await super().get_province_categories_version()
+            self.cache.set(("categories_version",), version, generation=generation)
+        return version
+
+    async def get_province_category(self, category_id: int) -> Optional[province_schema.ProvinceCategory]:
+        category = self.cache.get(("category", category_id))
+        if category is None:
+            generation = self.cache.generation
+            db_category = await super().get_province_category(category_id)
+            if db_category is None:
+                return None
+            category = province_schema.ProvinceCategory.model_validate(db_category)
+            self.cache.set(("category", category_id), category, generation=generation)
+        return category
+
+    async def create_province_category(self, category: province_schema.ProvinceCategoryCreate) -> province_schema.ProvinceCategory:
+        db_category = await super().create_province_category(category)
+        self.cache.clear()
+        return db_category
+
+    async def update_province_category(self, category_id: int, category: province_schema.ProvinceCategoryUpdate) -> Optional[province_schema.ProvinceCategory]:
+        db_category = await super().update_province_category(category_id, category)
+        self.cache.clear()
+        return db_category
+
+    async def delete_province_category(self, category_id: int) -> None:
+        await super().delete_province_category(category_id)
+        self.cache.clear()
+
+
+    # Province Methods
+    async def list_provinces(self) -> List[province_schema.Province]:
+        provinces = self.cache.get(("provinces",))
+        if provinces is None:
+            generation = self.cache.generation
+            provinces = [
+                province_schema.Province.model_validate(province)
+                for province in await super().list_provinces()
+            ]
+            self.cache.set(("provinces",), provinces, generation=generation)
+        return provinces
+
+    async def get_provinces_version(self) -> Tuple[int, Optional[datetime]]:
+        version = self.cache.get(("provinces_version",))
+        if version is None:
+            generation = self.cache.generation
+            version = await super().get_provinces_version()
+            self.cache.set(("provinces_version",), version, generation=generation)
+        return version
+
+    async def get_province(self, province_id: int) -> Optional[province_schema.Province]:
+        province = self.cache.get(("province", province_id))
+        if province is None:
+            generation = self.cache.generation
+            db_province = await super().get_province(province_id)
+            if db_province is None:
+                return None
+            province = province_schema.Province.model_validate(db_province)
+            self.cache.set(("province", province_id), province, generation=generation)
+        return province
+
+    async def create_province(self, province: province_schema.ProvinceCreate) -> province_schema.Province:
+        db_province = await super().create_province(province)
+        self.cache.clear()
+        return db_province
+
+    async def create_provinces_bulk(self, provinces: List[province_schema.ProvinceCreate]) -> bulk_schema.BulkCreateResult:
+        result = await super().create_provinces_bulk(provinces)
+        self.cache.clear()
+        return result
+
+    async def update_province(self, province_id: int, province: province_schema.ProvinceUpdate) -> Optional[province_schema.Province]:
+        db_province = await super().update_province(province_id, province)
+        self.cache.clear()
+        return db_province
+
+    async def delete_province(self, province_id: int) -> None:
+        await super().delete_province(province_id)
+        self.cache.clear()
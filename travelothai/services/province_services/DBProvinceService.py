@@ -1,10 +1,13 @@
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 from fastapi import HTTPException
 
 from .ProvinceServiceInterface import ProvinceServiceInterface
-from travelothai.schemas import province_schema
+from travelothai.schemas import bulk_schema, province_schema
 from travelothai.models import province_model
+from travelothai.services.bulk_insert import bulk_insert
 
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -20,6 +23,13 @@ class DBProvinceService(ProvinceServiceInterface):
             raise HTTPException(status_code=404, detail="No province categories found")
         categories = result.scalars().all()
         return categories
+
+    async def get_province_categories_version(self) -> Tuple[int, Optional[datetime]]:
+        result = await self.session.exec(
+            select(func.count(), func.max(province_model.ProvinceCategory.updated_at))
+        )
+        count, last_modified = result.one()
+        return count, last_modified
     
     async def get_province_category(self, category_id: int) -> Optional[province_schema.ProvinceCategory]:
         result = await self.session.exec(
@@ -45,7 +55,6 @@ class DBProvinceService(ProvinceServiceInterface):
         db_category = province_model.ProvinceCategory(**category.model_dump())
         self.session.add(db_category)
         await self.session.commit()
-        await self.session.refresh(db_category)
         return db_category
     
 
@@ -72,7 +81,6 @@ class DBProvinceService(ProvinceServiceInterface):
             setattr(db_category, key, value)
         self.session.add(db_category)
         await self.session.commit()
-        await self.session.refresh(db_category)
         return db_category
     
     async def delete_province_category(self, category_id: int) -> None:
@@ -97,6 +105,13 @@ class DBProvinceService(ProvinceServiceInterface):
         provinces = result.scalars().all()
         return provinces
 
+    async def get_provinces_version(self) -> Tuple[int, Optional[datetime]]:
+        result = await self.session.exec(
+            select(func.count(), func.max(province_model.Province.updated_at))
+        )
+        count, last_modified = result.one()
+        return count, last_modified
+
     async def get_province(self, province_id: int) -> Optional[province_schema.Province]:
         result = await self.session.exec(
             select(province_model.Province).where(province_model.Province.id == province_id)
@@ -121,9 +136,36 @@ class DBProvinceService(ProvinceServiceInterface):
         db_province = province_model.Province(**province.model_dump())
         self.session.add(db_province)
         await self.session.commit()
-        await self.session.refresh(db_province)
         return db_province
 
+    async def create_provinces_bulk(self, provinces: List[province_schema.ProvinceCreate]) -> bulk_schema.BulkCreateResult:
+        # One IN query per batch for the categories and one for the names already taken
+        result = await self.session.exec(
+            select(province_model.ProvinceCategory.id).where(
+                province_model.ProvinceCategory.id.in_({province.category_id for province in provinces})
+            )
+        )
+        category_ids = set(result.scalars().all())
+        result = await self.session.exec(
+            select(province_model.Province.name).where(
+                province_model.Province.name.in_({province.name for province in provinces})
+            )
+        )
+        taken_names = set(result.scalars().all())
+
+        errors = {}
+        for index, province in enumerate(provinces):
+            if not province.name:
+                errors[index] = "Province name must not be empty"
+            elif province.name in taken_names:
+                errors[index] = "Province name must be unique"
+            elif province.category_id not in category_ids:
+                errors[index] = f"Province category ID {province.category_id} does not exist."
+            else:
+                taken_names.add(province.name)
+
+        return await bulk_insert(self.session, province_model.Province, provinces, errors)
+
 
     async def update_province(self, province_id: int, province: province_schema.ProvinceUpdate) -> Optional[province_schema.Province]:
         # Validate that the province exists & name is unique
@@ -146,7 +188,6 @@ class DBProvinceService(ProvinceServiceInterface):
             setattr(db_province, key, value)
         self.session.add(db_province)
         await self.session.commit()
-        await self.session.refresh(db_province)
         return db_province
 
 
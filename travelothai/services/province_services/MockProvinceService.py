@@ -1,8 +1,8 @@
 import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .ProvinceServiceInterface import ProvinceServiceInterface
-from travelothai.schemas import province_schema
+from travelothai.schemas import bulk_schema, province_schema
 
 
 mock_provinces_category: List[province_schema.ProvinceCategory] = [
@@ -21,6 +21,9 @@ class MockProvinceService(ProvinceServiceInterface):
     # Mock ProvinceCategory methods
     async def list_province_categories(self) -> List[province_schema.ProvinceCategory]:
         return mock_provinces_category
+
+    async def get_province_categories_version(self) -> Tuple[int, Optional[datetime.datetime]]:
+        return len(mock_provinces_category), max((category.updated_at for category in mock_provinces_category), default=None)
     
     async def get_province_category(self, category_id: int) -> Optional[province_schema.ProvinceCategory]:
         for category in mock_provinces_category:
@@ -59,6 +62,9 @@ class MockProvinceService(ProvinceServiceInterface):
     async def list_provinces(self) -> List[province_schema.Province]:
         return mock_provinces
 
+    async def get_provinces_version(self) -> Tuple[int, Optional[datetime.datetime]]:
+        return len(mock_provinces), max((province.updated_at for province in mock_provinces), default=None)
+
     async def get_province(self, province_id: int) -> Optional[province_schema.Province]:
         for province in mock_provinces:
             if province.id == province_id:
@@ -78,6 +84,10 @@ class MockProvinceService(ProvinceServiceInterface):
         mock_id += 1
         return new_province
 
+    async def create_provinces_bulk(self, provinces: List[province_schema.ProvinceCreate]) -> bulk_schema.BulkCreateResult:
+        ids = [(await self.create_province(province)).id for province in provinces]
+        return bulk_schema.BulkCreateResult.from_rows(len(provinces), {}, ids)
+
     async def update_province(self, province_id: int, province: province_schema.ProvinceUpdate) -> Optional[province_schema.Province]:
         for idx, existing_province in enumerate(mock_provinces):
             if existing_province.id == province_id:
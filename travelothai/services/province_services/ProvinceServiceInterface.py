@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
-from travelothai.schemas import province_schema
+from travelothai.schemas import bulk_schema, province_schema
 
 
 class ProvinceServiceInterface(ABC):
@@ -11,6 +12,11 @@ class ProvinceServiceInterface(ABC):
         """List all province categories."""
         pass
 
+    @abstractmethod
+    async def get_province_categories_version(self) -> Tuple[int, Optional[datetime]]:
+        """Return the number of province categories and their latest `updated_at`."""
+        pass
+
     @abstractmethod
     async def get_province_category(self, category_id: int) -> Optional[province_schema.ProvinceCategory]:
         """Get a specific province category by ID."""
@@ -37,6 +43,11 @@ class ProvinceServiceInterface(ABC):
         """List all provinces."""
         pass
 
+    @abstractmethod
+    async def get_provinces_version(self) -> Tuple[int, Optional[datetime]]:
+        """Return the number of provinces and their latest `updated_at`."""
+        pass
+
     @abstractmethod
     async def get_province(self, province_id: int) -> Optional[province_schema.Province]:
         """Get a specific province by ID."""
@@ -47,6 +58,11 @@ class ProvinceServiceInterface(ABC):
         """Create a new province."""
         pass
 
+    @abstractmethod
+    async def create_provinces_bulk(self, provinces: List[province_schema.ProvinceCreate]) -> bulk_schema.BulkCreateResult:
+        """Create many provinces at once, reporting the outcome of each row."""
+        pass
+
     @abstractmethod
     async def update_province(self, province_id: int, province: province_schema.ProvinceUpdate) -> Optional[province_schema.Province]:
         """Update an existing province."""
@@ -0,0 +1,82 @@
+from typing import List, Optional
+from fastapi import HTTPException
+
+from .SearchServiceInterface import SearchServiceInterface
+from travelothai.schemas import search_schema
+from travelothai.models import hotel_model, province_model, ticket_model
+
+from sqlalchemy import and_, func, literal, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+
+class DBSearchService(SearchServiceInterface):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def search_hotels(
+        self,
+        ticket_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        max_price: Optional[float] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[search_schema.HotelSearchResult]:
+        Hotel, Province, ProvinceCategory = hotel_model.Hotel, province_model.Province, province_model.ProvinceCategory
+        Ticket, TicketUsageRule = ticket_model.Ticket, ticket_model.TicketUsageRule
+
+        statement = (
+            select(Hotel.id, Hotel.name, Hotel.province_id, Province.name, Province.category_id, ProvinceCategory.name, Hotel.price)
+            .join(Province, Province.id == Hotel.province_id)
+            .join(ProvinceCategory, ProvinceCategory.id == Province.category_id)
+        )
+        tax_reduction = literal(0.0)
+        if ticket_id is not None:
+            # Only rules that allow the ticket in the category discount; the best one wins if several match
+            rules = (
+                select(
+                    TicketUsageRule.ticket_type_id,
+                    TicketUsageRule.category_id,
+                    func.max(TicketUsageRule.tax_reduction).label("tax_reduction"),
+                )
+                .where(TicketUsageRule.allowance == true())
+                .group_by(TicketUsageRule.ticket_type_id, TicketUsageRule.category_id)
+                .subquery()
+            )
+            statement = (
+                statement
+                .join(Ticket, Ticket.id == ticket_id)
+                .outerjoin(rules, and_(
+                    rules.c.ticket_type_id == Ticket.ticket_type_id,
+                    rules.c.category_id == Province.category_id,
+                ))
+            )
+            tax_reduction = func.coalesce(rules.c.tax_reduction, 0.0)
+
+        discount_amount = Hotel.price * tax_reduction
+        final_price = Hotel.price - discount_amount
+        statement = statement.add_columns(discount_amount, final_price)
+
+        if category_id is not None:
+            statement = statement.where(Province.category_id == category_id)
+        if max_price is not None:
+            statement = statement.where(final_price <= max_price)
+        if after_id is not None:
+            statement = statement.where(Hotel.id > after_id)
+        statement = statement.order_by(Hotel.id).limit(limit)
+
+        result = await self.session.exec(statement)
+        rows = result.all()
+        if not rows and ticket_id is not None:
+            # An unknown ticket drops every row through the inner join; tell it apart from no match on any page
+            if await self.session.get(Ticket, ticket_id) is None:
+                raise HTTPException(status_code=404, detail="Ticket not found")
+
+        return [
+            search_schema.HotelSearchResult(
+                id=id, name=name, province_id=province_id, province_name=province_name,
+                category_id=category_id, category_name=category_name,
+                price=price, discount_amount=discount, final_price=final,
+            )
+            for id, name, province_id, province_name, category_id, category_name, price, discount, final in rows
+        ]
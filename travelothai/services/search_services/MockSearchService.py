@@ -0,0 +1,33 @@
+from typing import List, Optional
+
+from .SearchServiceInterface import SearchServiceInterface
+from travelothai.schemas import search_schema
+from travelothai.services.hotel_services import MockHotelService
+from travelothai.services.province_services import MockProvinceService
+
+
+class MockSearchService(SearchServiceInterface):
+    async def search_hotels(
+        self,
+        ticket_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        max_price: Optional[float] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[search_schema.HotelSearchResult]:
+        # Mock data has no usage rules: every hotel is listed at full price
+        provinces = {province.id: province for province in MockProvinceService.mock_provinces}
+        categories = {category.id: category for category in MockProvinceService.mock_provinces_category}
+        results = []
+        for hotel in sorted(MockHotelService.mock_hotels, key=lambda hotel: hotel.id):
+            province = provinces.get(hotel.province_id)
+            if province is None or (after_id is not None and hotel.id <= after_id):
+                continue
+            if (category_id is not None and province.category_id != category_id) or (max_price is not None and hotel.price > max_price):
+                continue
+            results.append(search_schema.HotelSearchResult(
+                id=hotel.id, name=hotel.name, province_id=province.id, province_name=province.name,
+                category_id=province.category_id, category_name=categories[province.category_id].name,
+                price=hotel.price, discount_amount=0, final_price=hotel.price,
+            ))
+        return results[:limit]
@@ -0,0 +1,18 @@
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from travelothai.schemas import search_schema
+
+
+class SearchServiceInterface(ABC):
+    @abstractmethod
+    async def search_hotels(
+        self,
+        ticket_id: Optional[int] = None,
+        category_id: Optional[int] = None,
+        max_price: Optional[float] = None,
+        after_id: Optional[int] = None,
+        limit: int = 50,
+    ) -> List[search_schema.HotelSearchResult]:
+        """Hotels ordered by ID with the price after the ticket's discount, starting after the `after_id` cursor."""
+        pass
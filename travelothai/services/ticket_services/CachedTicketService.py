@@ -0,0 +1,103 @@
+from datetime import datetime
+from typing import List, Optional, Tuple
+
+from .DBTicketService import DBTicketService
+from travelothai.core.cache import get_cache
+from travelothai.schemas import ticket_schema
+
+
+class CachedTicketService(DBTicketService):
+    """DBTicketService with a read-through cache for ticket types and usage rules.
+
+    Tickets and campaigns change on every registration and booking, so they are not cached.
+    Any write to ticket types or usage rules through this service clears the cache.
+    """
+
+    def __init__(self, session):
+        super().__init__(session)
+        self.cache = get_cache("ticket_reference")
+
+    # TicketType Methods
+    async def list_ticket_types(self) -> List[ticket_schema.TicketType]:
+        ticket_types = self.cache.get(("ticket_types",))
+        if ticket_types is None:
+            generation = self.cache.generation
+            ticket_types = [
+                ticket_schema.TicketType.model_validate(ticket_type)
+                for ticket_type in await super().list_ticket_types()
+            ]
+            self.cache.set(("ticket_types",), ticket_types, generation=generation)
+        return ticket_types
+
+    async def get_ticket_types_version(self) -> Tuple[int, Optional[datetime]]:
+        version = self.cache.get(("ticket_types_version",))
+        if version is None:
+            generation = self.cache.generation
+            version = await super().get_ticket_types_version()
+            self.cache.set(("ticket_types_version",), version, generation=generation)
+        return version
+
+    async def get_ticket_type(self, type_id: int) -> Optional[ticket_schema.TicketType]:
+        ticket_type = self.cache.get(("ticket_type", type_id))
+        if ticket_type is None:
+            generation = self.cache.generation
+            db_ticket_type = await super().get_ticket_type(type_id)
+            if db_ticket_type is None:
+                return None
+            ticket_type = ticket_schema.TicketType.model_validate(db_ticket_type)
+            self.cache.set(("ticket_type", type_id), ticket_type, generation=generation)
+        return ticket_type
+
+    async def create_ticket_type(self, type: ticket_schema.TicketTypeCreate) -> ticket_schema.TicketType:
+        ticket_type = await super().create_ticket_type(type)
+        self.cache.clear()
+        return ticket_type
+
+    async def update_ticket_type(self, type_id: int, type: ticket_schema.TicketTypeUpdate) -> Optional[ticket_schema.TicketType]:
+        ticket_type = await super().update_ticket_type(type_id, type)
+        self.cache.clear()
+        return ticket_type
+
+    async def delete_ticket_type(self, type_id: int) -> None:
+        ticket_type = await super().delete_ticket_type(type_id)
+        self.cache.clear()
+        return ticket_type
+
+
+    # TicketUsageRules Methods
+    async def list_ticket_usage_rules(self) -> List[ticket_schema.TicketUsageRule]:
+        rules = self.cache.get(("usage_rules",))
+        if rules is None:
+            generation = self.cache.generation
+            rules = [
+                ticket_schema.TicketUsageRule.model_validate(rule)
+                for rule in await super().list_ticket_usage_rules()
+            ]
+            self.cache.set(("usage_rules",), rules, generation=generation)
+        return rules
+
+    async def get_ticket_usage_rule(self, rule_id: int) -> Optional[ticket_schema.TicketUsageRule]:
+        rule = self.cache.get(("usage_rule", rule_id))
+        if rule is None:
+            generation = self.cache.generation
+            db_rule = await super().get_ticket_usage_rule(rule_id)
+            if db_rule is None:
+                return None
+            rule = ticket_schema.TicketUsageRule.model_validate(db_rule)
+            self.cache.set(("usage_rule", rule_id), rule, generation=generation)
+        return rule
+
+    async def create_ticket_usage_rule(self, rule: ticket_schema.TicketUsageRuleCreate) -> ticket_schema.TicketUsageRule:
+        ticket_usage_rule = await super().create_ticket_usage_rule(rule)
+        self.cache.clear()
+        return ticket_usage_rule
+
+    async def update_ticket_usage_rule(self, rule_id: int, rule: ticket_schema.TicketUsageRuleUpdate) -> Optional[ticket_schema.TicketUsageRule]:
+        ticket_usage_rule = await super().update_ticket_usage_rule(rule_id, rule)
+        self.cache.clear()
+        return ticket_usage_rule
+
+    async def delete_ticket_usage_rule(self, rule_id: int) -> None:
+        ticket_usage_rule = await super().delete_ticket_usage_rule(rule_id)
+        self.cache.clear()
+        return ticket_usage_rule
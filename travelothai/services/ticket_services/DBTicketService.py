@@ -1,11 +1,14 @@
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from fastapi import HTTPException
 
 from .TicketServiceInterface import TicketServiceInterface
-from travelothai.schemas import ticket_schema
-from travelothai.models import ticket_model
+from travelothai.schemas import bulk_schema, ticket_schema
+from travelothai.models import province_model, ticket_model
+from travelothai.services.bulk_insert import bulk_insert
+from travelothai.services.pricing_services.DiscountMatrix import DiscountMatrix
 
+from sqlalchemy import func, insert, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
@@ -23,6 +26,13 @@ class DBTicketService(TicketServiceInterface):
         ticket_types = result.scalars().all()
         return ticket_types
 
+    async def get_ticket_types_version(self) -> Tuple[int, Optional[datetime]]:
+        result = await self.session.exec(
+            select(func.count(), func.max(ticket_model.TicketType.updated_at))
+        )
+        count, last_modified = result.one()
+        return count, last_modified
+
     async def get_ticket_type(self, type_id: int) -> Optional[ticket_schema.TicketType]:
         result = await self.session.exec(select(ticket_model.TicketType).where(ticket_model.TicketType.id == type_id))
         if not result:
@@ -41,7 +51,6 @@ class DBTicketService(TicketServiceInterface):
         ticket_type = ticket_model.TicketType.model_validate(type)
         self.session.add(ticket_type)
         await self.session.commit()
-        await self.session.refresh(ticket_type)
         return ticket_type
 
 
@@ -52,7 +61,7 @@ class DBTicketService(TicketServiceInterface):
         result = await self.session.exec(select(ticket_model.TicketType).where(ticket_model.TicketType.name == type.name))
         if result.first():
             raise HTTPException(status_code=400, detail="Ticket type name must be unique")
-        ticket_type = await self.get_ticket_type(type_id)
+        ticket_type = await self.session.get(ticket_model.TicketType, type_id)
         if not ticket_type:
             raise HTTPException(status_code=404, detail="Ticket type not found")
 
@@ -61,12 +70,11 @@ class DBTicketService(TicketServiceInterface):
             setattr(ticket_type, key, value)
         self.session.add(ticket_type)
         await self.session.commit()
-        await self.session.refresh(ticket_type)
         return ticket_type
     
     
     async def delete_ticket_type(self, type_id: int) -> None:
-        ticket_type = await self.get_ticket_type(type_id)
+        ticket_type = await self.session.get(ticket_model.TicketType, type_id)
         if not ticket_type:
             raise HTTPException(status_code=404, detail="Ticket type not found")
         await self.session.delete(ticket_type)
@@ -93,7 +101,7 @@ class DBTicketService(TicketServiceInterface):
         result = await self.session.exec(select(ticket_model.TicketType).where(ticket_model.TicketType.id == rule.ticket_type_id))
         if not result.first():
             raise HTTPException(status_code=404, detail="Ticket type not found")
-        result = await self.session.exec(select(ticket_model.TicketType).where(ticket_model.TicketType.id == rule.category_id))
+        result = await self.session.exec(select(province_model.ProvinceCategory).where(province_model.ProvinceCategory.id == rule.category_id))
         if not result.first():
             raise HTTPException(status_code=404, detail="Category not found")
 
@@ -101,36 +109,36 @@ class DBTicketService(TicketServiceInterface):
         ticket_usage_rule = ticket_model.TicketUsageRule.model_validate(rule)
         self.session.add(ticket_usage_rule)
         await self.session.commit()
-        await self.session.refresh(ticket_usage_rule)
+        DiscountMatrix.invalidate()
         return ticket_usage_rule
     
 
     async def update_ticket_usage_rule(self, rule_id: int, rule: ticket_schema.TicketUsageRuleUpdate) -> Optional[ticket_schema.TicketUsageRule]:
-        # Validate the ticket_id and ticket_type_id not empty and exist
-        ticket_usage_rule = await self.get_ticket_usage_rule(rule_id)
+        # Validate the rule and any ticket type or category it is moved to exist
+        ticket_usage_rule = await self.session.get(ticket_model.TicketUsageRule, rule_id)
         if not ticket_usage_rule:
             raise HTTPException(status_code=404, detail="Ticket usage rule not found")
-        if not rule.ticket_id:
-            raise HTTPException(status_code=400, detail="Ticket ID must not be empty")
-        result = await self.session.exec(select(ticket_model.TicketType).where(ticket_model.TicketType.id == rule.ticket_type_id))
-        if not result.first():
+        if rule.ticket_type_id is not None and not await self.session.get(ticket_model.TicketType, rule.ticket_type_id):
             raise HTTPException(status_code=404, detail="Ticket type not found")
+        if rule.category_id is not None and not await self.session.get(province_model.ProvinceCategory, rule.category_id):
+            raise HTTPException(status_code=404, detail="Category not found")
 
         # Update the TicketUsageRule
         for key, value in rule.model_dump(exclude_unset=True).items():
             setattr(ticket_usage_rule, key, value)
         self.session.add(ticket_usage_rule)
         await self.session.commit()
-        await self.session.refresh(ticket_usage_rule)
+        DiscountMatrix.invalidate()
         return ticket_usage_rule
 
 
     async def delete_ticket_usage_rule(self, rule_id: int) -> None:
-        ticket_usage_rule = await self.get_ticket_usage_rule(rule_id)
+        ticket_usage_rule = await self.session.get(ticket_model.TicketUsageRule, rule_id)
         if not ticket_usage_rule:
             raise HTTPException(status_code=404, detail="Ticket usage rule not found")
         await self.session.delete(ticket_usage_rule)
         await self.session.commit()
+        DiscountMatrix.invalidate()
         return ticket_usage_rule
 
 
@@ -158,10 +166,34 @@ class DBTicketService(TicketServiceInterface):
         ticket = ticket_model.Ticket.model_validate(ticket)
         self.session.add(ticket)
         await self.session.commit()
-        await self.session.refresh(ticket)
         return ticket
-    
-    
+
+    async def create_tickets_bulk(self, tickets: List[ticket_schema.TicketCreate]) -> bulk_schema.BulkCreateResult:
+        # One IN query per batch for the ticket types and one for the campaigns
+        result = await self.session.exec(
+            select(ticket_model.TicketType.id).where(
+                ticket_model.TicketType.id.in_({ticket.ticket_type_id for ticket in tickets})
+            )
+        )
+        ticket_type_ids = set(result.scalars().all())
+        campaign_ids = {ticket.campaign_id for ticket in tickets if ticket.campaign_id is not None}
+        if campaign_ids:
+            result = await self.session.exec(
+                select(ticket_model.TicketCampaign.id).where(ticket_model.TicketCampaign.id.in_(campaign_ids))
+            )
+            campaign_ids = set(result.scalars().all())
+
+        errors = {}
+        for index, ticket in enumerate(tickets):
+            if ticket.user_id is None:
+                errors[index] = "User ID must be provided"
+            elif ticket.ticket_type_id not in ticket_type_ids:
+                errors[index] = "Ticket type not found"
+            elif ticket.campaign_id is not None and ticket.campaign_id not in campaign_ids:
+                errors[index] = "Campaign not found"
+
+        return await bulk_insert(self.session, ticket_model.Ticket, tickets, errors)
+
     async def update_ticket(self, ticket_id: int, ticket: ticket_schema.TicketUpdate) -> Optional[ticket_schema.Ticket]:
         # Validate ticket_id and the ticket_type_id not empty and exists
         if not ticket.ticket_type_id:
@@ -178,7 +210,6 @@ class DBTicketService(TicketServiceInterface):
             setattr(ticket, key, value)
         self.session.add(ticket)
         await self.session.commit()
-        await self.session.refresh(ticket)
         return ticket
 
 
@@ -192,7 +223,6 @@ class DBTicketService(TicketServiceInterface):
         ticket.user_id = None
         self.session.add(ticket)
         await self.session.commit()
-        await self.session.refresh(ticket)
         return ticket
 
 
@@ -235,7 +265,6 @@ class DBTicketService(TicketServiceInterface):
         ticket_campaign_ticket_type = ticket_model.TicketCampaignTicketType.model_validate(tctt)
         self.session.add(ticket_campaign_ticket_type)
         await self.session.commit()
-        await self.session.refresh(ticket_campaign_ticket_type)
         return ticket_campaign_ticket_type
 
     async def update_ticket_campaign_ticket_type(self, tctt_id: int, tctt: ticket_schema.TicketCampaignTicketTypeUpdate) -> Optional[ticket_schema.TicketCampaignTicketType]:
@@ -259,7 +288,6 @@ class DBTicketService(TicketServiceInterface):
             setattr(ticket_campaign_ticket_type, key, value)
         self.session.add(ticket_campaign_ticket_type)
         await self.session.commit()
-        await self.session.refresh(ticket_campaign_ticket_type)
         return ticket_campaign_ticket_type
 
     async def delete_ticket_campaign_ticket_type(self, tctt_id: int) -> None:
@@ -297,7 +325,6 @@ class DBTicketService(TicketServiceInterface):
         ticket_campaign = ticket_model.TicketCampaign.model_validate(campaign)
         self.session.add(ticket_campaign)
         await self.session.commit()
-        await self.session.refresh(ticket_campaign)
         return ticket_campaign
 
 
@@ -317,7 +344,6 @@ class DBTicketService(TicketServiceInterface):
             setattr(ticket_campaign, key, value)
         self.session.add(ticket_campaign)
         await self.session.commit()
-        await self.session.refresh(ticket_campaign)
         return ticket_campaign
 
 
@@ -325,39 +351,49 @@ class DBTicketService(TicketServiceInterface):
         # Validate campaign_id is an integer
         if not isinstance(campaign_id, int):
             raise HTTPException(status_code=400, detail="Campaign ID must be an integer")
-        ticket_campaign = await self.get_ticket_campaign(campaign_id)
-        if not ticket_campaign:
-            raise HTTPException(status_code=404, detail="Campaign not found")
-        if ticket_campaign.limit is not None and ticket_campaign.registered >= ticket_campaign.limit:
-            raise HTTPException(status_code=400, detail="Campaign registration limit exceeded")
 
-        # Update the ticket campaign's registered count
-        if ticket_campaign.registered is None:
-            ticket_campaign.registered = 0
-        ticket_campaign.registered = ticket_campaign.registered + 1
-        self.session.add(ticket_campaign)
-        await self.session.commit()
-        await self.session.refresh(ticket_campaign)
+        # Reserve a registration slot atomically so concurrent registrations can't exceed the limit
+        result = await self.session.exec(
+            update(ticket_model.TicketCampaign)
+            .where(
+                ticket_model.TicketCampaign.id == campaign_id,
+                ticket_model.TicketCampaign.registered < ticket_model.TicketCampaign.limit,
+            )
+            .values(registered=ticket_model.TicketCampaign.registered + 1)
+            .execution_options(synchronize_session=False)
+        )
+        if result.rowcount == 0:
+            if not await self.get_ticket_campaign(campaign_id):
+                raise HTTPException(status_code=404, detail="Campaign not found")
+            raise HTTPException(status_code=400, detail="Campaign registration limit exceeded")
 
-        # Get TicketCampaignTicketTypes queryset
-        ticket_campaign_ticket_types = await self.session.exec(
-            select(ticket_model.TicketCampaignTicketType).where(ticket_model.TicketCampaignTicketType.campaign_id == campaign_id)
+        # Issue one ticket per campaign ticket type with a single multi-row insert
+        result = await self.session.exec(
+            select(
+                ticket_model.TicketCampaignTicketType.ticket_type_id,
+                ticket_model.TicketCampaignTicketType.amount,
+                ticket_model.TicketCampaignTicketType.expiration_date,
+            ).where(ticket_model.TicketCampaignTicketType.campaign_id == campaign_id)
         )
-        ticket_types: List[ticket_schema.TicketCampaignTicketType] = ticket_campaign_ticket_types.scalars().all()
-
-        # Create Ticket
-        for ticket_detail in ticket_types:
-            ticket = ticket_schema.TicketCreate(
-                campaign_id=ticket_campaign.id,
-                ticket_type_id=ticket_detail.ticket_type_id,
-                user_id=1,
-                amount=ticket_detail.amount,
-                used=0,
-                expires_at=ticket_detail.expiration_date,
-                created_at=datetime.now(),
-                updated_at=datetime.now()
-            )
-            await self.create_ticket(ticket)
+        now = datetime.now()
+        tickets = [
+            {
+                "campaign_id": campaign_id,
+                "ticket_type_id": ticket_type_id,
+                "user_id": 1,
+                "amount": amount,
+                "used": 0,
+                "expires_at": expiration_date,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for ticket_type_id, amount, expiration_date in result
+        ]
+        if tickets:
+            await self.session.exec(insert(ticket_model.Ticket), params=tickets)
+
+        # The slot reservation and the tickets are committed together
+        await self.session.commit()
         return True
 
     async def update_ticket_campaign_is_active(self, campaign_id: int) -> Optional[ticket_schema.TicketCampaign]:
@@ -370,7 +406,6 @@ class DBTicketService(TicketServiceInterface):
         ticket_campaign.is_active = not ticket_campaign.is_active
         self.session.add(ticket_campaign)
         await self.session.commit()
-        await self.session.refresh(ticket_campaign)
         return ticket_campaign
 
 
@@ -1,8 +1,8 @@
 import datetime
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from .TicketServiceInterface import TicketServiceInterface
-from travelothai.schemas import ticket_schema
+from travelothai.schemas import bulk_schema, ticket_schema
 
 # Mock data for TicketType, TicketUsageRule, Ticket, TicketCampaign, and TicketCampaignTicketType
 mock_ticket_types: List[ticket_schema.TicketType] = [
@@ -35,6 +35,9 @@ class MockTicketService(TicketServiceInterface):
     async def list_ticket_types(self) -> List[ticket_schema.TicketType]:
         return mock_ticket_types
 
+    async def get_ticket_types_version(self) -> Tuple[int, Optional[datetime.datetime]]:
+        return len(mock_ticket_types), max((ticket_type.updated_at for ticket_type in mock_ticket_types), default=None)
+
     async def get_ticket_type(self, type_id: int) -> Optional[ticket_schema.TicketType]:
         for ticket_type in mock_ticket_types:
             if ticket_type.id == type_id:
@@ -134,6 +137,10 @@ class MockTicketService(TicketServiceInterface):
         mock_ticket_id += 1
         return new_ticket
 
+    async def create_tickets_bulk(self, tickets: List[ticket_schema.TicketCreate]) -> bulk_schema.BulkCreateResult:
+        ids = [(await self.create_ticket(ticket)).id for ticket in tickets]
+        return bulk_schema.BulkCreateResult.from_rows(len(tickets), {}, ids)
+
     async def update_ticket(self, ticket_id: int, ticket: ticket_schema.TicketUpdate) -> Optional[ticket_schema.Ticket]:
         for idx, existing_ticket in enumerate(mock_tickets):
             if existing_ticket.id == ticket_id:
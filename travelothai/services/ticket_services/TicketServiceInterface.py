@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime
+from typing import List, Optional, Tuple
 
-from travelothai.schemas import ticket_schema
+from travelothai.schemas import bulk_schema, ticket_schema
 
 
 class TicketServiceInterface(ABC):
@@ -11,6 +12,11 @@ class TicketServiceInterface(ABC):
         """List all ticket types."""
         pass
 
+    @abstractmethod
+    async def get_ticket_types_version(self) -> Tuple[int, Optional[datetime]]:
+        """Return the number of ticket types and their latest `updated_at`."""
+        pass
+
     @abstractmethod
     async def get_ticket_type(self, type_id: int) -> Optional[ticket_schema.TicketType]:
         """Get a specific ticket type by ID."""
@@ -75,6 +81,11 @@ class TicketServiceInterface(ABC):
         """Create a new ticket."""
         pass
 
+    @abstractmethod
+    async def create_tickets_bulk(self, tickets: List[ticket_schema.TicketCreate]) -> bulk_schema.BulkCreateResult:
+        """Create many tickets at once, reporting the outcome of each row."""
+        pass
+
     @abstractmethod
     async def update_ticket(self, ticket_id: int, ticket: ticket_schema.TicketUpdate) -> Optional[ticket_schema.Ticket]:
         """Update an existing ticket."""